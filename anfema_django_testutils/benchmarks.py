@@ -0,0 +1,186 @@
+"""This module provides the measuring of benchmarks and their comparison to baselines."""
+from __future__ import annotations
+
+
+__all__ = ('BenchmarkBaselines', 'BenchmarkResult', 'measure', 'regression_p_value')
+
+import json
+import math
+import pathlib
+import statistics
+import time
+from typing import TYPE_CHECKING, NamedTuple
+
+
+if TYPE_CHECKING:
+    from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+
+def measure(
+    func: Callable[[], object], *, rounds: int, warmup_rounds: int, min_round_time: float
+) -> Tuple[int, List[float]]:
+    """Measures the duration of a callable.
+
+    The number of iterations per round is calibrated, so that a round takes at least *min_round_time*,
+    which keeps the resolution of the clock negligible. The calibration rounds and the warmup rounds aren't
+    measured.
+
+    :param func: The callable to measure.
+    :param int rounds: The number of measured rounds.
+    :param int warmup_rounds: The number of rounds to run before measuring, e.g. to fill caches.
+    :param float min_round_time: The minimum duration of a round in seconds.
+    :returns: The number of iterations per round, and the duration of a single iteration of each round.
+    """
+
+    def run_round(iterations: int) -> float:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        return time.perf_counter() - start
+
+    iterations = 1
+    while (duration := run_round(iterations)) < min_round_time:
+        # Extrapolate the required iterations, but at least double them for too short durations.
+        iterations = max(iterations * 2, math.ceil(iterations * min_round_time / duration) if duration else 0)
+    for _ in range(warmup_rounds):
+        run_round(iterations)
+    return iterations, [run_round(iterations) / iterations for _ in range(rounds)]
+
+
+def regression_p_value(baseline: Sequence[float], timings: Sequence[float]) -> float:
+    """Returns the one-sided p-value of the Mann-Whitney U test, whether the timings are slower than the
+    baseline.
+
+    The test compares the ranks rather than the values of the timings, so that outliers (e.g. caused by
+    garbage collection or other processes) don't distort the result. The p-value is approximated by the
+    normal distribution, which is sufficiently accurate for samples of about 10 timings and more.
+    """
+    samples = sorted([(timing, False) for timing in baseline] + [(timing, True) for timing in timings])
+    rank_sum = 0.0
+    start = 0
+    while start < len(samples):
+        # Tied timings get the average of their ranks.
+        end = start
+        while end + 1 < len(samples) and samples[end + 1][0] == samples[start][0]:
+            end += 1
+        rank = (start + end) / 2 + 1
+        rank_sum += rank * sum(is_timing for _, is_timing in samples[start:end] + [samples[end]])
+        start = end + 1
+
+    baseline_size, timings_size = len(baseline), len(timings)
+    u = rank_sum - timings_size * (timings_size + 1) / 2
+    sigma = math.sqrt(baseline_size * timings_size * (baseline_size + timings_size + 1) / 12)
+    if not sigma:
+        return 1.0
+    z = (u - baseline_size * timings_size / 2 - 0.5) / sigma
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+class BenchmarkResult(NamedTuple):
+    """The result of a benchmark, whereby all durations are the durations of a single iteration in seconds."""
+
+    #: The number of iterations per round.
+    iterations: int
+    #: The duration of each round.
+    timings: Tuple[float, ...]
+    #: The timings of the baseline, if any.
+    baseline: Tuple[float, ...] = ()
+    #: The p-value of the regression test, if there is a baseline.
+    p_value: Optional[float] = None
+    #: Whether the benchmark got significantly slower than its baseline.
+    regression: bool = False
+    #: Whether the timings vary too much to be reliable.
+    noisy: bool = False
+
+    @classmethod
+    def evaluate(
+        cls,
+        iterations: int,
+        timings: Sequence[float],
+        baseline: Sequence[float] = (),
+        *,
+        max_noise: float,
+        regression_threshold: float,
+        significance: float,
+    ) -> BenchmarkResult:
+        """Compares the timings of a benchmark to its baseline.
+
+        :param int iterations: The number of iterations per round.
+        :param timings: The duration of each round.
+        :param baseline: The timings of the baseline, if any.
+        :param float max_noise: The maximum coefficient of variation (standard deviation divided by median)
+          of reliable timings.
+        :param float regression_threshold: The minimum relative slowdown of the fastest timing to be a
+          regression. The fastest timing is less affected by the environment than the median, as it only
+          gets slower if the code under test got slower.
+        :param float significance: The maximum p-value of a regression.
+        """
+        result = cls(iterations, tuple(timings), tuple(baseline))
+        p_value = regression_p_value(baseline, timings) if baseline else None
+        return result._replace(
+            p_value=p_value,
+            regression=(
+                p_value is not None
+                and p_value < significance  # noqa: W503
+                and result.change > regression_threshold  # noqa: W503
+            ),
+            noisy=result.stddev > result.median * max_noise,
+        )
+
+    @property
+    def min(self) -> float:
+        return min(self.timings)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.timings)
+
+    @property
+    def stddev(self) -> float:
+        return statistics.stdev(self.timings) if len(self.timings) > 1 else 0.0
+
+    @property
+    def baseline_min(self) -> Optional[float]:
+        return min(self.baseline) if self.baseline else None
+
+    @property
+    def change(self) -> Optional[float]:
+        """The relative change of the fastest timing compared to the baseline's fastest timing."""
+        if not self.baseline_min:
+            return None
+        return self.min / self.baseline_min - 1
+
+
+class BenchmarkBaselines:
+    """Stores the timings of the benchmarks as baselines for subsequent test runs within a JSON file.
+
+    The baseline of a benchmark is replaced by its latest timings, unless they regressed, or they are noisy
+    while there already is a baseline. So a regression keeps failing until it has been fixed, whereas
+    improvements become the new baseline.
+
+    :param str path: Path to the JSON file.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = pathlib.Path(path)
+        self._baselines = None
+
+    @property
+    def baselines(self) -> Dict[str, List[float]]:
+        """The timings of the baselines by the benchmarks' test ids, which are loaded on first access."""
+        if self._baselines is None:
+            self._baselines = json.loads(self.path.read_text()) if self.path.exists() else {}
+        return self._baselines
+
+    def get(self, test_id: str) -> Tuple[float, ...]:
+        """Returns the timings of the baseline of a benchmark, respectively an empty tuple if there is none."""
+        return tuple(self.baselines.get(test_id, ()))
+
+    def update(self, results: Dict[str, BenchmarkResult]) -> None:
+        """Updates the baselines with the results of the benchmarks by their test ids, and saves them."""
+        for test_id, result in results.items():
+            if result.regression or (result.noisy and test_id in self.baselines):
+                continue
+            self.baselines[test_id] = list(result.timings)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.baselines, indent=1, sort_keys=True))
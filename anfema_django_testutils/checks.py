@@ -68,6 +68,54 @@ def check_config(app_configs, **kwargs):
             ),
         )
 
+    if not isinstance(config["COVERAGE_CONTEXTS_ENABLED"], bool):
+        errors.append(
+            Error(
+                "The COVERAGE_CONTEXTS_ENABLED setting must be a boolean.",
+                id=f"{app_label}.E001",
+                obj="Improper Configuration",
+            ),
+        )
+
+    if config["COVERAGE_CORE"] not in (None, "sysmon", "ctrace", "pytrace"):
+        errors.append(
+            Error(
+                "The COVERAGE_CORE setting must be either None, 'sysmon', 'ctrace' or 'pytrace'.",
+                id=f"{app_label}.E001",
+                obj="Improper Configuration",
+            ),
+        )
+
+    if config["COVERAGE_BRANCH"] is not None and not isinstance(config["COVERAGE_BRANCH"], bool):
+        errors.append(
+            Error(
+                "The COVERAGE_BRANCH setting must be either None or a boolean.",
+                id=f"{app_label}.E001",
+                obj="Improper Configuration",
+            ),
+        )
+
+    if (coverage_source := config["COVERAGE_SOURCE"]) is not None and (
+        not isinstance(coverage_source, (list, tuple)) or not all(isinstance(path, str) for path in coverage_source)
+    ):
+        errors.append(
+            Error(
+                "The COVERAGE_SOURCE setting must be either None or a list of strings.",
+                id=f"{app_label}.E001",
+                obj="Improper Configuration",
+            ),
+        )
+
+    coverage_report_formats = config["COVERAGE_REPORT_FORMATS"]
+    if not isinstance(coverage_report_formats, (list, tuple)) or set(coverage_report_formats) - {"html", "xml", "json"}:
+        errors.append(
+            Error(
+                "The COVERAGE_REPORT_FORMATS setting must be a list of 'html', 'xml' and 'json'.",
+                id=f"{app_label}.E001",
+                obj="Improper Configuration",
+            ),
+        )
+
     if not isinstance(config["HTML_RESULTS_ENABLED"], bool):
         errors.append(
             Error(
@@ -77,6 +125,108 @@ def check_config(app_configs, **kwargs):
             ),
         )
 
+    if config["HTML_RESULTS_MODE"] not in ("inline", "lazy"):
+        errors.append(
+            Error(
+                "The HTML_RESULTS_MODE setting must be either 'inline' or 'lazy'.",
+                id=f"{app_label}.E001",
+                obj="Improper Configuration",
+            ),
+        )
+
+    if not isinstance(config["JSONL_RESULTS_ENABLED"], bool):
+        errors.append(
+            Error(
+                "The JSONL_RESULTS_ENABLED setting must be a boolean.",
+                id=f"{app_label}.E001",
+                obj="Improper Configuration",
+            ),
+        )
+
+    if not isinstance(config["JUNIT_XML_RESULTS_ENABLED"], bool):
+        errors.append(
+            Error(
+                "The JUNIT_XML_RESULTS_ENABLED setting must be a boolean.",
+                id=f"{app_label}.E001",
+                obj="Improper Configuration",
+            ),
+        )
+
+    if not isinstance(config["DURATION_HISTORY_ENABLED"], bool):
+        errors.append(
+            Error(
+                "The DURATION_HISTORY_ENABLED setting must be a boolean.",
+                id=f"{app_label}.E001",
+                obj="Improper Configuration",
+            ),
+        )
+
+    rerun_failures = config["RERUN_FAILURES"]
+    if not isinstance(rerun_failures, int) or isinstance(rerun_failures, bool) or rerun_failures < 0:
+        errors.append(
+            Error(
+                "The RERUN_FAILURES setting must be a non-negative integer.",
+                id=f"{app_label}.E001",
+                obj="Improper Configuration",
+            ),
+        )
+
+    if not isinstance(config["QUERY_STATS_ENABLED"], bool):
+        errors.append(
+            Error(
+                "The QUERY_STATS_ENABLED setting must be a boolean.",
+                id=f"{app_label}.E001",
+                obj="Improper Configuration",
+            ),
+        )
+
+    threshold = config["QUERY_REPEAT_THRESHOLD"]
+    if not isinstance(threshold, int) or isinstance(threshold, bool) or threshold < 1:
+        errors.append(
+            Error(
+                "The QUERY_REPEAT_THRESHOLD setting must be a positive integer.",
+                id=f"{app_label}.E001",
+                obj="Improper Configuration",
+            ),
+        )
+
+    if not isinstance(config["MEMORY_TRACKING_ENABLED"], bool):
+        errors.append(
+            Error(
+                "The MEMORY_TRACKING_ENABLED setting must be a boolean.",
+                id=f"{app_label}.E001",
+                obj="Improper Configuration",
+            ),
+        )
+
+    leak_threshold = config["MEMORY_LEAK_THRESHOLD"]
+    if not isinstance(leak_threshold, int) or isinstance(leak_threshold, bool) or leak_threshold < 0:
+        errors.append(
+            Error(
+                "The MEMORY_LEAK_THRESHOLD setting must be a non-negative integer.",
+                id=f"{app_label}.E001",
+                obj="Improper Configuration",
+            ),
+        )
+
+    if not isinstance(config["TRACEBACK_COMPRESSION_ENABLED"], bool):
+        errors.append(
+            Error(
+                "The TRACEBACK_COMPRESSION_ENABLED setting must be a boolean.",
+                id=f"{app_label}.E001",
+                obj="Improper Configuration",
+            ),
+        )
+
+    if not isinstance(config["DATABASE_TEMPLATES_ENABLED"], bool):
+        errors.append(
+            Error(
+                "The DATABASE_TEMPLATES_ENABLED setting must be a boolean.",
+                id=f"{app_label}.E001",
+                obj="Improper Configuration",
+            ),
+        )
+
     if not isinstance(config["TEST_REPORT_TITLE"], str):
         errors.append(
             Error(
@@ -12,9 +12,30 @@ Settings
 
 ``FIXTURE_MEDIAFILE_DIRS``
 
+``FIXTURE_CACHE_ENABLED``
+    If set to ``True``, the parsed content of JSON and YAML fixture files is cached by the :code:`loaddata`
+    command, and thus when loading the ``fixtures`` of testcases. See
+    :class:`~anfema_django_testutils.contrib.fixtures.cache.FixtureCache`. Defaults to ``False``.
+
+``FIXTURE_CACHE_DIR``
+    A directory to additionally store the parsed content of the fixture files and the finder indexes in, so
+    that parallel test workers and later test runs don't need to parse the fixture files or to build the
+    finder indexes again. Defaults to ``None``.
+
+``FIXTURE_BULK_LOAD_ENABLED``
+    If set to ``True``, the :code:`loaddata` command, and thus the loading of the ``fixtures`` of testcases,
+    inserts the objects grouped by model using ``bulk_create``, rather than saving each object on its own. See
+    :class:`~anfema_django_testutils.contrib.fixtures.loader.BulkLoader`. Defaults to ``False``.
+
+``FIXTURE_FINDER_INDEX_ENABLED``
+    If set to ``True``, fixture and fixture media files are looked up in an index of the files found by the
+    ``FIXTURE_FINDERS`` respectively the ``FIXTURE_MEDIAFILE_FINDERS``, rather than in each of their locations.
+    Files added while the process is running are only found once the index has been rebuilt. See
+    :class:`~anfema_django_testutils.contrib.fixtures.finders.base.FinderIndex`. Defaults to ``False``.
+
 Management Commands
 ===================
-:mod:`anfema_django_testutils.contrib.fixtures` exposes three management commands.
+:mod:`anfema_django_testutils.contrib.fixtures` exposes four management commands.
 
 findfixture
 -----------
@@ -33,4 +54,11 @@ collectfixturemedia
 *django-admin collectfixturemedia*
 
 Collect fixture media files in a single location.
+
+loaddata
+--------
+*django-admin loaddata [--bulk | --no-bulk] FIXTURE [FIXTURE ...]*
+
+Extends Django's :code:`loaddata` command with the fixture cache, if ``FIXTURE_CACHE_ENABLED`` is set, and with
+the bulk loader, if ``FIXTURE_BULK_LOAD_ENABLED`` is set or the ``--bulk`` option is given.
 """
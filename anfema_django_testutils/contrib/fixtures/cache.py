@@ -0,0 +1,116 @@
+"""The fixture cache keeps the parsed content of fixture files, so that loading the same fixture for many testcases
+only deserializes the model instances, rather than parsing the fixture file each time."""
+from __future__ import annotations
+
+
+__all__ = ('FixtureCache', 'fixture_cache')
+
+import hashlib
+import json
+import os
+import pathlib
+import pickle
+from typing import TYPE_CHECKING
+
+from .settings import get_config
+
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def _parse_json(fixture) -> List[Dict[str, Any]]:
+    return json.load(fixture)
+
+
+def _parse_yaml(fixture) -> List[Dict[str, Any]]:
+    import yaml
+
+    # Use the same loader as Django's YAML deserializer.
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+    return yaml.load(fixture, Loader=SafeLoader)
+
+
+class FixtureCache:
+    """Caches the parsed content of fixture files in Python's serialization format (a list of dictionaries with
+    the ``model``, ``pk`` and ``fields`` of each object), as consumed by Django's Python deserializer.
+
+    The content is keyed by the absolute path of the fixture file, and invalidated once its modification time or
+    size has been changed. It is kept in-process, and additionally pickled into the ``FIXTURE_CACHE_DIR``, if
+    set, so that parallel test workers and later test runs don't need to parse the fixture files again.
+
+    Only JSON and YAML fixtures can be cached, as their content is parsed into Python's serialization format by
+    Django's deserializers as well.
+    """
+
+    #: The parsers of the serialization formats which can be cached.
+    parsers: Dict[str, Callable] = {'json': _parse_json, 'yaml': _parse_yaml}
+
+    def __init__(self) -> None:
+        self._cache: Dict[str, Tuple[Tuple[int, int], List[Dict[str, Any]]]] = {}
+
+    def is_cacheable(self, ser_fmt: str) -> bool:
+        """Tells whether fixtures of the given serialization format can be cached."""
+        return ser_fmt in self.parsers
+
+    def get(self, fixture_file: str, ser_fmt: str, open_method: Callable, mode: str) -> List[Dict[str, Any]]:
+        """Returns the parsed content of the fixture file, and parses it, if it hasn't been cached yet or has been
+        changed since.
+
+        :param str fixture_file: The path of the fixture file.
+        :param str ser_fmt: The serialization format of the fixture file, e.g. ``json``.
+        :param open_method: The method to open the (possibly compressed) fixture file with.
+        :param str mode: The mode to open the fixture file with.
+        """
+        path = os.path.abspath(fixture_file)
+        stat = os.stat(path)
+        key = (stat.st_mtime_ns, stat.st_size)
+
+        if (cached := self._cache.get(path)) is not None and cached[0] == key:
+            return cached[1]
+
+        cache_file = self._get_cache_file(path)
+        objects = self._read_cache_file(cache_file, key) if cache_file is not None else None
+        if objects is None:
+            with open_method(path, mode) as fixture:
+                objects = self.parsers[ser_fmt](fixture) or []
+            if cache_file is not None:
+                self._write_cache_file(cache_file, key, objects)
+
+        self._cache[path] = (key, objects)
+        return objects
+
+    def clear(self) -> None:
+        """Clears the in-process cache."""
+        self._cache.clear()
+
+    @staticmethod
+    def _get_cache_file(path: str) -> Optional[pathlib.Path]:
+        if cache_dir := get_config()["FIXTURE_CACHE_DIR"]:
+            return pathlib.Path(cache_dir, f'{hashlib.sha256(path.encode()).hexdigest()[:32]}.pickle')
+        return None
+
+    @staticmethod
+    def _read_cache_file(cache_file: pathlib.Path, key: Tuple[int, int]) -> Optional[List[Dict[str, Any]]]:
+        try:
+            with cache_file.open('rb') as file:
+                cached_key, objects = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+            return None
+        return objects if tuple(cached_key) == key else None
+
+    @staticmethod
+    def _write_cache_file(cache_file: pathlib.Path, key: Tuple[int, int], objects: List[Dict[str, Any]]) -> None:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, so that parallel test workers never read a partially written file.
+        temp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+        with temp_file.open('wb') as file:
+            pickle.dump((key, objects), file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_file, cache_file)
+
+
+#: The fixture cache of the process.
+fixture_cache = FixtureCache()
@@ -83,4 +83,40 @@ def check_config(app_configs=None, **kwargs):
                 ),
             )
 
+    if not isinstance(config["FIXTURE_CACHE_ENABLED"], bool):
+        errors.append(
+            Error(
+                "The FIXTURE_CACHE_ENABLED setting must be a boolean.",
+                id=f"{app_label}.E001",
+                obj="Improper Configuration",
+            ),
+        )
+
+    if config["FIXTURE_CACHE_DIR"] is not None and not isinstance(config["FIXTURE_CACHE_DIR"], (str, Path)):
+        errors.append(
+            Error(
+                "The FIXTURE_CACHE_DIR setting must be a string or None.",
+                id=f"{app_label}.E001",
+                obj="Improper Configuration",
+            ),
+        )
+
+    if not isinstance(config["FIXTURE_BULK_LOAD_ENABLED"], bool):
+        errors.append(
+            Error(
+                "The FIXTURE_BULK_LOAD_ENABLED setting must be a boolean.",
+                id=f"{app_label}.E001",
+                obj="Improper Configuration",
+            ),
+        )
+
+    if not isinstance(config["FIXTURE_FINDER_INDEX_ENABLED"], bool):
+        errors.append(
+            Error(
+                "The FIXTURE_FINDER_INDEX_ENABLED setting must be a boolean.",
+                id=f"{app_label}.E001",
+                obj="Improper Configuration",
+            ),
+        )
+
     return errors
@@ -1,4 +1,8 @@
-from typing import Generator, Union
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Generator, Optional, Union
 
 from django.contrib.staticfiles.finders import (
     AppDirectoriesFinder,
@@ -7,6 +11,10 @@ from django.contrib.staticfiles.finders import (
     FileSystemStorage,
     get_finder,
 )
+from django.dispatch import receiver
+from django.test.signals import setting_changed
+
+from ..settings import CONFIG_DEFAULTS, get_config
 
 
 def find_file(finders, path: str, all: bool = False) -> Union[str, list[str], None]:
@@ -17,6 +25,12 @@ def find_file(finders, path: str, all: bool = False) -> Union[str, list[str], No
     :return: If ``all`` is ``False`` (default), return the first matching absolute path (or ``None``
              if no match). Otherwise return a list.
     """
+    if get_config()["FIXTURE_FINDER_INDEX_ENABLED"]:
+        return get_finder_index(finders).find(path, all=all)
+    return _find_file(finders, path, all)
+
+
+def _find_file(finders, path: str, all: bool = False) -> Union[str, list[str], None]:
     matches = []
     for finder in get_finders(finders):
         result = finder.find(path, all=all)
@@ -31,6 +45,150 @@ def get_finders(finders: list[str]) -> Generator[BaseFinder, None, None]:
     yield from map(get_finder, finders)
 
 
+class FinderIndex:
+    """An index of the files found by the given finders, which maps the path of each file to the absolute paths
+    of its matches, so that finding a file doesn't need to look it up in each location of each finder.
+
+    The index is built once by walking the locations of the finders, so that both finding a file and not finding
+    it are dict lookups. It is rebuilt if a file found in the index doesn't exist anymore and the modification
+    time of any of the directories has been changed. Files added after the index has been built are found once
+    it has been rebuilt, e.g. by :meth:`build` or by a later process. If the ``FIXTURE_CACHE_DIR`` setting is
+    set, the index is additionally stored there, so that later processes only need to check the modification
+    times of the directories rather than walking them.
+
+    :param list finders: The full Python paths of the finder classes.
+    """
+
+    def __init__(self, finders: list[str]) -> None:
+        self.finders = list(finders)
+        self._paths: Optional[dict[str, list[str]]] = None
+        self._dirs: dict[str, list[str]] = {}
+        self._dir_mtimes: dict[str, int] = {}
+        self._locations: tuple[tuple[str, str], ...] = ()
+
+    def find(self, path: str, all: bool = False) -> Union[str, list[str], None]:
+        """Find a file with the given path using the index.
+
+        :param str path: Path to search for.
+        :param bool all: Defines whether to return only the first match or search for all matches.
+        :return: If ``all`` is ``False`` (default), return the first matching absolute path (or ``None``
+                 if no match). Otherwise return a list.
+        """
+        if self._paths is None and not self._load():
+            self.build()
+        name = os.path.normpath(path)
+        matches = self._lookup(name)
+        if matches is None:
+            return [] if all else None
+        if not self._exist(matches, find_all=all):
+            # The file has been removed or renamed since the index has been built.
+            if not self.is_valid():
+                self.build()
+                return self.find(path, all=all)
+            return _find_file(self.finders, path, all)
+        return list(matches) if all else matches[0]
+
+    def _lookup(self, name: str) -> Optional[list[str]]:
+        """Returns the indexed files, respectively directories, with the given path."""
+        return self._paths.get(name) or self._dirs.get(name)
+
+    @staticmethod
+    def _exist(matches: Optional[list[str]], find_all: bool) -> bool:
+        """Tells whether the matches to be returned from the index still exist."""
+        if matches is None:
+            return False
+        return all(os.path.exists(match) for match in (matches if find_all else matches[:1]))
+
+    def build(self) -> None:
+        """Builds the index by walking the locations of the finders."""
+        paths = {}
+        dirs = {}
+        dir_mtimes = {}
+        locations = self._get_locations()
+        for prefix, root in locations:
+            if not os.path.isdir(root):
+                continue
+            for dir_path, dir_names, file_names in os.walk(root):
+                dir_names.sort()
+                dir_mtimes[dir_path] = os.stat(dir_path).st_mtime_ns
+                if dir_path != root:
+                    dirs.setdefault(os.path.join(prefix, os.path.relpath(dir_path, root)), []).append(dir_path)
+                for file_name in sorted(file_names):
+                    file_path = os.path.join(dir_path, file_name)
+                    name = os.path.join(prefix, os.path.relpath(file_path, root))
+                    paths.setdefault(name, []).append(file_path)
+        self._paths = paths
+        self._dirs = dirs
+        self._dir_mtimes = dir_mtimes
+        self._locations = locations
+        self._save()
+
+    def is_valid(self) -> bool:
+        """Tells whether none of the indexed directories has been changed since the index has been built."""
+        try:
+            return all(os.stat(path).st_mtime_ns == mtime for path, mtime in self._dir_mtimes.items())
+        except OSError:
+            return False
+
+    def _get_locations(self) -> tuple[tuple[str, str], ...]:
+        """Returns the prefix and root of each storage of each finder, in the order they are searched."""
+        return tuple(
+            (getattr(storage, "prefix", None) or "", storage.location)
+            for finder in get_finders(self.finders)
+            for storage in finder.storages.values()
+        )
+
+    def _get_cache_file(self) -> Optional[Path]:
+        if cache_dir := get_config()["FIXTURE_CACHE_DIR"]:
+            key = hashlib.sha256(repr(self.finders).encode()).hexdigest()[:32]
+            return Path(cache_dir, f"finder-index-{key}.pickle")
+        return None
+
+    def _load(self) -> bool:
+        if (cache_file := self._get_cache_file()) is None:
+            return False
+        try:
+            with cache_file.open("rb") as file:
+                self._paths, self._dirs, self._dir_mtimes, self._locations = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+            self._paths, self._dirs, self._dir_mtimes, self._locations = None, {}, {}, ()
+            return False
+        # The locations of the finders depend on settings such as INSTALLED_APPS and FIXTURE_DIRS.
+        return self._locations == self._get_locations() and self.is_valid()
+
+    def _save(self) -> None:
+        if (cache_file := self._get_cache_file()) is None:
+            return
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, so that parallel test workers never read a partially written file.
+        temp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with temp_file.open("wb") as file:
+            data = (self._paths, self._dirs, self._dir_mtimes, self._locations)
+            pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_file, cache_file)
+
+
+_finder_indexes: dict[tuple[str, ...], FinderIndex] = {}
+
+
+def get_finder_index(finders: list[str]) -> FinderIndex:
+    """Returns the index of the files found by the given finders.
+
+    :param list finders: The full Python paths of the finder classes.
+    """
+    key = tuple(finders)
+    if key not in _finder_indexes:
+        _finder_indexes[key] = FinderIndex(finders)
+    return _finder_indexes[key]
+
+
+@receiver(setting_changed)
+def clear_finder_indexes(*, setting, **kwargs) -> None:
+    """Drop the finder indexes when overriding settings."""
+    if setting in CONFIG_DEFAULTS:
+        _finder_indexes.clear()
+
+
 class BaseFileSystemFinder(FileSystemFinder):
     search_dirs: list[str]
 
@@ -7,7 +7,7 @@ from django.contrib.staticfiles.utils import matches_patterns
 from django.core.files.storage import FileSystemStorage
 
 from ..settings import get_config
-from .base import BaseAppDirectoriesFinder, BaseFileSystemFinder
+from .base import BaseAppDirectoriesFinder, BaseFileSystemFinder, find_file
 
 
 searched_locations = django.contrib.staticfiles.finders.searched_locations
@@ -59,16 +59,7 @@ def find(path: str, all: bool = False) -> Union[str, list[str], None]:
              if no match). Otherwise return a list.
     """
     searched_locations[:] = []
-    matches = []
-    for finder in get_finders():
-        result = finder.find(path, all=all)
-
-        if not all and result:
-            return result
-        if not isinstance(result, (list, tuple)):
-            result = [result]
-        matches.extend(result)
-    return matches or ([] if all else None)
+    return find_file(get_config()["FIXTURE_FINDERS"], path, all)
 
 
 def get_finders() -> Generator[BaseFinder, None, None]:
@@ -0,0 +1,108 @@
+"""The bulk loader inserts the deserialized objects of fixtures grouped by model using
+:meth:`~django.db.models.query.QuerySet.bulk_create`, rather than saving each object on its own."""
+from __future__ import annotations
+
+
+__all__ = ('BulkLoader',)
+
+from typing import TYPE_CHECKING
+
+from django.db import DatabaseError, IntegrityError, connections
+from django.db.models.signals import m2m_changed, post_save, pre_save
+
+
+if TYPE_CHECKING:
+    from typing import Any, Dict, Iterator, List, Sequence, Type
+
+    from django.core.serializers.base import DeserializedObject
+    from django.db.models import Model
+
+
+def _chunks(values: Sequence[Any], size: int) -> Iterator[Sequence[Any]]:
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+class BulkLoader:
+    """Collects the deserialized objects of fixtures grouped by model, and inserts them using
+    :meth:`~django.db.models.query.QuerySet.bulk_create` once flushed.
+
+    :meth:`~django.db.models.query.QuerySet.bulk_create` neither sends the ``pre_save`` and ``post_save`` signals,
+    nor supports multi-table inheritance, nor keeps the values of ``auto_now`` and ``auto_now_add`` fields as
+    given by the fixture. Objects of such models are rejected by :meth:`add`, and must be saved on their own. The
+    same applies to objects without primary key, as their primary key is required to insert their many-to-many
+    relations. Objects which already exist in the database are updated by saving them on their own as well.
+
+    :param str using: The alias of the database to load the objects into.
+    """
+
+    def __init__(self, using: str) -> None:
+        self.using = using
+        self._objects: Dict[Type[Model], Dict[Any, DeserializedObject]] = {}
+
+    @staticmethod
+    def is_bulk_loadable(model: Type[Model]) -> bool:
+        """Tells whether objects of the model can be inserted by
+        :meth:`~django.db.models.query.QuerySet.bulk_create`, without changing how they are loaded."""
+        opts = model._meta
+        if any(parent._meta.concrete_model is not opts.concrete_model for parent in opts.get_parent_list()):
+            return False
+        if any(getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False) for field in opts.fields):
+            return False
+        if pre_save.has_listeners(model) or post_save.has_listeners(model):
+            return False
+        return not any(m2m_changed.has_listeners(field.remote_field.through) for field in opts.many_to_many)
+
+    def add(self, obj: DeserializedObject) -> bool:
+        """Collects the deserialized object for bulk insertion, and tells whether it has been collected.
+
+        :param obj: The deserialized object.
+        """
+        model = type(obj.object)
+        if obj.object.pk is None or not self.is_bulk_loadable(model):
+            return False
+        self._objects.setdefault(model, {})[obj.object.pk] = obj
+        return True
+
+    def flush(self) -> None:
+        """Inserts the collected objects and their many-to-many relations, and saves the objects which already
+        exist in the database on their own."""
+        objects, self._objects = self._objects, {}
+        for model, objs in objects.items():
+            try:
+                self._load_objects(model, objs)
+            # psycopg raises ValueError if data contains NUL chars.
+            except (DatabaseError, IntegrityError, ValueError) as e:
+                e.args = (f"Could not load {model._meta.label} objects: {e}",)
+                raise
+
+    def _load_objects(self, model: Type[Model], objs: Dict[Any, DeserializedObject]) -> None:
+        manager = model._base_manager.db_manager(self.using)
+        pks = list(objs)
+        existing_pks = set()
+        for chunk in _chunks(pks, connections[self.using].ops.bulk_batch_size(['pk'], pks) or len(pks)):
+            existing_pks.update(manager.filter(pk__in=chunk).values_list('pk', flat=True))
+
+        new_objs: List[DeserializedObject] = []
+        for pk, obj in objs.items():
+            if pk in existing_pks:
+                obj.save(using=self.using)
+            else:
+                new_objs.append(obj)
+        if not new_objs:
+            return
+
+        manager.bulk_create([obj.object for obj in new_objs])
+        for field in model._meta.many_to_many:
+            through = field.remote_field.through
+            source_attname = through._meta.get_field(field.m2m_field_name()).attname
+            target_attname = through._meta.get_field(field.m2m_reverse_field_name()).attname
+            through_objs = [
+                through(**{source_attname: obj.object.pk, target_attname: value})
+                for obj in new_objs
+                if obj.m2m_data and field.name in obj.m2m_data
+                for value in dict.fromkeys(obj.m2m_data[field.name])
+            ]
+            through._base_manager.db_manager(self.using).bulk_create(through_objs)
+        for obj in new_objs:
+            obj.m2m_data = None
@@ -0,0 +1,110 @@
+import os
+import warnings
+from argparse import BooleanOptionalAction
+
+from django.core import serializers
+from django.core.management.base import CommandError
+from django.core.management.commands import loaddata
+from django.core.serializers.python import Deserializer as PythonDeserializer
+from django.db import DatabaseError, IntegrityError, router
+
+from anfema_django_testutils.contrib.fixtures.cache import fixture_cache
+from anfema_django_testutils.contrib.fixtures.loader import BulkLoader
+from anfema_django_testutils.contrib.fixtures.settings import get_config
+
+
+class Command(loaddata.Command):
+    """Extends Django's :code:`loaddata` command (and thus the loading of the ``fixtures`` of testcases) with
+    the :class:`~anfema_django_testutils.contrib.fixtures.cache.FixtureCache`, if the ``FIXTURE_CACHE_ENABLED``
+    setting is set, and with the :class:`~anfema_django_testutils.contrib.fixtures.loader.BulkLoader`, if the
+    ``FIXTURE_BULK_LOAD_ENABLED`` setting is set or the ``--bulk`` option is given."""
+
+    bulk_loader = None
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--bulk",
+            action=BooleanOptionalAction,
+            default=None,
+            help="Inserts the objects grouped by model using bulk_create, rather than saving each object on its own. "
+            "Defaults to the FIXTURE_BULK_LOAD_ENABLED setting.",
+        )
+
+    def handle(self, *fixture_labels, **options):
+        bulk = options.get("bulk")
+        if bulk is None:
+            bulk = get_config()["FIXTURE_BULK_LOAD_ENABLED"]
+        self.bulk_loader = BulkLoader(options["database"]) if bulk else None
+        super().handle(*fixture_labels, **options)
+
+    def load_label(self, fixture_label):
+        """Load fixtures files for a given label."""
+        if not get_config()["FIXTURE_CACHE_ENABLED"] and self.bulk_loader is None:
+            return super().load_label(fixture_label)
+
+        show_progress = self.verbosity >= 3
+        for fixture_file, fixture_dir, fixture_name in self.find_fixtures(fixture_label):
+            _, ser_fmt, cmp_fmt = self.parse_name(os.path.basename(fixture_file))
+            open_method, mode = self.compression_formats[cmp_fmt]
+            self.fixture_count += 1
+            objects_in_fixture = 0
+            loaded_objects_in_fixture = 0
+            if self.verbosity >= 2:
+                self.stdout.write(
+                    f"Installing {ser_fmt} fixture '{fixture_name}' from {loaddata.humanize(fixture_dir)}."
+                )
+            try:
+                for obj in self.deserialize_fixture(fixture_file, ser_fmt, open_method, mode):
+                    objects_in_fixture += 1
+                    if self.save_obj(obj):
+                        loaded_objects_in_fixture += 1
+                        if show_progress:
+                            self.stdout.write(f"\rProcessed {loaded_objects_in_fixture} object(s).", ending="")
+                if self.bulk_loader is not None:
+                    self.bulk_loader.flush()
+            except Exception as e:
+                if not isinstance(e, CommandError):
+                    e.args = (f"Problem installing fixture '{fixture_file}': {e}",)
+                raise
+
+            if objects_in_fixture and show_progress:
+                self.stdout.write()  # Add a newline after progress indicator.
+            self.loaded_object_count += loaded_objects_in_fixture
+            self.fixture_object_count += objects_in_fixture
+            # Warn if the fixture we loaded contains 0 objects.
+            if objects_in_fixture == 0:
+                warnings.warn(
+                    f"No fixture data found for '{fixture_name}'. (File format may be invalid.)",
+                    RuntimeWarning,
+                )
+
+    def save_obj(self, obj):
+        """Save an object if permitted, or collect it for bulk insertion if bulk loading."""
+        model = type(obj.object)
+        if model._meta.app_config in self.excluded_apps or model in self.excluded_models:
+            return False
+        saved = False
+        if router.allow_migrate_model(self.using, model):
+            saved = True
+            self.models.add(model)
+            if self.bulk_loader is None or not self.bulk_loader.add(obj):
+                try:
+                    obj.save(using=self.using)
+                # psycopg raises ValueError if data contains NUL chars.
+                except (DatabaseError, IntegrityError, ValueError) as e:
+                    e.args = (f"Could not load {model._meta.label}(pk={obj.object.pk}): {e}",)
+                    raise
+        if obj.deferred_fields:
+            self.objs_with_deferred_fields.append(obj)
+        return saved
+
+    def deserialize_fixture(self, fixture_file, ser_fmt, open_method, mode):
+        """Yields the deserialized objects of the fixture file, using the fixture cache for cacheable formats if
+        the ``FIXTURE_CACHE_ENABLED`` setting is set."""
+        options = {'using': self.using, 'ignorenonexistent': self.ignore, 'handle_forward_references': True}
+        if get_config()["FIXTURE_CACHE_ENABLED"] and fixture_cache.is_cacheable(ser_fmt):
+            yield from PythonDeserializer(fixture_cache.get(fixture_file, ser_fmt, open_method, mode), **options)
+        else:
+            with open_method(fixture_file, mode) as fixture:
+                yield from serializers.deserialize(ser_fmt, fixture, **options)
@@ -17,6 +17,10 @@ CONFIG_DEFAULTS = {
     "FIXTURE_DIRS": [],
     "FIXTURE_MEDIAFILE_FINDERS": ["anfema_django_testutils.contrib.fixtures.finders.media.AppDirectoriesFinder"],
     "FIXTURE_MEDIAFILE_DIRS": [],
+    "FIXTURE_CACHE_ENABLED": False,
+    "FIXTURE_CACHE_DIR": None,
+    "FIXTURE_BULK_LOAD_ENABLED": False,
+    "FIXTURE_FINDER_INDEX_ENABLED": False,
 }
 
 
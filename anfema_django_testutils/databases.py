@@ -0,0 +1,268 @@
+"""This module provides the creation of test databases from templates of previous test runs."""
+from __future__ import annotations
+
+
+__all__ = (
+    'DatabaseTemplate',
+    'PostgreSQLDatabaseTemplate',
+    'SQLiteDatabaseTemplate',
+    'get_database_fingerprint',
+    'use_database_templates',
+)
+
+import contextlib
+import functools
+import hashlib
+import os
+import pathlib
+import sqlite3
+import sys
+from typing import TYPE_CHECKING
+
+import django
+from django.apps import apps
+from django.conf import settings
+from django.core import serializers
+from django.core.management import call_command
+from django.db import connections
+from django.db.migrations.loader import MigrationLoader
+
+
+if TYPE_CHECKING:
+    import types
+    from typing import Iterator, Optional, Set
+
+    from django.db.backends.base.base import BaseDatabaseWrapper
+
+
+def _iter_module_files(module: types.ModuleType) -> Iterator[pathlib.Path]:
+    """Yields the source file of a module, respectively the source files of a package."""
+    if hasattr(module, '__path__'):
+        for path in module.__path__:
+            yield from sorted(pathlib.Path(path).rglob('*.py'))
+    elif getattr(module, '__file__', None):
+        yield pathlib.Path(module.__file__)
+
+
+#: The suffixes of compressed fixture files, as supported by ``loaddata``.
+FIXTURE_COMPRESSION_SUFFIXES = ('.gz', '.zip', '.bz2', '.lzma', '.xz')
+
+
+def _is_fixture_file(path: pathlib.Path, serialization_suffixes: Set[str]) -> bool:
+    """Tells whether the file is a (possibly compressed) fixture file, rather than e.g. a fixture media file."""
+    suffixes = path.suffixes[-2:]
+    if suffixes and suffixes[-1] in FIXTURE_COMPRESSION_SUFFIXES:
+        suffixes = suffixes[:-1]
+    return bool(suffixes) and suffixes[-1] in serialization_suffixes and path.is_file()
+
+
+def _iter_fixture_files() -> Iterator[pathlib.Path]:
+    """Yields the fixture files within the fixture directories ``loaddata`` looks up fixtures in."""
+    serialization_suffixes = {f'.{ser_fmt}' for ser_fmt in serializers.get_public_serializer_formats()}
+    fixture_dirs = [pathlib.Path(app_config.path, 'fixtures') for app_config in apps.get_app_configs()]
+    fixture_dirs.extend(map(pathlib.Path, settings.FIXTURE_DIRS))
+    for fixture_dir in fixture_dirs:
+        if fixture_dir.is_dir():
+            yield from sorted(path for path in fixture_dir.rglob('*') if _is_fixture_file(path, serialization_suffixes))
+
+
+def get_database_fingerprint() -> str:
+    """Returns a fingerprint of everything a migrated test database depends on.
+
+    These are the migration files and the models of all installed apps, as well as the fixture files, which may
+    be loaded by data migrations, and the Django version. Other files within the fixture directories, e.g.
+    fixture media files, can't change the contents of the database, and are thus ignored.
+    """
+    source_files = set()
+    for migration in MigrationLoader(None, ignore_no_migrations=True).disk_migrations.values():
+        source_files.update(_iter_module_files(sys.modules[type(migration).__module__]))
+    for app_config in apps.get_app_configs():
+        if app_config.models_module is not None:
+            source_files.update(_iter_module_files(app_config.models_module))
+
+    fingerprint = hashlib.sha256(django.get_version().encode())
+    for path in [*sorted(source_files), *_iter_fixture_files()]:
+        fingerprint.update(str(path).encode())
+        fingerprint.update(path.read_bytes())
+    return fingerprint.hexdigest()
+
+
+class DatabaseTemplate:
+    """A migrated test database of a previous test run, from which the test database is created instead of
+    migrating it.
+
+    The template is bound to a fingerprint of the migrations, models and fixtures (see
+    :func:`get_database_fingerprint`) and of the database settings, so a new template is saved once any of them
+    has been changed.
+
+    :param connection: The connection of the test database.
+    :param str fingerprint: The fingerprint of the migrations, models and fixtures.
+    :param str template_dir: The directory to store file based templates in.
+    """
+
+    def __init__(self, connection: BaseDatabaseWrapper, fingerprint: str, template_dir: str) -> None:
+        self.connection = connection
+        self.template_dir = pathlib.Path(template_dir)
+        settings_fingerprint = repr(
+            (connection.alias, connection.settings_dict['ENGINE'], sorted(connection.settings_dict['TEST'].items()))
+        )
+        self.fingerprint = hashlib.sha256(f'{fingerprint}{settings_fingerprint}'.encode()).hexdigest()
+
+    @classmethod
+    def for_connection(
+        cls, connection: BaseDatabaseWrapper, fingerprint: str, template_dir: str
+    ) -> Optional[DatabaseTemplate]:
+        """Returns the template for the connection, or ``None`` if its database vendor isn't supported."""
+        template_classes = {'sqlite': SQLiteDatabaseTemplate, 'postgresql': PostgreSQLDatabaseTemplate}
+        if template_class := template_classes.get(connection.vendor):
+            return template_class(connection, fingerprint, template_dir)
+        return None
+
+    @property
+    def name(self) -> str:
+        """The name of the template."""
+        raise NotImplementedError
+
+    def exists(self) -> bool:
+        """Tells whether the template has already been saved."""
+        raise NotImplementedError
+
+    def save(self) -> None:
+        """Saves the migrated test database as template, and deletes the outdated templates."""
+        raise NotImplementedError
+
+    def restore(self, verbosity: int, autoclobber: bool) -> None:
+        """Creates the test database from the template, once the connection has been switched to it."""
+        raise NotImplementedError
+
+    def create_test_db(self, verbosity=1, autoclobber=False, serialize=True, keepdb=False) -> str:
+        """Creates the test database from the template like
+        :meth:`~django.db.backends.base.creation.BaseDatabaseCreation.create_test_db`, but without migrating it.
+        """
+        creation = self.connection.creation
+        test_database_name = creation._get_test_db_name()
+        if verbosity >= 1:
+            creation.log(
+                f'Creating test database for alias {creation._get_database_display_str(verbosity, test_database_name)} '
+                f'from template {self.name!r}...'
+            )
+
+        self.connection.close()
+        settings.DATABASES[self.connection.alias]['NAME'] = test_database_name
+        self.connection.settings_dict['NAME'] = test_database_name
+        self.restore(verbosity, autoclobber)
+
+        if serialize:
+            self.connection._test_serialized_contents = creation.serialize_db_to_string()
+        call_command('createcachetable', database=self.connection.alias)
+        self.connection.ensure_connection()
+        return test_database_name
+
+
+class SQLiteDatabaseTemplate(DatabaseTemplate):
+    """Stores the template as SQLite file within the template directory, and copies it into the test database
+    (either a file or in-memory database) using SQLite's backup API."""
+
+    @property
+    def name(self) -> str:
+        return f'{self.connection.alias}-{self.fingerprint[:16]}.sqlite3'
+
+    @property
+    def path(self) -> pathlib.Path:
+        return self.template_dir / self.name
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def save(self) -> None:
+        self.template_dir.mkdir(parents=True, exist_ok=True)
+        for path in self.template_dir.glob(f'{self.connection.alias}-*.sqlite3'):
+            path.unlink()
+        temp_path = self.path.with_suffix('.tmp')
+        self.connection.ensure_connection()
+        with contextlib.closing(sqlite3.connect(temp_path)) as template:
+            self.connection.connection.backup(template)
+        os.replace(temp_path, self.path)
+
+    def restore(self, verbosity: int, autoclobber: bool) -> None:
+        self.connection.creation._create_test_db(verbosity, autoclobber)
+        self.connection.ensure_connection()
+        with contextlib.closing(sqlite3.connect(self.path)) as template:
+            template.backup(self.connection.connection)
+
+
+class PostgreSQLDatabaseTemplate(DatabaseTemplate):
+    """Stores the template as database next to the test database, and creates the test database using
+    ``CREATE DATABASE ... TEMPLATE``."""
+
+    @property
+    def name(self) -> str:
+        # PostgreSQL truncates identifiers to 63 characters.
+        return f'{self.connection.creation._get_test_db_name()[:46]}_tpl_{self.fingerprint[:12]}'
+
+    def exists(self) -> bool:
+        with self.connection.creation._nodb_cursor() as cursor:
+            return self.connection.creation._database_exists(cursor, self.name)
+
+    def save(self) -> None:
+        # CREATE DATABASE ... TEMPLATE ... requires closing the connections to the test database.
+        self.connection.close()
+        if hasattr(self.connection, 'close_pool'):  # Django >= 5.1
+            self.connection.close_pool()
+        quote_name = self.connection.ops.quote_name
+        prefix = self.name[: -len(self.fingerprint[:12])]
+        with self.connection.creation._nodb_cursor() as cursor:
+            cursor.execute("SELECT datname FROM pg_catalog.pg_database WHERE datname LIKE %s", [f'{prefix}%'])
+            for (name,) in cursor.fetchall():
+                if name.startswith(prefix):
+                    cursor.execute(f'DROP DATABASE {quote_name(name)}')
+            cursor.execute(
+                f'CREATE DATABASE {quote_name(self.name)} TEMPLATE {quote_name(self.connection.settings_dict["NAME"])}'
+            )
+
+    def restore(self, verbosity: int, autoclobber: bool) -> None:
+        # Let Django create the test database (including dropping an existing one), using the template.
+        test_settings = self.connection.settings_dict['TEST']
+        template = test_settings.get('TEMPLATE')
+        test_settings['TEMPLATE'] = self.name
+        try:
+            self.connection.creation._create_test_db(verbosity, autoclobber)
+        finally:
+            test_settings['TEMPLATE'] = template
+
+
+@contextlib.contextmanager
+def use_database_templates(template_dir: str) -> Iterator[None]:
+    """Creates the test databases set up within the context from their templates, if they are up-to-date, and
+    saves the test databases as templates otherwise.
+
+    :param str template_dir: The directory to store file based templates in.
+    """
+    fingerprint = None
+
+    def create_test_db(connection, create_test_db, verbosity=1, autoclobber=False, serialize=True, keepdb=False):
+        nonlocal fingerprint
+        if keepdb:
+            return create_test_db(verbosity=verbosity, autoclobber=autoclobber, serialize=serialize, keepdb=keepdb)
+        if fingerprint is None:
+            fingerprint = get_database_fingerprint()
+        template = DatabaseTemplate.for_connection(connection, fingerprint, template_dir)
+        if template is None:
+            return create_test_db(verbosity=verbosity, autoclobber=autoclobber, serialize=serialize)
+        if template.exists():
+            return template.create_test_db(verbosity=verbosity, autoclobber=autoclobber, serialize=serialize)
+        test_database_name = create_test_db(verbosity=verbosity, autoclobber=autoclobber, serialize=serialize)
+        if verbosity >= 1:
+            connection.creation.log(f'Saving test database for alias {connection.alias!r} as template...')
+        template.save()
+        return test_database_name
+
+    for connection in connections.all():
+        connection.creation.create_test_db = functools.partial(
+            create_test_db, connection, connection.creation.create_test_db
+        )
+    try:
+        yield
+    finally:
+        for connection in connections.all():
+            del connection.creation.create_test_db
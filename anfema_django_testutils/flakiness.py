@@ -0,0 +1,45 @@
+"""This module provides the history of flaky tests."""
+from __future__ import annotations
+
+
+__all__ = ('FlakinessHistory',)
+
+import datetime
+import json
+import pathlib
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from typing import Dict, Iterable
+
+
+class FlakinessHistory:
+    """Counts how often each test has been flaky, i.e. failed but passed on a rerun, across test runs.
+
+    The counts are stored as JSON file, together with the timestamp of the latest test run each test has been
+    flaky in, so that frequently flaky tests can be identified and quarantined.
+
+    :param str path: Path to the JSON file.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = pathlib.Path(path)
+        self.tests: Dict[str, Dict[str, object]] = {}
+        if self.path.exists():
+            self.tests = json.loads(self.path.read_text())
+
+    def get_count(self, test_id: str) -> int:
+        """Returns the number of test runs the test has been flaky in."""
+        return self.tests.get(test_id, {}).get('count', 0)
+
+    def add_run(self, timestamp: datetime.datetime, test_ids: Iterable[str]) -> None:
+        """Increments the counts of the tests which have been flaky in a test run, and saves the history.
+
+        :param datetime timestamp: The start of the test run.
+        :param test_ids: The ids of the flaky tests.
+        """
+        for test_id in test_ids:
+            self.tests[test_id] = {'count': self.get_count(test_id) + 1, 'last_flaky': timestamp.isoformat()}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.tests, indent=1, sort_keys=True))
@@ -0,0 +1,129 @@
+"""This module provides a persistent history of test durations."""
+from __future__ import annotations
+
+
+__all__ = ('DurationHistory', 'DurationTrend')
+
+import pathlib
+import sqlite3
+import statistics
+from collections import defaultdict
+from typing import TYPE_CHECKING, NamedTuple
+
+
+if TYPE_CHECKING:
+    import datetime
+    from typing import Dict, Iterable, List, Tuple
+
+
+class DurationTrend(NamedTuple):
+    """The duration of a test compared to the rolling median of its previous durations."""
+
+    test_id: str
+    duration: float
+    median: float
+
+    @property
+    def change(self) -> float:
+        """The relative change of the duration compared to the median, e.g. ``0.5`` for 50% slower."""
+        return (self.duration - self.median) / self.median if self.median else 0.0
+
+
+class DurationHistory:
+    """Stores the durations of the tests of each test run in a local SQLite database.
+
+    .. code-block::
+
+        with DurationHistory("test-report/test-durations.sqlite3") as history:
+            medians = history.get_medians()
+            history.add_run(timestamp, [("app.tests.CustomTest.test_something", 0.25)])
+
+    :param str path: Path to the SQLite database file.
+    :param int window: The number of previous runs of a test to compute its rolling median from.
+    :param int max_runs: The number of test runs to keep, older test runs will be removed.
+    """
+
+    #: A test is considered as regression if its duration exceeds its median by this factor.
+    regression_factor = 1.5
+
+    #: Tests faster than this number of seconds are never considered as regression.
+    min_regression_duration = 0.1
+
+    def __init__(self, path: str, window: int = 10, max_runs: int = 100) -> None:
+        self.path = pathlib.Path(path)
+        self.window = window
+        self.max_runs = max_runs
+        self._connection = None
+
+    def __enter__(self) -> DurationHistory:
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def open(self) -> None:
+        """Opens respectively creates the database."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.path)
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS runs (id INTEGER PRIMARY KEY AUTOINCREMENT, timestamp TEXT);
+            CREATE TABLE IF NOT EXISTS durations (run_id INTEGER, test_id TEXT, duration REAL);
+            CREATE INDEX IF NOT EXISTS durations_test_id ON durations (test_id, run_id);
+            """
+        )
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def add_run(self, timestamp: datetime.datetime, durations: Iterable[Tuple[str, float]]) -> None:
+        """Stores the durations of a test run, and removes test runs exceeding :attr:`max_runs`.
+
+        :param timestamp: The time the test run has been started.
+        :param durations: The test ids and durations in seconds of the test run.
+        """
+        with self._connection:
+            run_id = self._connection.execute(
+                "INSERT INTO runs (timestamp) VALUES (?)", (timestamp.isoformat() if timestamp else None,)
+            ).lastrowid
+            self._connection.executemany(
+                "INSERT INTO durations (run_id, test_id, duration) VALUES (?, ?, ?)",
+                ((run_id, test_id, duration) for test_id, duration in durations),
+            )
+            self._connection.execute(
+                "DELETE FROM runs WHERE id NOT IN (SELECT id FROM runs ORDER BY id DESC LIMIT ?)", (self.max_runs,)
+            )
+            self._connection.execute("DELETE FROM durations WHERE run_id NOT IN (SELECT id FROM runs)")
+
+    def get_medians(self) -> Dict[str, float]:
+        """Returns the median duration of the latest :attr:`window` runs of each test."""
+        durations = defaultdict(list)
+        for test_id, duration in self._connection.execute(
+            """
+            SELECT test_id, duration FROM (
+                SELECT test_id, duration, ROW_NUMBER() OVER (PARTITION BY test_id ORDER BY run_id DESC) AS position
+                FROM durations
+            ) WHERE position <= ?
+            """,
+            (self.window,),
+        ):
+            durations[test_id].append(duration)
+        return {test_id: statistics.median(test_durations) for test_id, test_durations in durations.items()}
+
+    def get_regressions(self, durations: Iterable[Tuple[str, float]], medians: Dict[str, float]) -> List[DurationTrend]:
+        """Returns the tests which got significantly slower than their median, the largest change first.
+
+        :param durations: The test ids and durations in seconds of the current test run.
+        :param medians: The median durations of the previous test runs, see :meth:`get_medians`.
+        """
+        regressions = [
+            DurationTrend(test_id, duration, median)
+            for test_id, duration in durations
+            if (median := medians.get(test_id)) is not None
+            and duration >= self.min_regression_duration
+            and duration > median * self.regression_factor
+        ]
+        return sorted(regressions, key=lambda trend: trend.change, reverse=True)
@@ -0,0 +1,92 @@
+"""This module provides the selection of tests affected by code changes."""
+from __future__ import annotations
+
+
+__all__ = ('TestImpactMap', 'get_changed_files')
+
+import json
+import os
+import pathlib
+import subprocess
+from typing import TYPE_CHECKING
+
+from django.core.management.base import CommandError
+
+
+if TYPE_CHECKING:
+    from typing import Dict, Iterable, List, Set
+
+    from coverage import CoverageData
+
+
+def get_changed_files(ref: str) -> List[str]:
+    """Returns the files changed since the given git ref (including uncommitted changes), relative to the
+    current working directory.
+
+    :param str ref: A git ref, e.g. ``origin/main`` or a commit hash.
+    """
+    try:
+        proc = subprocess.run(
+            ['git', 'diff', '--name-only', '--relative', ref, '--'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError) as exc:
+        raise CommandError(f"Could not determine the files changed since {ref!r}: {getattr(exc, 'stderr', exc)}")
+    return [os.path.normpath(path) for path in proc.stdout.splitlines() if path]
+
+
+class TestImpactMap:
+    """Maps the source files to the tests covering them, based on the per-test coverage contexts.
+
+    The map is stored as JSON file, whereby the source files are stored relative to the current working
+    directory, so that they can be compared to the output of ``git diff``.
+
+    :param str path: Path to the JSON file.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = pathlib.Path(path)
+        self.tests_by_file: Dict[str, List[str]] = {}
+        if self.path.exists():
+            self.tests_by_file = json.loads(self.path.read_text())
+
+    @property
+    def known_tests(self) -> Set[str]:
+        """The ids of all tests contained in the map."""
+        return set().union(*self.tests_by_file.values())
+
+    def update(self, coverage_data: CoverageData) -> None:
+        """Updates the map with the coverage contexts of the tests measured by *coverage_data*, and saves it.
+
+        The entries of tests which haven't been measured, e.g. as only a subset of the tests has been run,
+        are kept.
+        """
+        measured_tests_by_file = {}
+        for file_name in coverage_data.measured_files():
+            relative_path = os.path.relpath(file_name)
+            if relative_path.startswith(os.pardir):
+                continue
+            contexts = set().union(*coverage_data.contexts_by_lineno(file_name).values())
+            contexts.discard('')
+            if contexts:
+                measured_tests_by_file[relative_path] = contexts
+
+        measured_tests = set().union(*measured_tests_by_file.values())
+        tests_by_file = {
+            file_name: tests
+            for file_name, file_tests in self.tests_by_file.items()
+            if (tests := set(file_tests) - measured_tests)
+        }
+        for file_name, tests in measured_tests_by_file.items():
+            tests_by_file.setdefault(file_name, set()).update(tests)
+
+        self.tests_by_file = {file_name: sorted(tests) for file_name, tests in sorted(tests_by_file.items())}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.tests_by_file, indent=1))
+
+    def get_impacted_tests(self, changed_files: Iterable[str]) -> Set[str]:
+        """Returns the ids of the tests covering any of the changed files."""
+        return set().union(*(self.tests_by_file.get(file_name, ()) for file_name in changed_files))
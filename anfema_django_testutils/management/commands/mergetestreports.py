@@ -0,0 +1,138 @@
+import argparse
+import pathlib
+from collections import Counter
+
+from django.core.management.base import BaseCommand, CommandError
+
+from coverage import Coverage
+
+from anfema_django_testutils.reports import read_json_lines
+from anfema_django_testutils.runner import HtmlTestResult
+from anfema_django_testutils.settings import get_config
+
+
+class Command(BaseCommand):
+    """Merges the test results of multiple test runs, e.g. of several CI nodes, into a single test report."""
+
+    help = "Merges test result JSON Lines files (and coverage data files) into a single test report."
+    verbosity: int
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "result_files",
+            nargs="+",
+            metavar="FILE",
+            help="The test-results.jsonl files to merge.",
+        )
+        parser.add_argument(
+            "--coverage-data",
+            nargs="+",
+            dest="coverage_data_files",
+            metavar="FILE",
+            default=[],
+            help="The coverage data files respectively directories to combine into a single coverage report.",
+        )
+        parser.add_argument(
+            "--html",
+            action=argparse.BooleanOptionalAction,
+            dest="html_results_enabled",
+            default=get_config()["HTML_RESULTS_ENABLED"],
+            help="Enables respectively disables html results instead of using the HTML_RESULTS_ENABLED setting.",
+        )
+        parser.add_argument(
+            "--html-mode",
+            action="store",
+            dest="html_results_mode",
+            choices=("inline", "lazy"),
+            default=get_config()["HTML_RESULTS_MODE"],
+            help="Defines whether the html results contain all test results inline, or whether they are loaded "
+            "lazily from separate data files. If this isn't provided, the HTML_RESULTS_MODE setting will be used.",
+        )
+        parser.add_argument(
+            "--jsonl",
+            action=argparse.BooleanOptionalAction,
+            dest="jsonl_results_enabled",
+            default=get_config()["JSONL_RESULTS_ENABLED"],
+            help="Enables respectively disables writing the merged test results into a JSON Lines file "
+            "instead of using the JSONL_RESULTS_ENABLED setting.",
+        )
+        parser.add_argument(
+            "--junit-xml",
+            action=argparse.BooleanOptionalAction,
+            dest="junit_xml_results_enabled",
+            default=get_config()["JUNIT_XML_RESULTS_ENABLED"],
+            help="Enables respectively disables a JUnit XML report instead of using the "
+            "JUNIT_XML_RESULTS_ENABLED setting.",
+        )
+        parser.add_argument(
+            "--report-dir",
+            action="store",
+            dest="report_dir",
+            metavar="DIR",
+            default=get_config()["TEST_REPORT_DIR"],
+            help="Defines the directory where to store the merged report artifacts. "
+            "If this isn't provided, the TEST_REPORT_DIR setting will be used.",
+        )
+        parser.add_argument(
+            "--report-title",
+            action="store",
+            dest="report_title",
+            metavar="TITLE",
+            default=get_config()["TEST_REPORT_TITLE"],
+            help="A string which defines the test-report`s title."
+            "If this isn't provided, the TEST_REPORT_TITLE setting will be used.",
+        )
+
+    def set_options(self, **options) -> None:
+        self.verbosity = options["verbosity"]
+
+    def handle(self, *args, **options):
+        self.set_options(**options)
+
+        result_files = [pathlib.Path(result_file) for result_file in options["result_files"]]
+        if missing_files := [str(result_file) for result_file in result_files if not result_file.is_file()]:
+            raise CommandError(f"Could not find test result file(s): {', '.join(missing_files)}.")
+        resolved_result_files = [result_file.resolve() for result_file in result_files]
+        if duplicate_files := [str(path) for path, count in Counter(resolved_result_files).items() if count > 1]:
+            raise CommandError(f"The test result file(s) {', '.join(duplicate_files)} would be merged more than once.")
+        merged_result_file = pathlib.Path(options["report_dir"], "test-results.jsonl").resolve()
+        if options["jsonl_results_enabled"] and merged_result_file in resolved_result_files:
+            raise CommandError(f"The test result file {str(merged_result_file)!r} would be overwritten by the merge.")
+
+        HtmlTestResult.options = options
+        result = HtmlTestResult()
+        skipped_records = 0
+        result.startTestRun()
+        try:
+            # The records are read line by line, so that only the merged results are kept in memory.
+            merged_tests = set()
+            for result_file in result_files:
+                for record in read_json_lines(result_file):
+                    # Tests contained by more than one result file, e.g. of overlapping shards, are merged once.
+                    # Tests which passed on a rerun have an additional record, which marks them as flaky.
+                    if (test_key := (record['testcase'], record['name'], 'rerun_attempt' in record)) in merged_tests:
+                        skipped_records += 1
+                        continue
+                    merged_tests.add(test_key)
+                    result.add_result_record(record)
+        finally:
+            result.stopTestRun()
+        result.count_flaky_tests(add_run=False)
+        result.printErrors()
+        if skipped_records and self.verbosity >= 1:
+            self.stdout.write(f"Skipped {skipped_records} test result(s) contained by more than one result file.")
+
+        if coverage_data_files := options["coverage_data_files"]:
+            self.merge_coverage(coverage_data_files, options["report_dir"])
+
+        result.create_report(result.make_result_data())
+
+    def merge_coverage(self, coverage_data_files: list[str], report_dir: str) -> None:
+        """Combines the coverage data files and generates a single coverage report."""
+        pathlib.Path(report_dir).mkdir(parents=True, exist_ok=True)
+        coverage = Coverage(data_file=str(pathlib.Path(report_dir, ".coverage")))
+        coverage.combine(coverage_data_files, keep=True)
+        coverage.save()
+        coverage_report_dir = pathlib.Path(report_dir, "coverage")
+        coverage.html_report(directory=str(coverage_report_dir))
+        self.stdout.write(f'Generated coverage report: "{(coverage_report_dir / "index.html").absolute()}"')
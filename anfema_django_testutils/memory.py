@@ -0,0 +1,131 @@
+"""This module provides the tracking of the memory usage per test."""
+from __future__ import annotations
+
+
+__all__ = (
+    'MemoryStats',
+    'MemoryTracker',
+    'get_leaking_testcases',
+    'get_rss',
+    'start_peak_measurement',
+    'stop_peak_measurement',
+)
+
+import os
+import tracemalloc
+from typing import TYPE_CHECKING, NamedTuple
+
+
+if TYPE_CHECKING:
+    from typing import Iterable, List, Optional, Tuple
+
+
+class MemoryStats(NamedTuple):
+    """The memory usage of a test."""
+
+    #: The peak of the memory allocated while the test has been run, in bytes.
+    peak: int
+    #: The memory allocated by the test which hasn't been released once the test has been finished, in bytes.
+    retained: int
+    #: The resident set size of the process once the test has been finished, in bytes, if available.
+    rss: Optional[int] = None
+
+
+def get_rss() -> Optional[int]:
+    """Returns the current resident set size of the process in bytes, or ``None`` if it isn't available on the
+    platform (currently only Linux is supported)."""
+    try:
+        with open('/proc/self/statm', 'rb') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+#: The peaks of the enclosing peak measurements, which have been discarded by resetting the peak of tracemalloc.
+_discarded_peaks: List[int] = []
+
+
+def start_peak_measurement() -> None:
+    """Starts measuring the peak of the traced memory by resetting the peak of :mod:`tracemalloc`.
+
+    As :func:`tracemalloc.reset_peak` resets the peak of the whole process, the peak until then is kept for the
+    enclosing measurement, if any, so that measurements can be nested, e.g. a
+    :class:`~anfema_django_testutils.testcases.BudgetContext` within a test whose memory is tracked.
+    """
+    if _discarded_peaks:
+        _discarded_peaks[-1] = max(_discarded_peaks[-1], tracemalloc.get_traced_memory()[1])
+    _discarded_peaks.append(0)
+    tracemalloc.reset_peak()
+
+
+def stop_peak_measurement() -> int:
+    """Stops the latest peak measurement, and returns the peak of the traced memory since it has been started."""
+    peak = max(_discarded_peaks.pop() if _discarded_peaks else 0, tracemalloc.get_traced_memory()[1])
+    if _discarded_peaks:
+        _discarded_peaks[-1] = max(_discarded_peaks[-1], peak)
+    return peak
+
+
+class MemoryTracker:
+    """Tracks the memory allocated by a test using :mod:`tracemalloc`.
+
+    Tracing is started with the first tracked test and has to be stopped with :meth:`stop_tracing` once
+    all tests have been run.
+
+    .. code-block::
+
+        memory_tracker = MemoryTracker()
+        memory_tracker.start()
+        ...
+        memory_stats = memory_tracker.stop()
+    """
+
+    def __init__(self) -> None:
+        self._start_memory = None
+
+    def start(self) -> None:
+        """Starts tracking the memory of a test."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        start_peak_measurement()
+        self._start_memory, _ = tracemalloc.get_traced_memory()
+
+    def stop(self) -> Optional[MemoryStats]:
+        """Stops tracking the memory of a test, and returns its memory stats."""
+        if self._start_memory is None or not tracemalloc.is_tracing():
+            return None
+        peak = stop_peak_measurement()
+        current, _ = tracemalloc.get_traced_memory()
+        start_memory, self._start_memory = self._start_memory, None
+        return MemoryStats(peak - start_memory, current - start_memory, get_rss())
+
+    @staticmethod
+    def stop_tracing() -> None:
+        """Stops tracing the memory allocations."""
+        _discarded_peaks.clear()
+        tracemalloc.stop()
+
+
+def get_leaking_testcases(
+    memory_stats: Iterable[Tuple[str, MemoryStats]], threshold: int, min_tests: int = 3
+) -> List[Tuple[str, int]]:
+    """Returns the testcases whose retained memory keeps growing across their tests, with their retained memory,
+    most retained first.
+
+    A testcase is deemed leaking, if each of its tests after the first one retained memory, and their retained
+    memory sums up to more than the threshold. The first test is ignored, as it usually fills caches.
+
+    :param memory_stats: The testcases and memory stats of the tests, in the order the tests have been run.
+    :param int threshold: The retained memory in bytes a testcase must exceed to be deemed leaking.
+    :param int min_tests: The minimum number of tests of a testcase to be able to tell whether it is leaking.
+    """
+    retained_by_testcase = {}
+    for testcase, stats in memory_stats:
+        retained_by_testcase.setdefault(testcase, []).append(stats.retained)
+
+    leaking_testcases = [
+        (testcase, sum(retained[1:]))
+        for testcase, retained in retained_by_testcase.items()
+        if len(retained) >= min_tests and all(r > 0 for r in retained[1:]) and sum(retained[1:]) > threshold
+    ]
+    return sorted(leaking_testcases, key=lambda item: item[1], reverse=True)
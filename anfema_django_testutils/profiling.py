@@ -0,0 +1,158 @@
+"""This module provides the profiling of tests."""
+from __future__ import annotations
+
+
+__all__ = ('TestProfiler', 'write_collapsed_stacks')
+
+import cProfile
+import os
+import pathlib
+import pstats
+from collections import Counter, defaultdict
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Tuple
+
+    _Function = Tuple[str, int, str]
+    _Hotspot = Tuple[str, float, float]
+
+
+def _format_function(function: _Function) -> str:
+    file_name, line_number, function_name = function
+    if file_name == '~':
+        return function_name
+    if not (relative_file_name := os.path.relpath(file_name)).startswith(os.pardir):
+        file_name = relative_file_name
+    return f'{function_name} ({file_name}:{line_number})'
+
+
+def write_collapsed_stacks(stats: pstats.Stats, path: str, max_depth: int = 64, min_share: float = 0.001) -> None:
+    """Writes the profile as collapsed stacks, which can be rendered as flame graph, e.g. by
+    `flamegraph.pl <https://github.com/brendangregg/FlameGraph>`_ or `speedscope <https://www.speedscope.app>`_.
+
+    As a profile only knows the callers of each function rather than complete stacks, the time of a function
+    is distributed onto its stacks proportionally to the time spent in the function when called by each
+    caller. Each line holds a stack, with the functions separated by semicolons, and its time in microseconds.
+
+    :param stats: The profile statistics.
+    :param str path: Path to the collapsed stacks file.
+    :param int max_depth: The maximum depth of the stacks.
+    :param float min_share: Stacks with less than this share of the total time are omitted, which also
+      bounds the number of stacks to walk.
+    """
+    min_time = stats.total_tt * min_share
+    callees = defaultdict(dict)
+    for function, (_, _, _, _, callers) in stats.stats.items():
+        for caller, (_, _, _, caller_cumulative_time) in callers.items():
+            callees[caller][function] = caller_cumulative_time
+
+    collapsed_stacks = Counter()
+
+    def walk(function: _Function, stack: Tuple[_Function, ...], share: float) -> None:
+        _, _, total_time, cumulative_time, _ = stats.stats[function]
+        if share * total_time >= min_time:
+            collapsed_stacks[stack] += share * total_time
+        if len(stack) >= max_depth:
+            return
+        for callee, time_by_caller in callees[function].items():
+            callee_cumulative_time = stats.stats[callee][3]
+            if callee in stack or not callee_cumulative_time:
+                continue
+            callee_share = share * time_by_caller / callee_cumulative_time
+            if callee_share * callee_cumulative_time >= min_time:
+                walk(callee, (*stack, callee), callee_share)
+
+    for function, (_, _, _, cumulative_time, callers) in stats.stats.items():
+        # The time not spent on behalf of any recorded caller (e.g. as the function has been called before
+        # profiling started) is the root of a stack.
+        caller_time = sum(caller_stats[3] for caller, caller_stats in callers.items() if caller != function)
+        if cumulative_time and (root_time := cumulative_time - caller_time) >= min_time:
+            walk(function, (function,), root_time / cumulative_time)
+
+    with pathlib.Path(path).open('w') as fp:
+        for stack, time in collapsed_stacks.items():
+            if microseconds := round(time * 1e6):
+                frames = ';'.join(_format_function(function).replace(';', ',') for function in stack)
+                fp.write(f'{frames} {microseconds}\n')
+
+
+class TestProfiler:
+    """Profiles tests using :mod:`cProfile`, and aggregates the profiles per testcase and in total.
+
+    The profiles of the testcases are stored as :file:`{testcase}.pstats` files within the profile directory.
+    Test worker processes store the profiles of their testcases only, which are combined into the
+    :file:`profile.pstats` and :file:`profile.collapsed` files by :meth:`save` of the parent process.
+
+    :param str profile_dir: Path to the directory where to store the profiles.
+    """
+
+    #: The number of functions with the most own time to report for each test.
+    hotspot_count = 5
+
+    def __init__(self, profile_dir: str) -> None:
+        self.profile_dir = pathlib.Path(profile_dir)
+        self._profile = None
+        self._testcase_stats: Dict[str, pstats.Stats] = {}
+
+    def clear(self) -> None:
+        """Removes the profiles of a previous test run."""
+        if self.profile_dir.exists():
+            for profile_file in (*self.profile_dir.glob('*.pstats'), *self.profile_dir.glob('*.collapsed')):
+                profile_file.unlink()
+
+    def start(self) -> None:
+        """Starts profiling a test."""
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+
+    def stop(self, testcase: str) -> List[_Hotspot]:
+        """Stops profiling a test, and returns the functions with the most own time.
+
+        :param str testcase: The name of the test's testcase.
+        :returns: The function names, their own time and their cumulative time in seconds.
+        """
+        if self._profile is None:
+            return []
+        self._profile.disable()
+        stats = pstats.Stats(self._profile)
+        self._profile = None
+        if self._testcase_stats and testcase not in self._testcase_stats:
+            # Only keep the profile of the current testcase in memory.
+            self.save_testcase_stats()
+        if testcase in self._testcase_stats:
+            self._testcase_stats[testcase].add(stats)
+        else:
+            self._testcase_stats[testcase] = stats
+
+        hotspots = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)[: self.hotspot_count]
+        return [
+            (_format_function(function), total_time, cumulative_time)
+            for function, (_, _, total_time, cumulative_time, _) in hotspots
+        ]
+
+    def save_testcase_stats(self) -> None:
+        """Stores the profiles of the testcases profiled so far."""
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        for testcase, stats in self._testcase_stats.items():
+            testcase_file = self.profile_dir / f'{testcase}.pstats'
+            if testcase_file.exists():
+                # The tests of a testcase might have been split up into several runs.
+                stats.add(str(testcase_file))
+            stats.dump_stats(testcase_file)
+        self._testcase_stats.clear()
+
+    def save(self) -> pathlib.Path:
+        """Stores the profiles of the testcases, and combines all testcase profiles into the total profile.
+
+        :returns: The path to the total profile.
+        """
+        self.save_testcase_stats()
+        profile_file = self.profile_dir / 'profile.pstats'
+        testcase_files = sorted(str(path) for path in self.profile_dir.glob('*.pstats') if path != profile_file)
+        if testcase_files:
+            stats = pstats.Stats(*testcase_files)
+            stats.dump_stats(profile_file)
+            write_collapsed_stacks(stats, profile_file.with_suffix('.collapsed'))
+        return profile_file
@@ -0,0 +1,111 @@
+"""This module provides the counting of database queries per test."""
+from __future__ import annotations
+
+
+__all__ = ('QueryCounter', 'QueryStats', 'normalize_sql')
+
+import datetime
+import re
+import time
+from collections import Counter
+from typing import TYPE_CHECKING, NamedTuple
+
+from django.db import connections
+
+
+if TYPE_CHECKING:
+    import unittest
+    from typing import Iterable, Tuple
+
+
+_STRING_LITERAL_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL_RE = re.compile(r'\b\d+(?:\.\d+)?\b')
+_PLACEHOLDER_RE = re.compile(r'%s|%\(\w+\)s|\?')
+_PLACEHOLDER_LIST_RE = re.compile(r'\(\s*\?(?:\s*,\s*\?)*\s*\)')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_sql(sql: str) -> str:
+    """Normalizes an SQL statement by replacing its literals and placeholders, so that the statements of
+    the same query with different parameters are equal.
+    """
+    sql = _STRING_LITERAL_RE.sub('?', sql)
+    sql = _NUMBER_LITERAL_RE.sub('?', sql)
+    sql = _PLACEHOLDER_RE.sub('?', sql)
+    sql = _PLACEHOLDER_LIST_RE.sub('(...)', sql)
+    return _WHITESPACE_RE.sub(' ', sql).strip()
+
+
+class QueryStats(NamedTuple):
+    """The database queries of a test."""
+
+    #: The number of executed queries.
+    count: int
+    #: The total duration of the executed queries.
+    duration: datetime.timedelta
+    #: The normalized queries which have been repeated more often than the threshold, with their number.
+    repeated: Tuple[Tuple[str, int], ...] = ()
+
+
+class QueryCounter:
+    """Counts the database queries of a test, using an execute wrapper on the connections of its databases.
+
+    .. code-block::
+
+        query_counter = QueryCounter(test)
+        query_counter.install()
+        ...
+        query_counter.uninstall()
+        query_stats = query_counter.get_stats(repeat_threshold=10)
+
+    :param test: The test to count the database queries of.
+    :param databases: The aliases of the databases to count the queries of. Defaults to the test's
+      ``databases``.
+    """
+
+    def __init__(self, test: unittest.case.TestCase, databases: Iterable[str] = None) -> None:
+        self.test = test
+        self.databases = getattr(test, 'databases', ()) if databases is None else databases
+        self.count = 0
+        self.duration = 0.0
+        self._statements = Counter()
+        self._connections = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+            # The statements are normalized once the stats are requested, to keep the overhead per query low.
+            self._statements[sql] += 1
+
+    def install(self) -> None:
+        """Adds the execute wrapper to the connections of the databases."""
+        aliases = connections if self.databases == '__all__' else self.databases
+        self._connections = [connections[alias] for alias in aliases]
+        for connection in self._connections:
+            connection.execute_wrappers.append(self)
+
+    def uninstall(self) -> None:
+        """Removes the execute wrapper from the connections."""
+        for connection in self._connections:
+            if self in connection.execute_wrappers:
+                connection.execute_wrappers.remove(self)
+        self._connections = []
+
+    def get_stats(self, repeat_threshold: int) -> QueryStats:
+        """Returns the stats of the queries counted so far.
+
+        :param int repeat_threshold: Normalized queries which are repeated more often are reported as
+          repeated queries, as they likely indicate an N+1 query problem.
+        """
+        normalized_statements = Counter()
+        for sql, count in self._statements.items():
+            normalized_statements[normalize_sql(sql)] += count
+        return QueryStats(
+            self.count,
+            datetime.timedelta(seconds=self.duration),
+            tuple((sql, count) for sql, count in normalized_statements.most_common() if count > repeat_threshold),
+        )
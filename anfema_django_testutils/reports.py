@@ -0,0 +1,300 @@
+"""This module provides machine-readable test report writers."""
+from __future__ import annotations
+
+
+__all__ = ('JsonLinesResultSink', 'JUnitXmlReportWriter', 'LazyReportDataWriter', 'read_json_lines')
+
+import json
+import pathlib
+import re
+from typing import TYPE_CHECKING
+from xml.sax.saxutils import XMLGenerator
+
+
+if TYPE_CHECKING:
+    from typing import IO, Any, Dict, Iterator, Optional, Sequence
+
+
+class JsonLinesResultSink:
+    """Streams test results into a `JSON Lines <https://jsonlines.org>`_ file while the tests are running.
+
+    Each finished test is written as a single JSON object per line. The lines are buffered and written in
+    batches, so that the file always contains the results of all but the latest batch of finished tests, even
+    if the test run gets killed.
+
+    :param str path: Path to the JSON Lines file.
+    :param int batch_size: The number of test results to buffer before writing them to the file.
+    """
+
+    def __init__(self, path: str, batch_size: int = 100) -> None:
+        self.path = pathlib.Path(path)
+        self.batch_size = batch_size
+        self._buffer = []
+        self._file: Optional[IO[str]] = None
+
+    def __enter__(self) -> JsonLinesResultSink:
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def open(self) -> None:
+        """Creates respectively truncates the JSON Lines file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open('w')
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Adds a test result record, and writes the buffered records once the batch size has been reached."""
+        self._buffer.append(json.dumps(record, default=str))
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes all buffered records to the file."""
+        if self._buffer and self._file is not None:
+            self._file.write('\n'.join(self._buffer) + '\n')
+            self._file.flush()
+        self._buffer.clear()
+
+    def close(self) -> None:
+        """Writes all buffered records and closes the file."""
+        if self._file is not None:
+            self.flush()
+            self._file.close()
+            self._file = None
+
+
+def read_json_lines(path: str) -> Iterator[Dict[str, Any]]:
+    """Yields the test result records of a JSON Lines file written by :class:`JsonLinesResultSink` line by line.
+
+    :param str path: Path to the JSON Lines file.
+    """
+    with pathlib.Path(path).open() as fp:
+        for line in fp:
+            if line.strip():
+                yield json.loads(line)
+
+
+#: ANSI escape sequences, e.g. colors within captured output.
+_ANSI_ESCAPE_RE = re.compile(r'\x1b\[[0-?]*[ -/]*[@-~]')
+#: Characters which are not allowed within XML 1.0 documents.
+_INVALID_XML_CHARS_RE = re.compile('[^\x09\x0a\x0d\x20-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]')
+
+
+def _to_xml_text(text: str) -> str:
+    """Strips ANSI escape sequences, and replaces the characters which XML 1.0 doesn't allow with U+FFFD."""
+    return _INVALID_XML_CHARS_RE.sub('\ufffd', _ANSI_ESCAPE_RE.sub('', text))
+
+
+class JUnitXmlReportWriter:
+    """Writes test results in the `JUnit XML <https://github.com/testmoapp/junitxml>`_ format.
+
+    The report is generated from the result data of :meth:`HtmlTestResult.make_result_data()
+    <anfema_django_testutils.runner.HtmlTestResult.make_result_data>` and streamed element by element into
+    the file, so that no document tree of the whole report needs to be built in memory.
+
+    As JUnit XML does not know all results supported by the test runner, they are mapped as follows. Results
+    mapped onto an element with a ``type`` are additionally kept as ``result`` property of the ``testcase``:
+
+    ======================== ============================================
+    Result                   JUnit XML
+    ======================== ============================================
+    ``error``                ``error``
+    ``failure``              ``failure``
+    ``precondition_failure`` ``failure`` of type ``precondition_failure``
+    ``budget_exceeded``      ``failure`` of type ``budget_exceeded``
+    ``unexpected_success``   ``failure`` of type ``unexpected_success``
+    ``skipped``              ``skipped``
+    ``expected_failure``     ``skipped`` of type ``expected_failure``
+    ``passed``               no child element
+    ``flaky``                no child element
+    ======================== ============================================
+
+    :param str path: Path to the JUnit XML file.
+    """
+
+    #: Maps a test result to its JUnit XML element and its optional type attribute.
+    result_elements = {
+        'error': ('error', None),
+        'failure': ('failure', None),
+        'precondition_failure': ('failure', 'precondition_failure'),
+        'budget_exceeded': ('failure', 'budget_exceeded'),
+        'unexpected_success': ('failure', 'unexpected_success'),
+        'skipped': ('skipped', None),
+        'expected_failure': ('skipped', 'expected_failure'),
+        'flaky': (None, 'flaky'),
+    }
+
+    def __init__(self, path: str) -> None:
+        self.path = pathlib.Path(path)
+
+    def write(self, result_data: Dict[str, Any], title: str = None) -> None:
+        """Writes the JUnit XML report.
+
+        :param dict result_data: The result data as returned by :meth:`HtmlTestResult.make_result_data()
+          <anfema_django_testutils.runner.HtmlTestResult.make_result_data>`.
+        :param str title: Optional name of the ``testsuites`` element.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open('w', encoding='utf-8') as fp:
+            xml = XMLGenerator(fp, encoding='utf-8', short_empty_elements=True)
+            xml.startDocument()
+
+            summary = result_data['summary']
+            timestamp = summary.get('timestamp')
+            xml.startElement(
+                'testsuites',
+                {
+                    **({'name': title} if title else {}),
+                    **self._get_counts(summary),
+                    **({'timestamp': timestamp.isoformat()} if timestamp else {}),
+                },
+            )
+            for testcase, testcase_results in result_data['testcases'].items():
+                xml.startElement('testsuite', {'name': testcase, **self._get_counts(testcase_results['summary'])})
+                for test in testcase_results['tests']:
+                    self._write_testcase(xml, testcase, test)
+                xml.endElement('testsuite')
+            xml.endElement('testsuites')
+
+            xml.endDocument()
+            fp.write('\n')
+
+    def _write_testcase(self, xml: XMLGenerator, testcase: str, test) -> None:
+        xml.startElement(
+            'testcase', {'classname': testcase, 'name': test.name, 'time': self._format_time(test.duration)}
+        )
+        if element := self.result_elements.get(test.result):
+            element_name, element_type = element
+            if element_type is not None:
+                xml.startElement('properties', {})
+                xml.startElement('property', {'name': 'result', 'value': test.result})
+                xml.endElement('property')
+                xml.endElement('properties')
+
+            if element_name is not None:
+                # Tracebacks may contain characters which XML doesn't allow, e.g. of colored captured output.
+                outcome = _to_xml_text(test.outcome)
+                attrs = {'message': outcome.strip().splitlines()[-1] if outcome.strip() else ''}
+                if element_type is not None:
+                    attrs['type'] = element_type
+                xml.startElement(element_name, attrs)
+                if element_name != 'skipped':
+                    xml.characters(outcome)
+                xml.endElement(element_name)
+        xml.endElement('testcase')
+
+    def _get_counts(self, summary: Dict[str, Any]) -> Dict[str, str]:
+        return {
+            'tests': str(summary['totals']),
+            'failures': str(
+                sum(
+                    summary[result]
+                    for result in ('failure', 'precondition_failure', 'budget_exceeded', 'unexpected_success')
+                )
+            ),
+            'errors': str(summary['error']),
+            'skipped': str(summary['skipped'] + summary['expected_failure']),
+            'time': self._format_time(summary['duration']),
+        }
+
+    @staticmethod
+    def _format_time(duration) -> str:
+        return f'{duration.total_seconds():.3f}'
+
+
+class LazyReportDataWriter:
+    """Writes test results as compact data files, which are loaded on demand by the lazy html report viewer.
+
+    Rather than rendering every test and traceback into the html report, the following files are written
+    into the data directory:
+
+    :file:`index.js`
+        The testcases with their summaries and their tests, whereby each test is reduced to an array of its
+        name, the index of its result, its duration in seconds and the id of its outcome. If the database
+        queries of the test have been counted, the array additionally holds the number of queries, their
+        duration in seconds and whether queries have been repeated more often than the threshold.
+    :file:`outcomes-{N}.js`
+        The outcomes (e.g. tracebacks) of the tests, split into chunks of :attr:`outcome_chunk_size` outcomes,
+        so that the viewer only loads the chunk of an outcome once it gets expanded.
+
+    The files are JavaScript files rather than JSON files, so that the report can also be viewed from the
+    local file system, where browsers usually refuse to fetch files.
+
+    :param str data_dir: Path to the directory where to store the data files.
+    """
+
+    #: The number of outcomes stored within a single outcomes file.
+    outcome_chunk_size = 200
+
+    def __init__(self, data_dir: str) -> None:
+        self.data_dir = pathlib.Path(data_dir)
+        self._outcomes = []
+        self._outcome_chunk = 0
+
+    def write(self, result_data: Dict[str, Any], supported_results: Sequence[str]) -> None:
+        """Writes the data files.
+
+        :param dict result_data: The result data as returned by :meth:`HtmlTestResult.make_result_data()
+          <anfema_django_testutils.runner.HtmlTestResult.make_result_data>`.
+        :param supported_results: The names of the results supported by the test runner.
+        """
+        self._outcomes = []
+        self._outcome_chunk = 0
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        for stale_outcomes_file in self.data_dir.glob('outcomes-*.js'):
+            stale_outcomes_file.unlink()
+
+        result_indexes = {result: idx for idx, result in enumerate(supported_results)}
+        with (self.data_dir / 'index.js').open('w', encoding='utf-8') as fp:
+            fp.write('testResultsViewer.loadIndex({')
+            fp.write(f'"results":{json.dumps(list(supported_results))},')
+            fp.write(f'"outcomeChunkSize":{self.outcome_chunk_size},')
+            fp.write('"testcases":[')
+            for idx, (testcase, testcase_results) in enumerate(result_data['testcases'].items()):
+                summary = testcase_results['summary']
+                testcase_data = {
+                    'name': testcase,
+                    'duration': summary['duration'].total_seconds(),
+                    'totals': summary['totals'],
+                    'counts': [summary[result] for result in supported_results],
+                    'tests': [
+                        [
+                            test.name,
+                            result_indexes[test.result],
+                            test.duration.total_seconds(),
+                            self._add_outcome(test.outcome),
+                            *self._get_query_stats(test),
+                        ]
+                        for test in testcase_results['tests']
+                    ],
+                }
+                fp.write(f'{"," if idx else ""}{json.dumps(testcase_data, separators=(",", ":"))}')
+            fp.write(']});\n')
+        self._flush_outcomes()
+
+    @staticmethod
+    def _get_query_stats(test) -> tuple:
+        if test.queries is None:
+            return ()
+        return test.queries, round(test.query_duration.total_seconds(), 6), bool(test.repeated_queries)
+
+    def _add_outcome(self, outcome: str) -> int:
+        """Buffers the outcome and returns its id, respectively -1 if there is no outcome."""
+        if not outcome:
+            return -1
+        outcome_id = self._outcome_chunk * self.outcome_chunk_size + len(self._outcomes)
+        self._outcomes.append(outcome)
+        if len(self._outcomes) >= self.outcome_chunk_size:
+            self._flush_outcomes()
+        return outcome_id
+
+    def _flush_outcomes(self) -> None:
+        if self._outcomes:
+            (self.data_dir / f'outcomes-{self._outcome_chunk}.js').write_text(
+                f'testResultsViewer.loadOutcomes({self._outcome_chunk},{json.dumps(self._outcomes)});\n',
+                encoding='utf-8',
+            )
+            self._outcomes = []
+            self._outcome_chunk += 1
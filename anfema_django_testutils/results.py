@@ -0,0 +1,81 @@
+"""This module provides the compact record of a test result."""
+from __future__ import annotations
+
+
+__all__ = ('TestResultData',)
+
+import sys
+import zlib
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    import datetime
+    from typing import Any, Dict, Optional, Tuple
+
+
+class TestResultData:
+    """The result of a single test, as kept by the test result for the report until the test run has been finished.
+
+    As a record is kept for each test of the test run, it only uses slots, interns its name, and optionally
+    stores its outcome (e.g. the traceback of a failure) zlib compressed, which is decompressed on access.
+
+    :param str name: The name of the test method or fixture.
+    :param str result: The result of the test, one of :attr:`HtmlTestResult.supported_results`.
+    :param timedelta duration: The duration of the test.
+    :param str outcome: The rendered traceback or skip reason.
+    :param int queries: The number of database queries, if the query stats are enabled.
+    :param timedelta query_duration: The total duration of the database queries, if the query stats are enabled.
+    :param repeated_queries: The normalized queries which have been repeated more often than the threshold, with
+      their number.
+    :param bool compress: Whether to store the outcome compressed.
+    """
+
+    __slots__ = ('name', 'result', 'duration', '_outcome', 'queries', 'query_duration', 'repeated_queries')
+
+    # Outcomes below this length are stored uncompressed, as they hardly get smaller.
+    compression_min_length = 512
+
+    def __init__(
+        self,
+        name: str,
+        result: str,
+        duration: datetime.timedelta,
+        outcome: str = '',
+        queries: Optional[int] = None,
+        query_duration: Optional[datetime.timedelta] = None,
+        repeated_queries: Tuple[Tuple[str, int], ...] = (),
+        *,
+        compress: bool = False,
+    ) -> None:
+        self.name = sys.intern(name)
+        self.result = result
+        self.duration = duration
+        self.queries = queries
+        self.query_duration = query_duration
+        self.repeated_queries = repeated_queries
+        self._outcome = (
+            zlib.compress(outcome.encode()) if compress and len(outcome) >= self.compression_min_length else outcome
+        )
+
+    @property
+    def outcome(self) -> str:
+        """The rendered traceback or skip reason."""
+        if isinstance(self._outcome, bytes):
+            return zlib.decompress(self._outcome).decode()
+        return self._outcome
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns the fields of the test result as dictionary."""
+        return {
+            'name': self.name,
+            'result': self.result,
+            'duration': self.duration,
+            'outcome': self.outcome,
+            'queries': self.queries,
+            'query_duration': self.query_duration,
+            'repeated_queries': self.repeated_queries,
+        }
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(name={self.name!r}, result={self.result!r}, duration={self.duration!r})'
@@ -7,16 +7,21 @@ __all__ = ('TestRunner',)
 import argparse
 import contextlib
 import datetime
-import itertools
+import functools
+import heapq
+import logging
+import multiprocessing.util
 import os
 import pathlib
 import re
 import sys
 import textwrap
+import time
 import unittest.runner
-from collections import defaultdict, namedtuple
+import weakref
+from collections import defaultdict
 from contextlib import nullcontext
-from operator import attrgetter
+from operator import itemgetter
 from typing import TYPE_CHECKING
 from unittest.result import TestResult
 from unittest.runner import TextTestRunner
@@ -27,20 +32,37 @@ from django.contrib.staticfiles import finders
 from django.core.management import color
 from django.core.management.base import OutputWrapper
 from django.template.loader import render_to_string
-from django.test.runner import DiscoverRunner
+from django.test.runner import (
+    DiscoverRunner,
+    ParallelTestSuite,
+    RemoteTestRunner,
+    _init_worker,
+    partition_suite_by_case,
+)
 from django.utils import termcolors, timezone
 
-from coverage import Coverage
+from coverage import Coverage, CoverageData
 from snapshottest.django import TestRunnerMixin as SnapshotTestRunnerMixin
 
+from .benchmarks import BenchmarkBaselines, BenchmarkResult
+from .databases import use_database_templates
+from .flakiness import FlakinessHistory
+from .history import DurationHistory
+from .impact import TestImpactMap, get_changed_files
+from .memory import MemoryStats, MemoryTracker, get_leaking_testcases
+from .profiling import TestProfiler
+from .queries import QueryCounter, QueryStats
+from .reports import JsonLinesResultSink, JUnitXmlReportWriter, LazyReportDataWriter
+from .results import TestResultData
 from .settings import get_config
+from .sharding import get_testcase_weights, parse_shard, partition_testcases
 
 
 # isort: off
 if TYPE_CHECKING:
     import types
     import unittest
-    from typing import Any, Dict, Tuple, Type, Union
+    from typing import Any, Dict, Iterator, List, Sequence, Tuple, Type, Union
 
     _SubTest = unittest.case._SubTest
     _SysExcInfoType = Union[
@@ -54,11 +76,42 @@ class CoverageContext(Coverage):
     """Context manager to start and stop code coverage.
 
     :param str report_dir: Path to where the coverage report shall be stored.
+    :param bool parallel: If set to :code:`True`, the coverage data of the parallel test worker processes
+      will be combined with the collected data before generating the report.
+    :param bool record_contexts: If set to :code:`True`, the coverage is recorded per test, and the
+      :class:`~anfema_django_testutils.impact.TestImpactMap` within the report directory gets updated.
+    :param str core: The coverage measurement core, i.e. :code:`"sysmon"`, :code:`"ctrace"` or
+      :code:`"pytrace"`. If not set, the core will be chosen by coverage.
+    :param report_formats: The formats of the coverage report, any of :code:`"html"`, :code:`"xml"` and
+      :code:`"json"`. Defaults to :code:`("html",)`.
+    :param \\**kwargs: Additional keyword arguments passed to :class:`coverage.Coverage`.
     """
 
-    def __init__(self, report_dir: str) -> None:
-        super().__init__()
+    def __init__(
+        self,
+        report_dir: str,
+        parallel: bool = False,
+        record_contexts: bool = False,
+        core: str = None,
+        report_formats: Sequence[str] = ("html",),
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
         self._report_dir = f"{report_dir}/coverage"
+        self._xml_report_file = f"{report_dir}/coverage.xml"
+        self._json_report_file = f"{report_dir}/coverage.json"
+        self._report_formats = report_formats
+        self._parallel = parallel
+        self._record_contexts = record_contexts
+        self._test_impact_map_file = f"{report_dir}/test-impact-map.json"
+        self._timestamp_start = None
+        if record_contexts:
+            self.set_option("html:show_contexts", True)
+        if core == "sysmon" and (sys.version_info < (3, 12) or record_contexts):
+            # sys.monitoring is only available as of Python 3.12, and doesn't support per-test contexts.
+            core = None
+        if core is not None:
+            self.set_option("run:core", core)
         self.stdout = OutputWrapper(sys.stdout)
         self.stderr = OutputWrapper(sys.stderr)
         self.style = color.no_style()
@@ -66,22 +119,109 @@ class CoverageContext(Coverage):
 
     def __enter__(self) -> CoverageContext:
         self.erase()
+        if self._parallel:
+            # Discard worker data files which might have been left behind by an aborted test run.
+            CoverageData(basename=self.get_option("run:data_file")).erase(parallel=True)
         self.start()
+        self._timestamp_start = time.perf_counter()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         self.stop()
+        timestamp_stop = time.perf_counter()
         self.save()
-        self.html_report(directory=self._report_dir)
-        self.stdout.write(f'Generated coverage report: "{pathlib.Path(self._report_dir, "index.html").absolute()}"')
+        if self._parallel:
+            self.combine()
+            self.save()
+        self.write_reports()
+        if self._record_contexts:
+            TestImpactMap(self._test_impact_map_file).update(self.get_data())
+            self.stdout.write(f'Updated test impact map: "{pathlib.Path(self._test_impact_map_file).absolute()}"')
+        if self._timestamp_start is not None:
+            self.write_overhead(timestamp_stop - self._timestamp_start, time.perf_counter() - timestamp_stop)
+
+    def write_reports(self) -> None:
+        """Generates the coverage reports of the configured formats.
+
+        The html report is generated incrementally by coverage: the pages of files whose source and coverage
+        data didn't change since the previous report are kept as they are, as long as the report directory
+        isn't removed.
+        """
+        if "html" in self._report_formats:
+            self.html_report(directory=self._report_dir)
+            self.stdout.write(
+                f'Generated coverage report: "{pathlib.Path(self._report_dir, "index.html").absolute()}"'
+            )
+        if "xml" in self._report_formats:
+            self.xml_report(outfile=self._xml_report_file)
+            self.stdout.write(f'Generated coverage XML report: "{pathlib.Path(self._xml_report_file).absolute()}"')
+        if "json" in self._report_formats:
+            self.json_report(outfile=self._json_report_file)
+            self.stdout.write(f'Generated coverage JSON report: "{pathlib.Path(self._json_report_file).absolute()}"')
+
+    def write_overhead(self, measured_duration: float, processing_duration: float) -> None:
+        """Writes the coverage core used and the time spent on processing the coverage data.
+
+        :param float measured_duration: The duration in seconds the coverage has been measured.
+        :param float processing_duration: The duration in seconds of saving, combining and reporting the data.
+        """
+        core = dict(self.sys_info()).get("core", "-none-")
+        share = processing_duration / measured_duration * 100 if measured_duration else 0.0
+        self.stdout.write(
+            f"Coverage (core: {core}, branch: {self.get_option('run:branch')}) measured {measured_duration:.2f}s, "
+            f"processing and reporting took {processing_duration:.2f}s ({share:.1f}% of the measured time)."
+        )
+
+    @classmethod
+    def get_coverage_options(cls, options: dict) -> Dict[str, Any]:
+        """Returns the keyword arguments for a :class:`CoverageContext` based on the test runner options."""
+        return {
+            'record_contexts': options.get("coverage_contexts_enabled", False),
+            'core': options.get("coverage_core"),
+            'branch': options.get("coverage_branch"),
+            'source': get_config()["COVERAGE_SOURCE"],
+            'report_formats': options.get("coverage_report_formats", ("html",)),
+        }
+
+    @classmethod
+    def start_worker_coverage(cls, report_dir: str, **kwargs) -> CoverageContext:
+        """Starts code coverage within a parallel test worker process.
+
+        The coverage data is saved into a suffixed data file as soon as the worker process exits,
+        so that it can be combined by the :class:`CoverageContext` of the parent process.
+
+        :param str report_dir: Path to where the coverage report shall be stored.
+        :param \\**kwargs: Additional keyword arguments passed to :class:`CoverageContext`.
+        """
+        worker_coverage = cls(report_dir, data_suffix=True, **kwargs)
+        worker_coverage.start()
+        multiprocessing.util.Finalize(None, cls._stop_worker_coverage, args=(worker_coverage,), exitpriority=1000)
+        return worker_coverage
+
+    @staticmethod
+    def _stop_worker_coverage(worker_coverage: CoverageContext) -> None:
+        worker_coverage.stop()
+        worker_coverage.save()
 
 
 class CodeCoverageTestRunnerMixin:
-    """A TestRunner mixin class which takes code coverage into account."""
+    """A TestRunner mixin class which takes code coverage into account.
+
+    If the tests are executed in parallel, code coverage is measured within each test worker process as
+    well, and the data of all processes is combined into a single report.
+    """
 
     def __init__(self, **kwargs) -> None:
         code_coverage_disabled = not kwargs["code_coverage_enabled"]
-        self._code_coverage = nullcontext() if code_coverage_disabled else CoverageContext(kwargs["report_dir"])
+        self._code_coverage = (
+            nullcontext()
+            if code_coverage_disabled
+            else CoverageContext(
+                kwargs["report_dir"],
+                parallel=kwargs.get("parallel", 0) > 1,
+                **CoverageContext.get_coverage_options(kwargs),
+            )
+        )
         super().__init__(**kwargs)
 
     def run_tests(self, test_labels, extra_tests=None, **kwargs) -> int:
@@ -89,6 +229,27 @@ class CodeCoverageTestRunnerMixin:
             return super().run_tests(test_labels, extra_tests, **kwargs)
 
 
+class DatabaseTemplateTestRunnerMixin:
+    """A TestRunner mixin class which creates the test databases from templates of previous test runs.
+
+    The migrated test databases are saved as templates, and later test runs create their test databases from
+    these templates instead of migrating them, as long as the migrations, models and fixtures haven't been
+    changed. The databases of parallel test workers are cloned from the test databases as usual.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        self._database_templates = (
+            use_database_templates(pathlib.Path(kwargs["report_dir"], "db-templates"))
+            if kwargs.get("database_templates_enabled")
+            else nullcontext()
+        )
+        super().__init__(**kwargs)
+
+    def setup_databases(self, **kwargs):
+        with self._database_templates:
+            return super().setup_databases(**kwargs)
+
+
 class HtmlTestResult(TestResult):
     options: dict  # Will be set by the TestRunner
 
@@ -97,12 +258,23 @@ class HtmlTestResult(TestResult):
         'failure',
         'unexpected_success',
         'precondition_failure',
+        'budget_exceeded',
         'expected_failure',
         'passed',
+        'flaky',
         'skipped',
     )
 
-    TestResultData = namedtuple('TestResultData', field_names=('name', 'result', 'duration', 'outcome'))
+    #: The results of the tests which are rerun, if rerunning failed tests is enabled.
+    rerun_results = ('error', 'failure', 'budget_exceeded')
+
+    #: The number of slowest tests to list the hot functions of within the report, if profiling is enabled.
+    profiled_slowest_tests = 20
+
+    #: The number of tests retaining the most memory to list within the report, if memory tracking is enabled.
+    memory_top_growers = 20
+
+    TestResultData = TestResultData
     _subtest_result_map: defaultdict[unittest.case.TestCase, list[tuple[_SubTest, str, _SysExcInfoType]]]
 
     @classmethod
@@ -130,53 +302,337 @@ class HtmlTestResult(TestResult):
             style.RESULT_EXPECTED_FAILURE = termcolors.make_style(fg='magenta', opts=('bold',))
             style.RESULT_UNEXPECTED_SUCCESS = termcolors.make_style(fg='yellow', opts=('bold',))
             style.RESULT_PRECONDITION_FAILURE = termcolors.make_style(fg='yellow', opts=('bold',))
+            style.RESULT_BUDGET_EXCEEDED = termcolors.make_style(fg='cyan', opts=('bold',))
+            style.RESULT_FLAKY = termcolors.make_style(fg='blue', opts=('bold',))
 
         return style
 
-    def __init__(self, *args, tests=None, **kwargs) -> None:
+    def __init__(self, *args, tests: dict[str, list[weakref.ref]] = None, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.dots = False
         self.showAll = False
-        self.passed = []
         self.precondition_failures = []
+        self.budget_exceeded = []
+        self.flaky = []
         self.timestamp_start_testrun = None
         self.timestamp_stop_testrun = None
         self._test_result_data = defaultdict(list)
+        self._test_result_summary = self._create_result_summary()
+        self._testcase_result_summaries = defaultdict(self._create_result_summary)
         self._subtest_result_map = defaultdict(list)
-        self._all_tests = tests
+        # The tests are only referenced weakly, so that they can be released once they have been run.
+        self._tests_by_testcase = tests or {}
+        self._failed_tests = {}
+        self._result_sink = None
+        self._profiler = (
+            TestProfiler(pathlib.Path(self.options.get('report_dir'), 'profile'))
+            if self.options.get('profile_enabled')
+            else None
+        )
+        self._profile_hotspots = {}
+        self._query_counter = None
+        self._benchmark_baselines = (
+            BenchmarkBaselines(pathlib.Path(report_dir, 'benchmark-baselines.json'))
+            if (report_dir := self.options.get('report_dir'))
+            else None
+        )
+        self._benchmark_results = {}
+        self._flaky_tests = {}
+        self._memory_tracker = MemoryTracker() if self.options.get('memory_tracking_enabled') else None
+        self._memory_stats = {}
 
         self.stdout = OutputWrapper(sys.stdout)
         self.stderr = OutputWrapper(sys.stderr)
         self.style = self.create_color_style()
         self.stderr.style_func = self.style.ERROR
 
-    def _add_test_result_data(self, test, result, outcome=None) -> None:
+    def _add_test_result_data(self, test, result, outcome=None, duration=None, query_stats=None) -> None:
         if isinstance(test, _ErrorHolder):
-            # In case an _ErrorHolder instance has been passed, which means setting up the testcase has been failed,
-            # none of the testcase`s test methods have been executed, and thus they will all be set to the same result.
-            parent = re.search(r'\((.+)\)', test.description).group(1)
-            module, testcase_name = parent.rsplit('.', 1)
-            testcase_class = getattr(sys.modules[module], testcase_name)
-            for test in filter(lambda testmethod: isinstance(testmethod, testcase_class), self._all_tests):
-                self._add_test_result_data(test, result, outcome)
+            fixture, parent = self._parse_error_holder(test)
+            if fixture.startswith('setUp') and (tests := self._get_fixture_tests(parent)):
+                # In case setting up a testcase or module has been failed, none of its test methods have been
+                # executed, and thus they will all be set to the same result.
+                for test in tests:
+                    self._add_test_result_data(test, result, outcome, duration)
+            else:
+                # Tearing down a testcase or module happens after its test methods have been finished,
+                # so the fixture`s result will be added additionally.
+                self._record_test_result_data(test, parent, fixture, result, outcome, duration, query_stats)
         else:
+            self._record_test_result_data(
+                test,
+                sys.intern(strclass(type(test))),
+                getattr(test, '_testMethodName'),
+                result,
+                outcome,
+                duration,
+                query_stats or self._get_query_stats(test),
+            )
+
+    def _record_test_result_data(
+        self, test, testcase, name, result, outcome=None, duration=None, query_stats=None
+    ) -> None:
+        if duration is None:
             timestamp = getattr(test, 'timestamp', None)
             duration = (timezone.now() - timestamp) if timestamp else datetime.timedelta(0)
-            self._test_result_data[strclass(type(test))].append(
-                HtmlTestResult.TestResultData(getattr(test, '_testMethodName'), result, duration, outcome or '')
+        self._test_result_data[testcase].append(
+            test_result_data := HtmlTestResult.TestResultData(
+                name,
+                result,
+                duration,
+                outcome or '',
+                *(query_stats or ()),
+                compress=bool(self.options.get('traceback_compression_enabled')),
             )
+        )
+        if self.options.get('rerun_failures') and result in self.rerun_results and not isinstance(test, _ErrorHolder):
+            # Failed tests are kept to be rerun, whereas all other tests are released once they have been run.
+            self._failed_tests[testcase, name] = test
+        if self._result_sink is not None:
+            self._write_result_record(testcase, test_result_data)
+
+        # Keep the summaries up-to-date, so that they don't need to be recomputed from all test results.
+        for summary in (self._test_result_summary, self._testcase_result_summaries[testcase]):
+            summary['duration'] += duration
+            summary['totals'] += 1
+            summary[result] += 1
+
+        self.testsRun = self._test_result_summary['totals']
+        self.print_test_result(test, result)
+
+    def _write_result_record(self, testcase: str, test_result_data: TestResultData) -> None:
+        self._result_sink.write(
+            {
+                'testcase': testcase,
+                **test_result_data.as_dict(),
+                'duration': test_result_data.duration.total_seconds(),
+                'query_duration': (
+                    test_result_data.query_duration.total_seconds()
+                    if test_result_data.query_duration is not None
+                    else None
+                ),
+            }
+        )
 
-            self.testsRun = sum(map(len, self._test_result_data.values()))
-            self.print_test_result(test, result)
+    def _get_query_stats(self, test: unittest.case.TestCase) -> QueryStats | None:
+        """Returns the database queries of the given test, if it is the currently running test and the query
+        stats are enabled."""
+        if self._query_counter is not None and self._query_counter.test is test:
+            return self._query_counter.get_stats(self.options.get('query_repeat_threshold'))
+        return None
+
+    @staticmethod
+    def _parse_error_holder(test: _ErrorHolder) -> tuple[str, str]:
+        """Returns the fixture name (e.g. ``setUpClass``) and the testcase or module name of an _ErrorHolder."""
+        if match := re.fullmatch(r'(\w+) \((.+)\)', test.description):
+            return match.group(1), sys.intern(match.group(2))
+        description = sys.intern(test.description)
+        return description, description
+
+    def _get_fixture_tests(self, parent: str) -> list[unittest.case.TestCase]:
+        """Returns the tests of the testcase or module with the given name, which haven't been released yet."""
+        if parent in self._tests_by_testcase:
+            return [test for test_ref in self._tests_by_testcase[parent] if (test := test_ref()) is not None]
+        return [
+            test
+            for test_refs in self._tests_by_testcase.values()
+            for test_ref in test_refs
+            if (test := test_ref()) is not None and type(test).__module__ == parent
+        ]
+
+    def analyze_durations(self, result_data: dict) -> None:
+        """Analyzes the durations of the tests of the test run.
+
+        If the duration history is enabled, the durations are stored into the history file within the report
+        directory, and the tests which got significantly slower than their rolling median are added to the
+        result data as ``duration_regressions``. If the ``slowest`` option is set, the slowest tests are
+        printed to the console.
+        """
+        durations = [
+            (f'{testcase}.{test.name}', test.duration.total_seconds())
+            for testcase, testcase_results in result_data['testcases'].items()
+            for test in testcase_results['tests']
+            if test.result != 'skipped'
+        ]
+        medians = {}
+        if self.options.get('duration_history_enabled'):
+            with DurationHistory(pathlib.Path(self.options.get('report_dir'), 'test-durations.sqlite3')) as history:
+                medians = history.get_medians()
+                result_data['duration_regressions'] = history.get_regressions(durations, medians)
+                history.add_run(self.timestamp_start_testrun, durations)
+
+        if slowest := self.options.get('slowest'):
+            self.print_slowest_tests(heapq.nlargest(slowest, durations, key=itemgetter(1)), medians)
+
+    def get_profile_hotspots(self, result_data: dict) -> List[Dict[str, Any]]:
+        """Returns the hot functions of the slowest profiled tests."""
+        slowest_tests = heapq.nlargest(
+            self.profiled_slowest_tests,
+            (
+                (testcase, test)
+                for testcase, testcase_results in result_data['testcases'].items()
+                for test in testcase_results['tests']
+                if (testcase, test.name) in self._profile_hotspots
+            ),
+            key=lambda item: item[1].duration,
+        )
+        return [
+            {
+                'testcase': testcase,
+                'name': test.name,
+                'duration': test.duration,
+                'profile_file': f'profile/{testcase}.pstats',
+                'functions': self._profile_hotspots[testcase, test.name],
+            }
+            for testcase, test in slowest_tests
+        ]
+
+    def rerun_failures(self) -> None:
+        """Reruns the failed tests up to ``rerun_failures`` times, once all tests have been run.
+
+        Tests which pass on a rerun are deemed flaky and get the result ``flaky``, whereby the outcome of their
+        failure is kept. How often each test has been flaky is counted across test runs within the
+        :file:`flaky-tests.json` file within the report directory.
+        """
+        reruns = self.options.get('rerun_failures')
+        tests = list(self._failed_tests.values())
+        if tests and self._result_sink is not None:
+            # The failures are streamed before rerunning them, so that they are kept if the test run gets killed.
+            self._result_sink.flush()
+
+        for attempt in range(1, reruns + 1):
+            if not tests or self.shouldStop:
+                break
+            self.stdout.write()
+            self.stdout.write(f'Rerunning {len(tests)} failed tests (attempt {attempt} of {reruns}):')
+            rerun_result = type(self)(tests=self._tests_by_testcase)
+            rerun_result.stdout = self.stdout
+            unittest.TestSuite(tests)(rerun_result)
+            passed_tests = {
+                (testcase, test_result_data.name)
+                for testcase, testcase_results in rerun_result._test_result_data.items()
+                for test_result_data in testcase_results
+                if test_result_data.result == 'passed'
+            }
+            for test in tests:
+                if (strclass(type(test)), test._testMethodName) in passed_tests:
+                    self.addFlaky(test, attempt)
+            tests = [test for test in tests if (strclass(type(test)), test._testMethodName) not in passed_tests]
+
+        self.count_flaky_tests()
+
+    def count_flaky_tests(self, add_run: bool = True) -> None:
+        """Counts how often each flaky test has been flaky across test runs within the :file:`flaky-tests.json`
+        file within the report directory, and prints the flaky tests.
+
+        :param bool add_run: Whether to add the flaky tests of this test run to the counts.
+        """
+        if self._flaky_tests and (report_dir := self.options.get('report_dir')):
+            history = FlakinessHistory(pathlib.Path(report_dir, 'flaky-tests.json'))
+            if add_run:
+                history.add_run(self.timestamp_start_testrun, self._flaky_tests)
+            self.stdout.write()
+            self.stdout.write(f'Flaky tests ({len(self._flaky_tests)}):')
+            for test_id, flaky_test in self._flaky_tests.items():
+                flaky_test['count'] = history.get_count(test_id)
+                self.stdout.write(
+                    f"{test_id}  (passed on rerun {flaky_test['attempt']}, flaky in {flaky_test['count']} runs)"
+                )
+
+    def addFlaky(self, test: unittest.case.TestCase, attempt: int) -> None:
+        """Called when a failed test passed on a rerun.
+
+        The failure of the test has already been streamed into the JSON Lines file, thus an additional record
+        with the result ``flaky`` and the ``rerun_attempt`` is streamed.
+        """
+        testcase, name = key = self._get_test_key(test)
+        testcase_results = self._test_result_data[testcase]
+        for test_result_data in testcase_results:
+            if test_result_data.name == name and test_result_data.result in self.rerun_results:
+                for summary in (self._test_result_summary, self._testcase_result_summaries[testcase]):
+                    summary[test_result_data.result] -= 1
+                    summary['flaky'] += 1
+                test_result_data.result = 'flaky'
+                self.flaky.append((test, test_result_data.outcome))
+                break
+        for errors in (self.errors, self.failures, self.budget_exceeded):
+            errors[:] = [
+                error for error in errors if self._get_test_key(getattr(error[0], 'test_case', error[0])) != key
+            ]
+        self._flaky_tests[f'{testcase}.{name}'] = {'testcase': testcase, 'name': name, 'attempt': attempt}
+        if self._result_sink is not None:
+            self._result_sink.write({'testcase': testcase, 'name': name, 'result': 'flaky', 'rerun_attempt': attempt})
+
+    def _get_test_key(self, test: unittest.case.TestCase) -> tuple[str, str]:
+        """Returns the testcase and the name of a test, respectively of the fixture of an _ErrorHolder."""
+        if isinstance(test, _ErrorHolder):
+            fixture, parent = self._parse_error_holder(test)
+            return parent, fixture
+        return strclass(type(test)), test._testMethodName
+
+    def get_memory_growers(self) -> List[Dict[str, Any]]:
+        """Returns the tests which retained the most memory."""
+        return [
+            {'testcase': testcase, 'name': name, 'memory': memory_stats}
+            for (testcase, name), memory_stats in heapq.nlargest(
+                self.memory_top_growers, self._memory_stats.items(), key=lambda item: item[1].retained
+            )
+        ]
+
+    def get_repeated_queries(self, result_data: dict) -> List[Dict[str, Any]]:
+        """Returns the queries which have been repeated by a test more often than the threshold, most repeated
+        first, as they likely indicate an N+1 query problem."""
+        repeated_queries = [
+            {'testcase': testcase, 'name': test.name, 'query': query, 'count': count}
+            for testcase, testcase_results in result_data['testcases'].items()
+            for test in testcase_results['tests']
+            for query, count in test.repeated_queries
+        ]
+        return sorted(repeated_queries, key=itemgetter('count'), reverse=True)
 
     def create_report(self, result_data: dict) -> None:
+        if self._flaky_tests:
+            result_data['flaky_tests'] = list(self._flaky_tests.values())
+
+        if self._benchmark_results:
+            self._benchmark_baselines.update(self._benchmark_results)
+            result_data['benchmarks'] = sorted(self._benchmark_results.items())
+
+        if self._memory_tracker is not None:
+            result_data['memory_growers'] = self.get_memory_growers()
+            result_data['leaking_testcases'] = get_leaking_testcases(
+                ((testcase, memory_stats) for (testcase, _), memory_stats in self._memory_stats.items()),
+                self.options.get('memory_leak_threshold'),
+            )
+            self.print_leaking_testcases(result_data['leaking_testcases'])
+
+        if self.options.get('query_stats_enabled'):
+            result_data['repeated_queries'] = self.get_repeated_queries(result_data)
+
+        if self._profiler is not None:
+            profile_file = self._profiler.save()
+            result_data['profile_hotspots'] = self.get_profile_hotspots(result_data)
+            self.stdout.write(f'Generated profile: "{profile_file.absolute()}"')
+
+        if self.options.get('junit_xml_results_enabled'):
+            results_xml_file = pathlib.Path(self.options.get('report_dir'), 'test-results.xml')
+            JUnitXmlReportWriter(results_xml_file).write(result_data, title=self.options.get('report_title'))
+            self.stdout.write(f'Generated JUnit XML report: "{results_xml_file.absolute()}"')
+
         if self.options.get('html_results_enabled'):
             # Create report directory
             report_dir = pathlib.Path(self.options.get('report_dir'))
             report_dir.mkdir(exist_ok=True)
 
             # Create html test report
-            html_template = get_config()['TEST_REPORT_HTML_TEMPLATE']
+            if self.options.get('html_results_mode') == 'lazy':
+                # Only the summary will be rendered, the viewer loads the test results from separate data files.
+                LazyReportDataWriter(report_dir / 'test-results-data').write(result_data, self.supported_results)
+                html_template = 'test-results-lazy-template.html'
+                js_file_name = 'test-results-lazy.js'
+            else:
+                html_template = get_config()['TEST_REPORT_HTML_TEMPLATE']
+                js_file_name = 'test-results.js'
             result_data['supported_results'] = self.supported_results
             result_data['title'] = self.options.get('report_title')
             html_data = render_to_string(html_template, context=result_data)
@@ -189,74 +645,82 @@ class HtmlTestResult(TestResult):
                 if not css_file.is_absolute():
                     css_file = pathlib.Path(finders.find(css_file))
                 results_html_file.with_name(css_file.name).write_text(css_file.read_text())
-            js_file = pathlib.Path(finders.find(pathlib.Path('js', 'test-results.js')))
-            (report_dir / 'test-results.js').write_text(js_file.read_text())
+            js_file = pathlib.Path(finders.find(pathlib.Path('js', js_file_name)))
+            (report_dir / js_file_name).write_text(js_file.read_text())
             self.stdout.write(f'Generated test report: "{results_html_file.absolute()}"')
 
     def make_result_data(self) -> Dict[str, Any]:
-        test_suite_exec_summary = dict()
-        test_suite_exec_summary['testcases'] = {}
-        test_suite_exec_summary.setdefault(
-            'summary',
-            dict(  # noqa: C406
-                [
-                    ('duration', datetime.timedelta()),
-                    ('totals', 0),
-                    ('timestamp', self.timestamp_start_testrun),
-                    *dict.fromkeys(self.supported_results, 0).items(),
-                ]
-            ),
+        return {
+            'testcases': {
+                testcase: {'tests': tests, 'summary': self._testcase_result_summaries[testcase]}
+                for testcase, tests in self._test_result_data.items()
+            },
+            'summary': {**self._test_result_summary, 'timestamp': self.timestamp_start_testrun},
+        }
+
+    def _create_result_summary(self) -> Dict[str, Any]:
+        return dict(  # noqa: C406
+            [
+                ('duration', datetime.timedelta()),
+                ('totals', 0),
+                *dict.fromkeys(self.supported_results, 0).items(),
+            ]
         )
 
-        for testcase, tests in self._test_result_data.items():
-            test_suite_exec_summary['summary']['totals'] += len(tests)
-
-            for test_result in tests:
-                test_case_execution = test_suite_exec_summary['testcases'].setdefault(testcase, {})
-                test_case_executed_tests = test_case_execution.setdefault('tests', [])
-                test_case_execution_summary = test_case_execution.setdefault(
-                    'summary',
-                    dict(  # noqa: C406
-                        [
-                            ('duration', datetime.timedelta()),
-                            ('totals', 0),
-                            *dict.fromkeys(self.supported_results, 0).items(),
-                        ]
-                    ),
-                )
-
-                test_suite_exec_summary['summary']['duration'] += test_result.duration
-                test_suite_exec_summary['summary'][test_result.result] += 1
-                test_case_execution_summary['duration'] += test_result.duration
-                test_case_execution_summary['totals'] += 1
-                test_case_execution_summary[test_result.result] += 1
-                test_case_executed_tests.append(test_result)
-
-        return test_suite_exec_summary
-
     def startTestRun(self) -> None:
         """Called once before any tests are executed."""
         self.timestamp_start_testrun = timezone.now()
         self.timestamp_stop_testrun = None
+        if self.options.get('jsonl_results_enabled'):
+            self._result_sink = JsonLinesResultSink(pathlib.Path(self.options.get('report_dir'), 'test-results.jsonl'))
+            self._result_sink.open()
+        if self._profiler is not None:
+            self._profiler.clear()
         self.stdout.write()
 
     def startTest(self, test: unittest.case.TestCase) -> None:
         """Called when the given test is about to be run"""
         test.timestamp = test.start_time = timezone.now()
+        if self._benchmark_baselines is not None:
+            test.benchmark_baselines = self._benchmark_baselines
+        if self.options.get('coverage_contexts_enabled') and (coverage := Coverage.current()):
+            coverage.switch_context(test.id())
         super().startTest(test)
+        if self.options.get('query_stats_enabled'):
+            self._query_counter = QueryCounter(test)
+            self._query_counter.install()
+        if self._memory_tracker is not None:
+            self._memory_tracker.start()
+        if self._profiler is not None:
+            self._profiler.start()
 
     def stopTestRun(self) -> None:
         """Called once after all tests are executed."""
         super().stopTestRun()
         self.timestamp_stop_testrun = timezone.now()
+        if self._result_sink is not None:
+            self._result_sink.close()
+        if self._memory_tracker is not None:
+            self._memory_tracker.stop_tracing()
 
     def stopTest(self, test: unittest.case.TestCase) -> None:
         """Called when the given test has been run"""
+        if self._memory_tracker is not None and (memory_stats := self._memory_tracker.stop()) is not None:
+            self.addMemoryStats(test, memory_stats)
+        if self._profiler is not None:
+            self.addProfileHotspots(test, self._profiler.stop(strclass(type(test))))
+        if (benchmark_result := getattr(test, 'benchmark_result', None)) is not None:
+            self.addBenchmarkResult(test, benchmark_result)
         super().stopTest(test)
         test.stop_time = timezone.now()
+        if self.options.get('coverage_contexts_enabled') and (coverage := Coverage.current()):
+            coverage.switch_context('')
         if subtests_results := self._subtest_result_map.pop(test, None):
             result, outcome = self._resolve_subtests_results(test, subtests_results)
             self._add_test_result_data(test, result, outcome)
+        if self._query_counter is not None:
+            self._query_counter.uninstall()
+            self._query_counter = None
 
     def addSkip(self, test: unittest.case.TestCase, reason: str) -> None:
         """Called when a test is skipped."""
@@ -265,7 +729,7 @@ class HtmlTestResult(TestResult):
 
     def addSuccess(self, test: unittest.case.TestCase) -> None:
         """Called when a test has completed successfully"""
-        self.passed.append((test, ''))
+        # Passed tests are only counted, so that their instances can be released.
         self._add_test_result_data(test, 'passed')
 
     def addUnexpectedSuccess(self, test: unittest.case.TestCase) -> None:
@@ -277,9 +741,10 @@ class HtmlTestResult(TestResult):
         """Called when an error has occurred."""
         if getattr(err[1], '__precondition_failure__', None):
             self.addPreconditionFailure(test, err)
+        elif getattr(err[1], '__budget_exceeded__', None):
+            self.addBudgetExceeded(test, err)
         else:
-            super().addFailure(test, err)
-            self._add_test_result_data(test, 'failure', self._exc_info_to_string(err, test))
+            self._add_error(self.failures, test, 'failure', err)
 
     def addExpectedFailure(self, test: unittest.case.TestCase, err: _SysExcInfoType) -> None:
         """Called when an expected failure/error occurred."""
@@ -290,15 +755,29 @@ class HtmlTestResult(TestResult):
         """Called when an error has occurred."""
         if getattr(err[1], '__precondition_failure__', None):
             self.addPreconditionFailure(test, err)
+        elif getattr(err[1], '__budget_exceeded__', None):
+            self.addBudgetExceeded(test, err)
         else:
-            super().addError(test, err)
-            self._add_test_result_data(test, 'error', self._exc_info_to_string(err, test))
+            self._add_error(self.errors, test, 'error', err)
 
     def addPreconditionFailure(self, test: unittest.case.TestCase, err: _SysExcInfoType) -> None:
         """Called when a precondition error has occurred."""
-        self.precondition_failures.append((test, self._exc_info_to_string(err, test)))
+        self._add_error(self.precondition_failures, test, 'precondition_failure', err)
+
+    def addBudgetExceeded(self, test: unittest.case.TestCase, err: _SysExcInfoType) -> None:
+        """Called when a performance budget has been exceeded."""
+        self._add_error(self.budget_exceeded, test, 'budget_exceeded', err)
+
+    def _add_error(
+        self, errors: list, test: unittest.case.TestCase, result: str, err: _SysExcInfoType
+    ) -> None:
+        # The traceback is rendered once, and shared by the errors list and the test result data.
+        outcome = self._exc_info_to_string(err, test)
+        errors.append((test, outcome))
         self._mirrorOutput = True
-        self._add_test_result_data(test, 'precondition_failure', self._exc_info_to_string(err, test))
+        if result in ('error', 'failure') and getattr(self, 'failfast', False):
+            self.stop()
+        self._add_test_result_data(test, result, outcome)
 
     def addSubTest(self, test: unittest.case.TestCase, subtest, err: _SysExcInfoType) -> None:
         """Called at the end of a subtest."""
@@ -306,7 +785,9 @@ class HtmlTestResult(TestResult):
             self._apply_subtest_result(test, subtest, err)
             if getattr(self, 'failfast', False):
                 self.stop()
-            if issubclass(err[0], test.failureException):
+            if getattr(err[1], '__budget_exceeded__', None):
+                errors = self.budget_exceeded
+            elif issubclass(err[0], test.failureException):
                 errors = self.failures
             elif issubclass(err[0], test.preconditionFailureException):
                 errors = self.precondition_failures
@@ -315,9 +796,91 @@ class HtmlTestResult(TestResult):
             errors.append((subtest, self._exc_info_to_string(err, test)))
             self._mirrorOutput = True
 
+    def addRemoteTestResult(
+        self,
+        test: unittest.case.TestCase,
+        result: str,
+        duration: datetime.timedelta,
+        outcome: str,
+        error_holder_description: str = None,
+        query_stats: QueryStats = None,
+    ) -> None:
+        """Called when a test result has been received from a parallel test worker process.
+
+        The result has already been resolved by the :class:`RemoteHtmlTestResult` of the worker process,
+        thus *outcome* is the rendered traceback or skip reason rather than a ``sys.exc_info()`` tuple,
+        and *query_stats* are the test's database queries, if the query stats are enabled.
+        """
+        if error_holder_description is not None:
+            test = _ErrorHolder(error_holder_description)
+
+        if result == 'flaky':
+            self.flaky.append((test, outcome))
+        elif result == 'skipped':
+            self.skipped.append((test, outcome))
+        elif result == 'expected_failure':
+            self.expectedFailures.append((test, outcome))
+        elif result == 'unexpected_success':
+            self.unexpectedSuccesses.append(test)
+        elif result != 'passed':
+            if result == 'error':
+                errors = self.errors
+            elif result == 'failure':
+                errors = self.failures
+            elif result == 'budget_exceeded':
+                errors = self.budget_exceeded
+            else:
+                errors = self.precondition_failures
+            errors.append((test, outcome))
+            self._mirrorOutput = True
+            if getattr(self, 'failfast', False):
+                self.stop()
+
+        self._add_test_result_data(test, result, outcome, duration, query_stats)
+
+    def add_result_record(self, record: Dict[str, Any]) -> None:
+        """Adds a test result record as written by the :class:`~anfema_django_testutils.reports.JsonLinesResultSink`,
+        e.g. of another test run.
+        """
+        if 'rerun_attempt' in record:
+            self.addFlaky(_ErrorHolder(f"{record['name']} ({record['testcase']})"), record['rerun_attempt'])
+            return
+        query_stats = None
+        if record.get('queries') is not None:
+            query_stats = QueryStats(
+                record['queries'],
+                datetime.timedelta(seconds=record['query_duration']),
+                tuple(map(tuple, record['repeated_queries'])),
+            )
+        # The test instance isn't available anymore, but an _ErrorHolder restores the testcase and the name.
+        self.addRemoteTestResult(
+            _ErrorHolder(f"{record['name']} ({record['testcase']})"),
+            record['result'],
+            datetime.timedelta(seconds=record['duration']),
+            record['outcome'],
+            query_stats=query_stats,
+        )
+
+    def addProfileHotspots(self, test: unittest.case.TestCase, hotspots: List[Tuple[str, float, float]]) -> None:
+        """Called when the given test has been profiled, with the functions with the most own time."""
+        self._profile_hotspots[strclass(type(test)), getattr(test, '_testMethodName')] = hotspots
+
+    def addBenchmarkResult(self, test: unittest.case.TestCase, benchmark_result: BenchmarkResult) -> None:
+        """Called when the given test has been benchmarked."""
+        self._benchmark_results[test.id()] = benchmark_result
+
+    def addMemoryStats(self, test: unittest.case.TestCase, memory_stats: MemoryStats) -> None:
+        """Called when the memory usage of the given test has been tracked."""
+        self._memory_stats[strclass(type(test)), getattr(test, '_testMethodName')] = memory_stats
+
+    def save_profile(self) -> None:
+        """Stores the profiles of the testcases profiled so far, if profiling is enabled."""
+        if self._profiler is not None:
+            self._profiler.save_testcase_stats()
+
     def wasSuccessful(self) -> bool:
         """Tells whether or not this result was a success."""
-        return len(self.precondition_failures) == 0 and super().wasSuccessful()
+        return len(self.precondition_failures) == len(self.budget_exceeded) == 0 and super().wasSuccessful()
 
     def print_test_result(self, test: unittest.case.TestCase, result: str) -> None:
         max_result_width = max(map(len, self.supported_results)) + 10
@@ -329,30 +892,49 @@ class HtmlTestResult(TestResult):
         self.stdout.write(" " + str(test))
 
     def printErrors(self) -> None:
-        results = list(map(attrgetter('result'), itertools.chain.from_iterable(self._test_result_data.values())))
-        skipped = results.count('skipped')
-        passed = results.count('passed')
-        expected_failures = results.count('expected_failure')
-        precondition_failures = results.count('precondition_failure')
-        failures = results.count('failure')
-        unexpected_successes = results.count('unexpected_success')
-        errors = results.count('error')
+        skipped = self._test_result_summary['skipped']
+        passed = self._test_result_summary['passed']
+        expected_failures = self._test_result_summary['expected_failure']
+        precondition_failures = self._test_result_summary['precondition_failure']
+        budgets_exceeded = self._test_result_summary['budget_exceeded']
+        flaky = self._test_result_summary['flaky']
+        failures = self._test_result_summary['failure']
+        unexpected_successes = self._test_result_summary['unexpected_success']
+        errors = self._test_result_summary['error']
 
         style = self.style.SUCCESS if self.wasSuccessful() else self.style.ERROR
 
         self.stdout.write()
         self.stdout.write(
             style(
-                f'{"OK" if self.wasSuccessful() else "FAILED"} (skipped={skipped}, passed={passed}, '
+                f'{"OK" if self.wasSuccessful() else "FAILED"} (skipped={skipped}, passed={passed}, flaky={flaky}, '
                 f'expected failures={expected_failures}, precondition failures={precondition_failures}, '
+                f'budgets exceeded={budgets_exceeded}, '
                 f'failures={failures}, unexpected successes={unexpected_successes}, errors={errors})'
             )
         )
 
+    def print_slowest_tests(self, durations: List[Tuple[str, float]], medians: Dict[str, float]) -> None:
+        self.stdout.write()
+        self.stdout.write(f'Slowest {len(durations)} tests:')
+        for test_id, duration in durations:
+            median = medians.get(test_id)
+            self.stdout.write(
+                f'{duration:10.3f}s  {test_id}' + (f'  (rolling median {median:.3f}s)' if median is not None else '')
+            )
+
+    def print_leaking_testcases(self, leaking_testcases: List[Tuple[str, int]]) -> None:
+        if not leaking_testcases:
+            return
+        self.stdout.write()
+        self.stdout.write(f'Testcases with growing retained memory ({len(leaking_testcases)}):')
+        for testcase, retained in leaking_testcases:
+            self.stdout.write(f'{retained / 2**20:10.2f}MiB  {testcase}')
+
     def _resolve_subtests_results(
         self, test: unittest.case.TestCase, results: list[tuple[_SubTest, str, _SysExcInfoType]]
     ) -> tuple[str, str]:
-        result_priority_map = {'error': 1, 'failure': 2, 'precondition_failure': 3}
+        result_priority_map = {'error': 1, 'failure': 2, 'budget_exceeded': 3, 'precondition_failure': 4}
         reverse_result_priority_map = {v: k for k, v in result_priority_map.items()}
         outcome = ''
         result_priority = max(reverse_result_priority_map) + 1
@@ -377,6 +959,8 @@ class HtmlTestResult(TestResult):
     def _apply_subtest_result(self, test: unittest.case.TestCase, subtest: _SubTest, err: _SysExcInfoType) -> None:
         if getattr(err[1], '__precondition_failure__', None):
             result = 'precondition_failure'
+        elif getattr(err[1], '__budget_exceeded__', None):
+            result = 'budget_exceeded'
         elif issubclass(err[0], test.failureException):
             result = 'failure'
         else:
@@ -384,6 +968,102 @@ class HtmlTestResult(TestResult):
         self._subtest_result_map[test].append((subtest, result, err))
 
 
+class RemoteHtmlTestResult(HtmlTestResult):
+    """Records the test results within a parallel test worker process.
+
+    Rather than pickling the raw ``sys.exc_info()`` tuples like Django's
+    :class:`~django.test.runner.RemoteTestResult`, each test result is resolved (including precondition
+    failures and subtest results) and rendered within the worker process. The parent process replays
+    the recorded ``addRemoteTestResult`` events on its :class:`HtmlTestResult`.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.events = []
+
+    @property
+    def test_index(self) -> int:
+        return self.testsRun - 1
+
+    def _add_test_result_data(self, test, result, outcome=None, duration=None, query_stats=None) -> None:
+        if isinstance(test, _ErrorHolder):
+            # The testcase`s tests are unknown to the worker process, so let the parent process resolve them.
+            self.events.append(('addRemoteTestResult', self.test_index, result, None, outcome or '', test.description))
+        else:
+            timestamp = getattr(test, 'timestamp', None)
+            duration = (timezone.now() - timestamp) if timestamp else datetime.timedelta(0)
+            self.events.append(
+                (
+                    'addRemoteTestResult',
+                    self.test_index,
+                    result,
+                    duration,
+                    outcome or '',
+                    None,
+                    self._get_query_stats(test),
+                )
+            )
+
+    def addDuration(self, test: unittest.case.TestCase, elapsed: float) -> None:
+        """Called when a test finished to run, regardless of its outcome."""
+        super().addDuration(test, elapsed)
+        self.events.append(('addDuration', self.test_index, elapsed))
+
+    def addProfileHotspots(self, test: unittest.case.TestCase, hotspots: List[Tuple[str, float, float]]) -> None:
+        self.events.append(('addProfileHotspots', self.test_index, hotspots))
+
+    def addBenchmarkResult(self, test: unittest.case.TestCase, benchmark_result: BenchmarkResult) -> None:
+        self.events.append(('addBenchmarkResult', self.test_index, benchmark_result))
+
+    def addMemoryStats(self, test: unittest.case.TestCase, memory_stats: MemoryStats) -> None:
+        self.events.append(('addMemoryStats', self.test_index, memory_stats))
+
+
+class RemoteHtmlTestRunner(RemoteTestRunner):
+    resultclass = RemoteHtmlTestResult
+
+    def run(self, test: unittest.suite.TestSuite) -> RemoteHtmlTestResult:
+        result = super().run(test)
+        # The profiles are stored by each worker process, and combined by the parent process.
+        result.save_profile()
+        return result
+
+
+def _setup_html_worker(options: dict) -> None:
+    """Provides the test runner options to spawned parallel test worker processes."""
+    HtmlTestResult.options = options
+
+
+def _init_html_worker(counter, *args) -> None:
+    """Initializes a parallel test worker process and starts its code coverage, if enabled."""
+    _init_worker(counter, *args)
+    if HtmlTestResult.options.get("code_coverage_enabled"):
+        CoverageContext.start_worker_coverage(
+            HtmlTestResult.options["report_dir"], **CoverageContext.get_coverage_options(HtmlTestResult.options)
+        )
+
+
+class HtmlParallelTestSuite(ParallelTestSuite):
+    """Runs the tests in parallel and streams their html test results back to the parent process."""
+
+    runner_class = RemoteHtmlTestRunner
+    init_worker = _init_html_worker
+    process_setup = _setup_html_worker
+
+    @property
+    def process_setup_args(self) -> tuple[dict]:
+        return (HtmlTestResult.options,)
+
+
+def iter_tests(suite: unittest.suite.TestSuite) -> Iterator[unittest.case.TestCase]:
+    """Yields all tests of a (possibly nested or parallel) test suite."""
+    for test in suite:
+        if isinstance(test, unittest.suite.TestSuite):
+            yield from iter_tests(test)
+        else:
+            yield test
+
+
 class HtmlTestRunner(TextTestRunner):
     resultclass = HtmlTestResult
 
@@ -393,17 +1073,32 @@ class HtmlTestRunner(TextTestRunner):
 
     def run(self, test: unittest.suite.TestSuite) -> HtmlTestResult:
         # ToDo: Consider to override the run() method to keep 'test'
-        self._tests = list(test)
+        # Index the tests by their testcase, so that fixture failures can be assigned to the affected tests.
+        self._tests = defaultdict(list)
+        for test_method in iter_tests(test):
+            self._tests[sys.intern(strclass(type(test_method)))].append(weakref.ref(test_method))
+        if HtmlTestResult.options.get('rerun_failures'):
+            test = functools.partial(self._run_with_reruns, test)
         result = super().run(test)
-        result.create_report(result.make_result_data())
+        result_data = result.make_result_data()
+        result.analyze_durations(result_data)
+        result.create_report(result_data)
         return result
 
+    @staticmethod
+    def _run_with_reruns(test: unittest.suite.TestSuite, result: HtmlTestResult) -> None:
+        test(result)
+        result.rerun_failures()
+
     def _makeResult(self) -> HtmlTestResult:
         return self.resultclass(self.stream, self.descriptions, self.verbosity, tests=self._tests)
 
 
-class TestRunner(CodeCoverageTestRunnerMixin, SnapshotTestRunnerMixin, DiscoverRunner):
+class TestRunner(
+    CodeCoverageTestRunnerMixin, DatabaseTemplateTestRunnerMixin, SnapshotTestRunnerMixin, DiscoverRunner
+):
     test_runner = HtmlTestRunner
+    parallel_test_suite = HtmlParallelTestSuite
 
     @classmethod
     def add_arguments(cls, parser) -> None:
@@ -416,6 +1111,58 @@ class TestRunner(CodeCoverageTestRunnerMixin, SnapshotTestRunnerMixin, DiscoverR
             default=get_config()["HTML_RESULTS_ENABLED"],
             help="Enables respectively disables html results instead of using the HTML_RESULTS_ENABLED setting.",
         )
+        parser.add_argument(
+            "--html-mode",
+            action="store",
+            dest="html_results_mode",
+            choices=("inline", "lazy"),
+            default=get_config()["HTML_RESULTS_MODE"],
+            help="Defines whether the html results contain all test results inline, or whether they are loaded "
+            "lazily from separate data files. If this isn't provided, the HTML_RESULTS_MODE setting will be used.",
+        )
+        parser.add_argument(
+            "--jsonl",
+            action=argparse.BooleanOptionalAction,
+            dest="jsonl_results_enabled",
+            default=get_config()["JSONL_RESULTS_ENABLED"],
+            help="Enables respectively disables streaming the test results into a JSON Lines file "
+            "instead of using the JSONL_RESULTS_ENABLED setting.",
+        )
+        parser.add_argument(
+            "--junit-xml",
+            action=argparse.BooleanOptionalAction,
+            dest="junit_xml_results_enabled",
+            default=get_config()["JUNIT_XML_RESULTS_ENABLED"],
+            help="Enables respectively disables a JUnit XML report instead of using the "
+            "JUNIT_XML_RESULTS_ENABLED setting.",
+        )
+        parser.add_argument(
+            "--duration-history",
+            action=argparse.BooleanOptionalAction,
+            dest="duration_history_enabled",
+            default=get_config()["DURATION_HISTORY_ENABLED"],
+            help="Enables respectively disables storing the test durations into a history file "
+            "instead of using the DURATION_HISTORY_ENABLED setting.",
+        )
+        parser.add_argument(
+            "--slowest",
+            action="store",
+            dest="slowest",
+            type=int,
+            metavar="N",
+            default=0,
+            help="Prints the N slowest tests after the test run.",
+        )
+        parser.add_argument(
+            "--shard",
+            action="store",
+            dest="shard",
+            type=parse_shard,
+            metavar="K/N",
+            help="Partitions the tests into N shards of about the same duration and only runs the K-th shard. "
+            "The durations are taken from the duration history, if available, otherwise the shards are balanced "
+            "by their number of tests. The tests of a testcase are always kept within the same shard.",
+        )
         parser.add_argument(
             "--coverage",
             action=argparse.BooleanOptionalAction,
@@ -423,6 +1170,119 @@ class TestRunner(CodeCoverageTestRunnerMixin, SnapshotTestRunnerMixin, DiscoverR
             dest="code_coverage_enabled",
             help="Enables respectively disables code coverage instead of using the COVERAGE_REPORT_ENABLED setting.",
         )
+        parser.add_argument(
+            "--coverage-core",
+            action="store",
+            dest="coverage_core",
+            choices=("sysmon", "ctrace", "pytrace"),
+            default=get_config()["COVERAGE_CORE"],
+            help="Defines the coverage measurement core. 'sysmon' uses the low-overhead sys.monitoring API "
+            "if available (Python 3.12+). If this isn't provided, the COVERAGE_CORE setting will be used.",
+        )
+        parser.add_argument(
+            "--coverage-branch",
+            action=argparse.BooleanOptionalAction,
+            dest="coverage_branch",
+            default=get_config()["COVERAGE_BRANCH"],
+            help="Enables branch coverage respectively restricts the coverage to line coverage instead of using the "
+            "COVERAGE_BRANCH setting.",
+        )
+        parser.add_argument(
+            "--coverage-formats",
+            nargs="+",
+            dest="coverage_report_formats",
+            choices=("html", "xml", "json"),
+            metavar="FORMAT",
+            default=get_config()["COVERAGE_REPORT_FORMATS"],
+            help="Defines the formats of the coverage report, any of 'html', 'xml' and 'json'. "
+            "If this isn't provided, the COVERAGE_REPORT_FORMATS setting will be used.",
+        )
+        parser.add_argument(
+            "--coverage-contexts",
+            action=argparse.BooleanOptionalAction,
+            default=get_config()["COVERAGE_CONTEXTS_ENABLED"],
+            dest="coverage_contexts_enabled",
+            help="Enables respectively disables recording the code coverage per test instead of using the "
+            "COVERAGE_CONTEXTS_ENABLED setting.",
+        )
+        parser.add_argument(
+            "--changed-since",
+            action="store",
+            dest="changed_since",
+            metavar="REF",
+            help="Only runs the tests covering files which have been changed since the given git ref, as well as "
+            "the tests which are not yet known to the test impact map recorded by --coverage-contexts.",
+        )
+        parser.add_argument(
+            "--rerun-failures",
+            action="store",
+            dest="rerun_failures",
+            type=int,
+            metavar="N",
+            default=get_config()["RERUN_FAILURES"],
+            help="Reruns the failed tests up to N times after all tests have been run. Tests which pass on a rerun "
+            "are reported as flaky. If this isn't provided, the RERUN_FAILURES setting will be used.",
+        )
+        parser.add_argument(
+            "--query-stats",
+            action=argparse.BooleanOptionalAction,
+            dest="query_stats_enabled",
+            default=get_config()["QUERY_STATS_ENABLED"],
+            help="Enables respectively disables counting the database queries of each test instead of using the "
+            "QUERY_STATS_ENABLED setting.",
+        )
+        parser.add_argument(
+            "--query-repeat-threshold",
+            action="store",
+            dest="query_repeat_threshold",
+            type=int,
+            metavar="N",
+            default=get_config()["QUERY_REPEAT_THRESHOLD"],
+            help="Reports tests which repeat the same query (apart from its parameters) more than N times, "
+            "as they likely have an N+1 query problem. If this isn't provided, the QUERY_REPEAT_THRESHOLD "
+            "setting will be used.",
+        )
+        parser.add_argument(
+            "--memory-tracking",
+            action=argparse.BooleanOptionalAction,
+            dest="memory_tracking_enabled",
+            default=get_config()["MEMORY_TRACKING_ENABLED"],
+            help="Enables respectively disables tracking the peak and retained memory of each test instead of "
+            "using the MEMORY_TRACKING_ENABLED setting.",
+        )
+        parser.add_argument(
+            "--memory-leak-threshold",
+            action="store",
+            dest="memory_leak_threshold",
+            type=int,
+            metavar="BYTES",
+            default=get_config()["MEMORY_LEAK_THRESHOLD"],
+            help="Reports testcases whose tests keep retaining memory of more than BYTES in total, as they likely "
+            "leak memory. If this isn't provided, the MEMORY_LEAK_THRESHOLD setting will be used.",
+        )
+        parser.add_argument(
+            "--compress-tracebacks",
+            action=argparse.BooleanOptionalAction,
+            dest="traceback_compression_enabled",
+            default=get_config()["TRACEBACK_COMPRESSION_ENABLED"],
+            help="Enables respectively disables keeping the tracebacks of the test results compressed in memory "
+            "until the report is generated instead of using the TRACEBACK_COMPRESSION_ENABLED setting.",
+        )
+        parser.add_argument(
+            "--db-templates",
+            action=argparse.BooleanOptionalAction,
+            dest="database_templates_enabled",
+            default=get_config()["DATABASE_TEMPLATES_ENABLED"],
+            help="Enables respectively disables creating the test databases from templates of previous test runs "
+            "as long as the migrations, models and fixtures haven't been changed instead of using the "
+            "DATABASE_TEMPLATES_ENABLED setting.",
+        )
+        parser.add_argument(
+            "--profile",
+            action="store_true",
+            dest="profile_enabled",
+            help="Profiles each test, and stores the profiles per testcase and in total within the report directory.",
+        )
         parser.add_argument(
             "--report-dir",
             action="store",
@@ -445,7 +1305,63 @@ class TestRunner(CodeCoverageTestRunnerMixin, SnapshotTestRunnerMixin, DiscoverR
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
+        self.shard = kwargs.get("shard")
+        self.changed_since = kwargs.get("changed_since")
         self.test_runner.resultclass.options = kwargs
 
+    def build_suite(self, test_labels=None, **kwargs) -> unittest.suite.TestSuite:
+        suite = super().build_suite(test_labels, **kwargs)
+        if self.shard is None and self.changed_since is None:
+            return suite
+
+        tests = list(iter_tests(suite))
+        if self.changed_since is not None:
+            tests = self.get_changed_tests(tests)
+            self.log(f"Running {len(tests)} test(s) affected by changes since {self.changed_since!r}.")
+        if self.shard is not None:
+            tests = self.get_shard_tests(tests)
+            self.log(f"Running shard {self.shard[0]}/{self.shard[1]} with {len(tests)} test(s).")
+        if isinstance(suite, ParallelTestSuite):
+            # The suite has already been partitioned by testcase for the parallel test worker processes.
+            suite.subsuites = partition_suite_by_case(self.test_suite(tests))
+            suite.processes = self.parallel = max(1, min(suite.processes, len(suite.subsuites)))
+            return suite
+        return self.test_suite(tests)
+
+    def get_changed_tests(self, tests: List[unittest.case.TestCase]) -> List[unittest.case.TestCase]:
+        """Returns the tests covering files changed since the :code:`changed_since` git ref, as well as the tests
+        which are unknown to the test impact map, keeping their order.
+        """
+        impact_map = TestImpactMap(
+            pathlib.Path(self.test_runner.resultclass.options["report_dir"], "test-impact-map.json")
+        )
+        if not impact_map.tests_by_file:
+            self.log("No test impact map found, thus all tests will be run.", level=logging.WARNING)
+            return tests
+
+        impacted_tests = impact_map.get_impacted_tests(get_changed_files(self.changed_since))
+        known_tests = impact_map.known_tests
+        return [test for test in tests if test.id() in impacted_tests or test.id() not in known_tests]
+
+    def get_shard_tests(self, tests: List[unittest.case.TestCase]) -> List[unittest.case.TestCase]:
+        """Returns the tests of the shard to run, keeping their order."""
+        shard, shards = self.shard
+        testcases = defaultdict(list)
+        for test in tests:
+            testcases[strclass(type(test))].append(f"{strclass(type(test))}.{getattr(test, '_testMethodName', test)}")
+
+        durations = {}
+        history_file = pathlib.Path(self.test_runner.resultclass.options["report_dir"], "test-durations.sqlite3")
+        if history_file.exists():
+            with DurationHistory(history_file) as history:
+                durations = history.get_medians()
+
+        shard_testcases = partition_testcases(get_testcase_weights(testcases, durations), shards)[shard - 1]
+        return [test for test in tests if strclass(type(test)) in shard_testcases]
+
     def suite_result(self, suite, result, **kwargs):
-        return super().suite_result(suite, result, **kwargs) + len(result.precondition_failures)
+        return (
+            super().suite_result(suite, result, **kwargs)
+            + len(result.precondition_failures)  # noqa: W503
+            + len(result.budget_exceeded)  # noqa: W503
+        )
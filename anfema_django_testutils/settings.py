@@ -16,7 +16,23 @@ CONFIG_DEFAULTS = {
     "TEST_REPORT_HTML_TEMPLATE": "test-results-template.html",
     "TEST_REPORT_CSS": "css/test-results.css",
     "COVERAGE_REPORT_ENABLED": True,
+    "COVERAGE_CONTEXTS_ENABLED": False,
+    "COVERAGE_CORE": None,
+    "COVERAGE_BRANCH": None,
+    "COVERAGE_SOURCE": None,
+    "COVERAGE_REPORT_FORMATS": ["html"],
     "HTML_RESULTS_ENABLED": True,
+    "HTML_RESULTS_MODE": "inline",
+    "JSONL_RESULTS_ENABLED": False,
+    "JUNIT_XML_RESULTS_ENABLED": False,
+    "DURATION_HISTORY_ENABLED": False,
+    "RERUN_FAILURES": 0,
+    "QUERY_STATS_ENABLED": False,
+    "QUERY_REPEAT_THRESHOLD": 10,
+    "MEMORY_TRACKING_ENABLED": False,
+    "MEMORY_LEAK_THRESHOLD": 1048576,
+    "TRACEBACK_COMPRESSION_ENABLED": False,
+    "DATABASE_TEMPLATES_ENABLED": False,
     "TEST_REPORT_TITLE": "Test Results",
 }
 
@@ -0,0 +1,64 @@
+"""This module provides the partitioning of test suites into shards."""
+from __future__ import annotations
+
+
+__all__ = ('parse_shard', 'get_testcase_weights', 'partition_testcases')
+
+import argparse
+import heapq
+import re
+import statistics
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Set, Tuple
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """Parses a shard argument like ``2/4`` into the shard number and the number of shards."""
+    if (match := re.fullmatch(r'(\d+)/(\d+)', value)) is None:
+        raise argparse.ArgumentTypeError(f"Invalid shard {value!r}, expected K/N, e.g. '1/4'.")
+    shard, shards = int(match.group(1)), int(match.group(2))
+    if not 1 <= shard <= shards:
+        raise argparse.ArgumentTypeError(f"Invalid shard {value!r}, K must be between 1 and N.")
+    return shard, shards
+
+
+def get_testcase_weights(testcases: Dict[str, List[str]], durations: Dict[str, float]) -> Dict[str, float]:
+    """Returns the expected duration of each testcase.
+
+    Tests without a known duration are weighted with the average duration of the known tests. If no
+    duration is known at all, each test is weighted equally, so that the testcases are balanced by their
+    number of tests.
+
+    :param testcases: The ids of the tests of each testcase.
+    :param durations: The known durations in seconds of the tests by their id.
+    """
+    known_durations = [
+        durations[test_id] for test_ids in testcases.values() for test_id in test_ids if test_id in durations
+    ]
+    default_duration = statistics.fmean(known_durations) if known_durations else 1.0
+    return {
+        testcase: sum(durations.get(test_id, default_duration) for test_id in test_ids)
+        for testcase, test_ids in testcases.items()
+    }
+
+
+def partition_testcases(weights: Dict[str, float], shards: int) -> List[Set[str]]:
+    """Partitions the testcases into balanced shards using longest-processing-time-first bin packing.
+
+    The testcases are assigned one by one, the heaviest first, to the shard with the lowest total weight.
+    Ties are resolved by the testcase name and shard number, so that each CI node computes the same
+    partitioning given the same weights.
+
+    :param weights: The expected durations of the testcases, see :func:`get_testcase_weights`.
+    :param shards: The number of shards.
+    """
+    partitions = [set() for _ in range(shards)]
+    loads = [(0.0, shard) for shard in range(shards)]
+    for testcase, weight in sorted(weights.items(), key=lambda item: (-item[1], item[0])):
+        load, shard = heapq.heappop(loads)
+        partitions[shard].add(testcase)
+        heapq.heappush(loads, (load + weight, shard))
+    return partitions
@@ -0,0 +1,252 @@
+var testResultsViewer = (function() {
+
+    var ROW_HEIGHT = 24;
+    var VISIBLE_ROWS = 20;
+    var OVERSCAN_ROWS = 5;
+
+    var index = null;
+    var testcaseViews = [];
+    var testcasesByResult = {};
+    var outcomeChunks = {};
+    var pendingOutcomeChunks = {};
+    var currentResultFilter = "all";
+
+    function createElement(tagName, className, text) {
+        var element = document.createElement(tagName);
+        if (className) {
+            element.className = className;
+        }
+        if (text !== undefined) {
+            element.textContent = text;
+        }
+        return element;
+    }
+
+    function formatDuration(seconds) {
+        return seconds + "s";
+    }
+
+    function buildResultIndex() {
+        // Maps each result to the testcases containing at least one test with this result,
+        // so that filtering doesn't need to look at the tests respectively the DOM at all.
+        index.results.forEach(function(result, resultIdx) {
+            testcasesByResult[result] = [];
+            index.testcases.forEach(function(testcase, testcaseIdx) {
+                if (testcase.counts[resultIdx] > 0) {
+                    testcasesByResult[result].push(testcaseIdx);
+                }
+            });
+        });
+    }
+
+    function loadOutcome(outcomeId, callback) {
+        var chunk = Math.floor(outcomeId / index.outcomeChunkSize);
+        var offset = outcomeId % index.outcomeChunkSize;
+
+        if (outcomeChunks[chunk]) {
+            callback(outcomeChunks[chunk][offset]);
+            return;
+        }
+        var pendingCallback = function(outcomes) {
+            callback(outcomes[offset]);
+        };
+        if (pendingOutcomeChunks[chunk]) {
+            pendingOutcomeChunks[chunk].push(pendingCallback);
+            return;
+        }
+        pendingOutcomeChunks[chunk] = [pendingCallback];
+        var script = document.createElement("script");
+        script.src = "test-results-data/outcomes-" + chunk + ".js";
+        document.head.appendChild(script);
+    }
+
+    function TestcaseView(testcase) {
+        this.testcase = testcase;
+        this.expanded = false;
+        this.filteredTests = null;
+        this.element = this.render();
+    }
+
+    TestcaseView.prototype.render = function() {
+        var self = this;
+        var container = createElement("div", "testcase");
+        var table = createElement("table");
+        var thead = createElement("thead");
+
+        var headerRow = createElement("tr");
+        headerRow.appendChild(createElement("th", null, this.testcase.name));
+        headerRow.appendChild(createElement("th", null, "Duration"));
+        headerRow.appendChild(createElement("th", null, "Result"));
+        var buttonCell = createElement("th");
+        this.toggleButton = createElement("button", "btn-testcase-details", "⋯");
+        this.toggleButton.addEventListener("click", function(e) {
+            e.preventDefault();
+            self.toggle();
+        });
+        buttonCell.appendChild(this.toggleButton);
+        headerRow.appendChild(buttonCell);
+        thead.appendChild(headerRow);
+
+        var summaryRow = createElement("tr");
+        var colorBarCell = createElement("td");
+        var colorBar = createElement("div", "color-bar");
+        index.results.forEach(function(result, resultIdx) {
+            var resultWidth = self.testcase.counts[resultIdx] / self.testcase.totals * 100;
+            var bar = createElement("div", result);
+            bar.style.width = resultWidth + "%";
+            colorBar.appendChild(bar);
+        });
+        colorBarCell.appendChild(colorBar);
+        summaryRow.appendChild(colorBarCell);
+        summaryRow.appendChild(createElement("td", null, formatDuration(this.testcase.duration)));
+        summaryRow.appendChild(createElement("td"));
+        summaryRow.appendChild(createElement("td"));
+        thead.appendChild(summaryRow);
+
+        table.appendChild(thead);
+        container.appendChild(table);
+
+        this.viewport = createElement("div", "testcase-viewport");
+        this.viewport.style.display = "none";
+        this.viewport.addEventListener("scroll", function() {
+            self.renderVisibleRows();
+        });
+        this.spacer = createElement("div", "testcase-viewport-spacer");
+        this.viewport.appendChild(this.spacer);
+        container.appendChild(this.viewport);
+
+        this.outcome = createElement("pre", "testrun-outcome");
+        this.outcome.style.display = "none";
+        container.appendChild(this.outcome);
+
+        return container;
+    };
+
+    TestcaseView.prototype.toggle = function() {
+        this.expanded = !this.expanded;
+        this.toggleButton.textContent = this.expanded ? "Hide" : "⋯";
+        this.viewport.style.display = this.expanded ? "block" : "none";
+        if (!this.expanded) {
+            this.outcome.style.display = "none";
+        }
+        this.update();
+    };
+
+    TestcaseView.prototype.update = function() {
+        if (!this.expanded) {
+            return;
+        }
+        var resultIdx = index.results.indexOf(currentResultFilter);
+        this.filteredTests = resultIdx === -1 ? this.testcase.tests : this.testcase.tests.filter(function(test) {
+            return test[1] === resultIdx;
+        });
+        this.spacer.style.height = (this.filteredTests.length * ROW_HEIGHT) + "px";
+        this.viewport.style.height = (Math.min(this.filteredTests.length, VISIBLE_ROWS) * ROW_HEIGHT) + "px";
+        this.renderVisibleRows();
+    };
+
+    TestcaseView.prototype.renderVisibleRows = function() {
+        // Only the rows within the visible area of the viewport are rendered.
+        var self = this;
+        var first = Math.max(0, Math.floor(this.viewport.scrollTop / ROW_HEIGHT) - OVERSCAN_ROWS);
+        var last = Math.min(this.filteredTests.length, first + VISIBLE_ROWS + 2 * OVERSCAN_ROWS);
+
+        this.spacer.textContent = "";
+        this.filteredTests.slice(first, last).forEach(function(test, offset) {
+            self.spacer.appendChild(self.renderRow(test, first + offset));
+        });
+    };
+
+    TestcaseView.prototype.renderRow = function(test, position) {
+        var self = this;
+        var result = index.results[test[1]];
+        var row = createElement("div", "testrun-row");
+        row.style.top = (position * ROW_HEIGHT) + "px";
+        row.style.height = ROW_HEIGHT + "px";
+        row.style.backgroundColor = "var(--" + result + ")";
+        row.appendChild(createElement("span", "testrun-name", test[0]));
+        var durationCell = createElement("span", "testrun-duration", formatDuration(test[2]));
+        if (test.length > 4) {
+            durationCell.title = test[4] + " queries, " + formatDuration(test[5]);
+            if (test[6]) {
+                durationCell.className += " repeated";
+            }
+        }
+        row.appendChild(durationCell);
+        row.appendChild(createElement("span", "testrun-result", result));
+
+        var buttonCell = createElement("span", "testrun-details");
+        if (test[3] !== -1) {
+            var button = createElement("button", "btn-testrun-details", "View");
+            button.addEventListener("click", function(e) {
+                e.preventDefault();
+                self.showOutcome(test);
+            });
+            buttonCell.appendChild(button);
+        }
+        row.appendChild(buttonCell);
+        return row;
+    };
+
+    TestcaseView.prototype.showOutcome = function(test) {
+        var self = this;
+        this.outcome.style.display = "block";
+        this.outcome.textContent = "Loading ...";
+        loadOutcome(test[3], function(outcome) {
+            self.outcome.textContent = test[0] + "\n\n" + outcome;
+        });
+    };
+
+    function applyResultFilter() {
+        var visibleTestcases = null;
+        if (currentResultFilter !== "all") {
+            visibleTestcases = {};
+            (testcasesByResult[currentResultFilter] || []).forEach(function(testcaseIdx) {
+                visibleTestcases[testcaseIdx] = true;
+            });
+        }
+        testcaseViews.forEach(function(view, testcaseIdx) {
+            var visible = visibleTestcases === null || visibleTestcases[testcaseIdx] === true;
+            view.element.style.display = visible ? "" : "none";
+            if (visible) {
+                view.update();
+            }
+        });
+    }
+
+    function render() {
+        var container = document.getElementById("testcases");
+        var fragment = document.createDocumentFragment();
+        testcaseViews = index.testcases.map(function(testcase) {
+            var view = new TestcaseView(testcase);
+            fragment.appendChild(view.element);
+            return view;
+        });
+        container.appendChild(fragment);
+
+        document.getElementById("selection-result-filter").addEventListener("change", function() {
+            currentResultFilter = this.value;
+            applyResultFilter();
+        });
+    }
+
+    return {
+        loadIndex: function(data) {
+            index = data;
+            buildResultIndex();
+            if (document.readyState === "loading") {
+                document.addEventListener("DOMContentLoaded", render);
+            } else {
+                render();
+            }
+        },
+        loadOutcomes: function(chunk, outcomes) {
+            outcomeChunks[chunk] = outcomes;
+            (pendingOutcomeChunks[chunk] || []).forEach(function(callback) {
+                callback(outcomes);
+            });
+            delete pendingOutcomeChunks[chunk];
+        }
+    };
+
+})();
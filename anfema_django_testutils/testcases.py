@@ -5,21 +5,32 @@ __all__ = (
     "PreconditionError",
     "PreconditionContext",
     "precondition",
+    "BudgetExceededError",
+    "BudgetContext",
     "repeat",
+    "benchmark",
     "SimpleTestCase",
     "TransactionTestCase",
     "TestCase",
 )
 
+import concurrent.futures
 import contextlib
 import functools
+import multiprocessing
+import time
+import tracemalloc
 from typing import TYPE_CHECKING
 
-from django.db import transaction
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
 from django.test import SimpleTestCase as DjangoSimpleTestCase
 from django.test import TestCase as DjangoTestCase
 from django.test import TransactionTestCase as DjangoTransactionTestCase
 
+from .benchmarks import BenchmarkResult, measure
+from .memory import start_peak_measurement, stop_peak_measurement
+from .queries import QueryCounter
+
 
 if TYPE_CHECKING:
     from typing import Iterator
@@ -81,6 +92,107 @@ def precondition(func):
     return wrapper
 
 
+class BudgetExceededError(AssertionError):
+    """Exception to indicate that a performance budget has been exceeded."""
+
+    __budget_exceeded__ = True
+
+
+class BudgetContext:
+    """Context manager to assert that a block of code stays within a performance budget.
+
+    Each limit is optional, and only the given limits are measured. If any of them is exceeded, a
+    :class:`BudgetExceededError` is raised, which leads to the test result ``budget_exceeded`` rather than a
+    failure. Budgets are upper limits rather than exact numbers, so that tests don't break as soon as the code
+    under test gets faster.
+
+    .. code-block::
+
+        with BudgetContext(max_queries=10, max_duration=0.5):
+             do_something()
+
+    :param int max_queries: The maximum number of database queries.
+    :param float max_query_duration: The maximum total duration of the database queries in seconds.
+    :param float max_duration: The maximum wall time in seconds.
+    :param int max_memory: The maximum peak of the memory allocated by Python in bytes, as traced by
+      :mod:`tracemalloc`. Tracing memory allocations slows down the code within the context considerably,
+      so don't combine it with a *max_duration*.
+    :param str using: The alias of the database to count the queries of.
+    :param str msg: Optional message to use on failure.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_queries: int = None,
+        max_query_duration: float = None,
+        max_duration: float = None,
+        max_memory: int = None,
+        using: str = DEFAULT_DB_ALIAS,
+        msg: str = None,
+    ) -> None:
+        self.max_queries = max_queries
+        self.max_query_duration = max_query_duration
+        self.max_duration = max_duration
+        self.max_memory = max_memory
+        self.using = using
+        self.msg = msg
+        self.query_counter = None
+        self.duration = None
+        self.memory = None
+        self._start = None
+        self._start_memory = None
+        self._tracemalloc_started = False
+
+    def __enter__(self) -> BudgetContext:
+        if self.max_queries is not None or self.max_query_duration is not None:
+            self.query_counter = QueryCounter(None, databases=[self.using])
+            self.query_counter.install()
+        if self.max_memory is not None:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._tracemalloc_started = True
+            start_peak_measurement()
+            self._start_memory = tracemalloc.get_traced_memory()[0]
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.duration = time.perf_counter() - self._start
+        if self.max_memory is not None:
+            self.memory = stop_peak_measurement() - self._start_memory
+            if self._tracemalloc_started:
+                tracemalloc.stop()
+                self._tracemalloc_started = False
+        if self.query_counter is not None:
+            self.query_counter.uninstall()
+        if exc_type is not None:
+            return False
+
+        if violations := self.get_violations():
+            standard_msg = f"Budget exceeded: {'; '.join(violations)}"
+            raise BudgetExceededError(standard_msg if self.msg is None else f"{standard_msg} : {self.msg}")
+        return False
+
+    def get_violations(self) -> list[str]:
+        """Returns a description of each exceeded limit."""
+        violations = []
+        if self.max_queries is not None and self.query_counter.count > self.max_queries:
+            violation = f"{self.query_counter.count} queries executed, {self.max_queries} allowed"
+            if repeated := self.query_counter.get_stats(repeat_threshold=1).repeated:
+                violation += "".join(f"\n  {count}x {sql}" for sql, count in repeated)
+            violations.append(violation)
+        if self.max_query_duration is not None and self.query_counter.duration > self.max_query_duration:
+            violations.append(
+                f"queries took {self.query_counter.duration:.3f}s, {self.max_query_duration:.3f}s allowed"
+            )
+        if self.max_duration is not None and self.duration > self.max_duration:
+            violations.append(f"took {self.duration:.3f}s, {self.max_duration:.3f}s allowed")
+        if self.max_memory is not None and self.memory > self.max_memory:
+            violations.append(f"allocated a peak of {self.memory} bytes, {self.max_memory} bytes allowed")
+        return violations
+
+
 class repeat:
     """Repeats a test method a given number of times.
 
@@ -103,19 +215,49 @@ class repeat:
             def test_to_be_repeated_100_times(self):
                 ...
 
+    The repetitions can also be run concurrently by a number of *workers*, which speeds up long repetitions
+    and additionally surfaces race conditions. The failures of the repetitions are reported in the order of the
+    repetitions, once all of them have been finished respectively cancelled due to *fail_fast*.
+
+    ``"thread"``
+        The repetitions are run by threads. Each thread uses its own database connections, so the
+        repetitions don't see data which hasn't been committed by the test, e.g. within a
+        :class:`TestCase`.
+    ``"process"``
+        The repetitions are run by forked processes, thus this mode is only available on platforms
+        supporting the ``fork`` start method. The processes open their own database connections, which
+        don't see the data of in-memory test databases.
+
+    .. code-block::
+
+        @repeat(repetitions=1000, workers=8, mode="thread")
+        def test_to_be_repeated_concurrently(self):
+            ...
+
     :param int repetitions: The number of times the test method should be repeated.
     :param bool fail_fast: If True, stop repeating the test method after the first failure.
+    :param int workers: The number of concurrent repetitions. By default, the repetitions are run serially.
+    :param str mode: Whether the concurrent repetitions are run by ``"thread"`` or by ``"process"``.
     """
 
-    def __init__(self, repetitions: int, *, fail_fast: bool = False):
+    def __init__(self, repetitions: int, *, fail_fast: bool = False, workers: int = None, mode: str = "thread"):
         if repetitions < 1:
             raise ValueError("Argument repetitions must not be less then 1.")
+        if workers is not None and workers < 1:
+            raise ValueError("Argument workers must not be less then 1.")
+        if mode not in ("thread", "process"):
+            raise ValueError("Argument mode must be either 'thread' or 'process'.")
         self.repetitions = repetitions
         self.fail_fast = fail_fast
+        self.workers = workers
+        self.mode = mode
 
     def __call__(self, func: callable) -> callable:
         @functools.wraps(func)
         def wrapper(instance, *args, **kwargs):
+            if self.workers is not None:
+                self._run_concurrently(instance, functools.partial(func, instance, *args, **kwargs))
+                return
             for idx in range(self.repetitions):
                 with instance.subTest(msg=f"Repetition {idx + 1} of {self.repetitions}", fail_fast=self.fail_fast):
                     try:
@@ -130,9 +272,149 @@ class repeat:
 
         return wrapper
 
+    def _create_executor(self) -> concurrent.futures.Executor:
+        if self.mode == "thread":
+            return concurrent.futures.ThreadPoolExecutor(max_workers=self.workers)
+        return concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_repetition_process,
+        )
+
+    def _run_concurrently(self, instance, call: callable) -> None:
+        global _repetition_call
+
+        # The forked processes inherit the call, as test methods can't be pickled in general.
+        _repetition_call = call
+        try:
+            with self._create_executor() as executor:
+                submit = (
+                    functools.partial(executor.submit, _run_repetition, call)
+                    if self.mode == "thread"
+                    else functools.partial(executor.submit, _run_repetition)
+                )
+                futures = [submit() for _ in range(self.repetitions)]
+                for future in concurrent.futures.as_completed(futures):
+                    if self.fail_fast and not future.cancelled() and future.exception() is not None:
+                        # Running repetitions can't be cancelled, so their results will be reported anyway.
+                        executor.shutdown(wait=True, cancel_futures=True)
+                        break
+        finally:
+            _repetition_call = None
+
+        for idx, future in enumerate(futures):
+            if future.cancelled():
+                break
+            with instance.subTest(msg=f"Repetition {idx + 1} of {self.repetitions}", fail_fast=self.fail_fast):
+                if (exception := future.exception()) is not None:
+                    raise exception
+            if exception is not None and self.fail_fast:
+                break
+
+
+_repetition_call = None
+
+
+def _init_repetition_process() -> None:
+    """Discards the database connections inherited from the parent process, without closing them."""
+    for connection in connections.all():
+        connection.connection = None
+
+
+def _run_repetition(call: callable = None) -> None:
+    """Runs a repetition within a thread respectively a forked process."""
+    try:
+        (call or _repetition_call)()
+    finally:
+        if call is not None:
+            # Threads open their own database connections.
+            connections.close_all()
+
+
+class benchmark:
+    """Benchmarks a test method by running it repeatedly, and compares its timings to a baseline.
+
+    The number of iterations per round is calibrated, so that each round takes at least *min_round_time*.
+    After some warmup rounds, the duration of each of the *rounds* is measured. If the test runner provides
+    a baseline of the benchmark (see :class:`~anfema_django_testutils.benchmarks.BenchmarkBaselines`), the
+    test fails if the benchmark got significantly slower. If the timings are too noisy to be reliable, the
+    test rather fails with a precondition failure, as the regression might be caused by the environment.
+    The results of the benchmarks are listed within the html test report.
+
+    .. code-block::
+
+        from anfema_django_testutils.testcases import TestCase, benchmark
+
+
+        class CustomTestCase(TestCase):
+
+            @benchmark(rounds=20)
+            def test_to_be_benchmarked(self):
+                ...
+
+    :param int rounds: The number of measured rounds.
+    :param int warmup_rounds: The number of rounds to run before measuring.
+    :param float min_round_time: The minimum duration of a round in seconds.
+    :param float max_noise: The maximum coefficient of variation (standard deviation divided by median)
+      of reliable timings.
+    :param float regression_threshold: The minimum relative slowdown of the fastest timing to fail, e.g.
+      ``0.1`` for 10 percent.
+    :param float significance: The maximum p-value of the Mann-Whitney U test to fail.
+    """
+
+    def __init__(
+        self,
+        *,
+        rounds: int = 20,
+        warmup_rounds: int = 2,
+        min_round_time: float = 0.005,
+        max_noise: float = 0.2,
+        regression_threshold: float = 0.1,
+        significance: float = 0.01,
+    ):
+        if rounds < 2:
+            raise ValueError("Argument rounds must not be less then 2.")
+        self.rounds = rounds
+        self.warmup_rounds = warmup_rounds
+        self.min_round_time = min_round_time
+        self.max_noise = max_noise
+        self.regression_threshold = regression_threshold
+        self.significance = significance
+
+    def __call__(self, func: callable) -> callable:
+        @functools.wraps(func)
+        def wrapper(instance, *args, **kwargs):
+            iterations, timings = measure(
+                functools.partial(func, instance, *args, **kwargs),
+                rounds=self.rounds,
+                warmup_rounds=self.warmup_rounds,
+                min_round_time=self.min_round_time,
+            )
+            # The baselines are provided by the test result of the test runner.
+            baselines = getattr(instance, "benchmark_baselines", None)
+            instance.benchmark_result = result = BenchmarkResult.evaluate(
+                iterations,
+                timings,
+                baselines.get(instance.id()) if baselines is not None else (),
+                max_noise=self.max_noise,
+                regression_threshold=self.regression_threshold,
+                significance=self.significance,
+            )
+            if result.regression:
+                msg = (
+                    f"Benchmark regression: min {result.min:.6f}s, baseline min "
+                    f"{result.baseline_min:.6f}s ({result.change:+.1%}, p={result.p_value:.4f})."
+                )
+                if result.noisy:
+                    raise PreconditionError(f"{msg} The timings are too noisy to be reliable.")
+                raise instance.failureException(msg)
+
+        return wrapper
+
 
 class TestCaseMixin:
     preconditionFailureException = PreconditionError
+    budgetExceededException = BudgetExceededError
 
     @precondition
     def _callSetUp(self):
@@ -193,6 +475,76 @@ class TestCaseMixin:
             standard_msg = f"Unexpected {e.__class__.__name__} raised: {e!r}"
             raise self.fail(self._formatMessage(msg, standard_msg))
 
+    def assertQueryBudget(
+        self,
+        *,
+        max_queries: int = None,
+        max_query_duration: float = None,
+        max_duration: float = None,
+        max_memory: int = None,
+        using: str = DEFAULT_DB_ALIAS,
+        msg: str = None,
+    ) -> BudgetContext:
+        """Context manager to assert that a block of code stays within a performance budget.
+
+        If any of the given limits is exceeded, the test will be deemed to have exceeded its budget rather
+        than to have failed. See :class:`BudgetContext` for the limits.
+
+        .. code-block::
+
+           with self.assertQueryBudget(max_queries=10, max_query_duration=0.1):
+                do_something()
+
+        """
+        return BudgetContext(
+            max_queries=max_queries,
+            max_query_duration=max_query_duration,
+            max_duration=max_duration,
+            max_memory=max_memory,
+            using=using,
+            msg=msg,
+        )
+
+    def assertMaxQueries(self, num: int, using: str = DEFAULT_DB_ALIAS, msg: str = None) -> BudgetContext:
+        """Context manager to assert that a block of code executes at most *num* database queries.
+
+        Unlike :meth:`~django.test.TransactionTestCase.assertNumQueries`, executing fewer queries is fine.
+
+        :param int num: The maximum number of queries.
+        :param str using: The alias of the database to count the queries of.
+        :param str msg: Optional message to use on failure.
+        """
+        return self.assertQueryBudget(max_queries=num, using=using, msg=msg)
+
+    def assertMaxQueryDuration(
+        self, seconds: float, using: str = DEFAULT_DB_ALIAS, msg: str = None
+    ) -> BudgetContext:
+        """Context manager to assert that the database queries of a block of code take at most *seconds*
+        in total.
+
+        :param float seconds: The maximum total duration of the queries.
+        :param str using: The alias of the database to measure the queries of.
+        :param str msg: Optional message to use on failure.
+        """
+        return self.assertQueryBudget(max_query_duration=seconds, using=using, msg=msg)
+
+    def assertMaxDuration(self, seconds: float, msg: str = None) -> BudgetContext:
+        """Context manager to assert that a block of code takes at most *seconds* of wall time.
+
+        :param float seconds: The maximum duration.
+        :param str msg: Optional message to use on failure.
+        """
+        return self.assertQueryBudget(max_duration=seconds, msg=msg)
+
+    def assertMaxMemory(self, size: int, msg: str = None) -> BudgetContext:
+        """Context manager to assert that the peak of the memory allocated by a block of code is at most
+        *size* bytes.
+
+        :param int size: The maximum peak memory in bytes.
+        :param str msg: Optional message to use on failure.
+        """
+        return self.assertQueryBudget(max_memory=size, msg=msg)
+
 
 class TransactionTestCaseMixin(TestCaseMixin):
     @contextlib.contextmanager
@@ -0,0 +1,15 @@
+from anfema_django_testutils.testcases import TestCase
+
+
+def setUpModule():
+    raise ValueError('Setting up the module failed.')
+
+
+class ModuleFixtureTests(TestCase):
+    """Tests to check the test results of a failing module fixture"""
+
+    def test_module_fixture_error(self):
+        pass  # Dummy test routine should not be executed.
+
+    def test_another_module_fixture_error(self):
+        pass  # Dummy test routine should not be executed.
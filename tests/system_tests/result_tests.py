@@ -87,3 +87,15 @@ class SetupTestDataError(TestCase):
 
     def test_setup_test_data_error(self):
         pass  # Dummy test routine should not be executed.
+
+
+class TearDownClassError(TestCase):
+    """Tests to check the test results and exit codes"""
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        raise ValueError('Tearing down the testcase failed.')
+
+    def test_teardown_class_error(self):
+        pass
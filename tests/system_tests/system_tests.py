@@ -1,13 +1,16 @@
 import ast
 import contextlib
 import importlib.util
+import json
 import shutil
+import sqlite3
 import subprocess
 import sys
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 from typing import Any
 from unittest import TestCase
+from xml.etree import ElementTree
 
 from anfema_django_testutils.settings import CONFIG_DEFAULTS
 
@@ -81,7 +84,7 @@ class SystemTestMixin:
         settings_module = importlib.import_module(self.settings_file.stem)
         return getattr(*[settings_module, setting] + [default] if default else [])
 
-    def execute_django_tests(self, *tests: str):
+    def execute_django_tests(self, *tests: str, options: list[str] = None):
         tests_module_parent = __name__.rsplit('.', 1)[0]
         tests = " ".join(f"{tests_module_parent}.{test}" for test in tests)
 
@@ -95,6 +98,7 @@ class SystemTestMixin:
             self.settings_file.stem,
             "--testrunner",
             "anfema_django_testutils.runner.TestRunner",
+            *(options or []),
         ]
 
         return subprocess.run(
@@ -179,6 +183,7 @@ class ExitCodeTests(SystemTestMixin, TestCase):
             ("result_tests.SetupFailPreconditionFailure.test_setup_precondition_failure", 1),
             ("result_tests.SetupTestDataError.test_setup_test_data_error", 1),
             ("test_setup_test_data_assertion_fails", 1),
+            ("result_tests.TearDownClassError.test_teardown_class_error", 1),
         ]:
             with self.subTest(
                 test=test,
@@ -223,3 +228,117 @@ class BasicConfigHtmlReportDisabledTests(SystemTestMixin, TestCase):
             self.assertTrue(Path(directory_name).exists(), msg=f"Test report directory {directory_name!r} is missing.")
         finally:
             shutil.rmtree(directory_name)
+
+
+class LazyHtmlResultsTests(SystemTestMixin, TestCase):
+    def test_lazy_html_report_artifacts(self):
+        self.execute_django_tests("result_tests.ResultTests", options=["--html-mode", "lazy"])
+
+        test_report_dir = Path(self.get_setting("TEST_REPORT_DIR", CONFIG_DEFAULTS["TEST_REPORT_DIR"]))
+        self.assertTrue((test_report_dir / "test-results.html").exists())
+        self.assertTrue((test_report_dir / "test-results-lazy.js").exists())
+        self.assertFalse((test_report_dir / "test-results.js").exists())
+
+        html_report = (test_report_dir / "test-results.html").read_text()
+        self.assertIn("test-results-data/index.js", html_report)
+        self.assertNotIn("test_subtest_precondition_failure", html_report)
+
+        index = (test_report_dir / "test-results-data" / "index.js").read_text()
+        self.assertIn("test_subtest_precondition_failure", index)
+        self.assertTrue((test_report_dir / "test-results-data" / "outcomes-0.js").exists())
+
+
+class JsonLinesResultsTests(SystemTestMixin, TestCase):
+    def test_test_results_are_streamed_into_json_lines_file(self):
+        self.execute_django_tests("result_tests.ResultTests", options=["--jsonl"])
+
+        test_report_dir = self.get_setting("TEST_REPORT_DIR", CONFIG_DEFAULTS["TEST_REPORT_DIR"])
+        records = [json.loads(line) for line in Path(test_report_dir, "test-results.jsonl").read_text().splitlines()]
+        self.assertEqual(len(records), 13)
+        self.assertEqual(
+            {record["name"]: record["result"] for record in records}["test_subtest_precondition_failure"],
+            "precondition_failure",
+        )
+
+    def test_no_json_lines_file_by_default(self):
+        self.execute_django_tests("result_tests.ResultTests.test_success")
+
+        test_report_dir = self.get_setting("TEST_REPORT_DIR", CONFIG_DEFAULTS["TEST_REPORT_DIR"])
+        self.assertFalse(Path(test_report_dir, "test-results.jsonl").exists())
+
+
+class JUnitXmlResultsTests(SystemTestMixin, TestCase):
+    def test_junit_xml_report(self):
+        self.execute_django_tests("result_tests.ResultTests", options=["--junit-xml"])
+
+        test_report_dir = self.get_setting("TEST_REPORT_DIR", CONFIG_DEFAULTS["TEST_REPORT_DIR"])
+        testsuites = ElementTree.parse(Path(test_report_dir, "test-results.xml")).getroot()
+        self.assertEqual(testsuites.get("tests"), "13")
+        self.assertEqual(testsuites.get("errors"), "2")
+        self.assertEqual(testsuites.get("failures"), "6")
+        self.assertEqual(testsuites.get("skipped"), "3")
+
+
+class DurationHistoryTests(SystemTestMixin, TestCase):
+    def test_durations_are_stored_across_test_runs(self):
+        for _ in range(2):
+            proc = self.execute_django_tests(
+                "result_tests.ResultTests", options=["--duration-history", "--slowest", "3"]
+            )
+
+        test_report_dir = self.get_setting("TEST_REPORT_DIR", CONFIG_DEFAULTS["TEST_REPORT_DIR"])
+        with contextlib.closing(sqlite3.connect(Path(test_report_dir, "test-durations.sqlite3"))) as connection:
+            self.assertEqual(connection.execute("SELECT COUNT(*) FROM runs").fetchone(), (2,))
+        self.assertIn("Slowest 3 tests:", proc.stdout)
+        self.assertIn("rolling median", proc.stdout)
+
+
+class FixtureFailureTests(SystemTestMixin, TestCase):
+    def test_module_fixture_failure_is_assigned_to_all_tests_of_the_module(self):
+        proc = self.execute_django_tests("module_fixture_tests")
+        self.assertEqual(proc.returncode, 1)
+        self.assertTestReportArtifacts(expect_html_report_artifacts=True, expect_coverage_report_artifacts=True)
+        self.assertIn("passed=0", proc.stdout)
+        self.assertIn("errors=2", proc.stdout)
+
+    def test_testcase_teardown_failure_is_added_as_separate_result(self):
+        proc = self.execute_django_tests("result_tests.TearDownClassError")
+        self.assertEqual(proc.returncode, 1)
+        self.assertIn("passed=1", proc.stdout)
+        self.assertIn("errors=1", proc.stdout)
+
+
+class ParallelTests(SystemTestMixin, TestCase):
+    def test_html_report_contains_results_of_all_workers(self):
+        proc = self.execute_django_tests("result_tests", options=["--parallel", "2"])
+        self.assertEqual(proc.returncode, 1)
+        self.assertTestReportArtifacts(expect_html_report_artifacts=True, expect_coverage_report_artifacts=True)
+
+        test_report_dir = self.get_setting("TEST_REPORT_DIR", CONFIG_DEFAULTS["TEST_REPORT_DIR"])
+        html_report = Path(test_report_dir, "test-results.html").read_text()
+        for test in (
+            "test_success",
+            "test_precondition_failure",
+            "test_subtest_precondition_failure",
+            "test_subtest_error",
+            "test_setup_precondition_failure",
+            "test_setup_test_data_assertion_fails",
+            "test_setup_test_data_error",
+        ):
+            with self.subTest(test=test):
+                self.assertIn(test, html_report)
+        self.assertIn("precondition failures=4", proc.stdout)
+
+
+class ShardingTests(SystemTestMixin, TestCase):
+    def test_shards_partition_the_tests_by_testcase(self):
+        test_report_dir = self.get_setting("TEST_REPORT_DIR", CONFIG_DEFAULTS["TEST_REPORT_DIR"])
+        shard_testcases = []
+        for shard in ("1/2", "2/2"):
+            self.execute_django_tests("result_tests", options=["--shard", shard, "--jsonl", "--no-coverage"])
+            records = Path(test_report_dir, "test-results.jsonl").read_text().splitlines()
+            shard_testcases.append({json.loads(record)["testcase"] for record in records})
+
+        self.assertTrue(all(shard_testcases))
+        self.assertFalse(shard_testcases[0] & shard_testcases[1])
+        self.assertIn("system_tests.result_tests.ResultTests", shard_testcases[0] | shard_testcases[1])
@@ -0,0 +1,119 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from anfema_django_testutils.benchmarks import BenchmarkBaselines, BenchmarkResult, measure, regression_p_value
+from anfema_django_testutils.testcases import PreconditionError, benchmark
+
+
+class BenchmarkTestCase(TestCase):
+    class DummyTests(TestCase):
+        @benchmark(rounds=5, warmup_rounds=1, min_round_time=0.001)
+        def test_benchmark(self):
+            sum(range(100))
+
+    evaluate_options = {'max_noise': 0.2, 'regression_threshold': 0.1, 'significance': 0.01}
+
+    def test_measure(self):
+        """Feature: Benchmarks
+
+        Scenario: Measuring a callable
+            Given a fast callable
+            When it is measured
+            Then the iterations should be calibrated to reach the minimum round time
+            And the duration of an iteration should be returned for each round
+        """
+        calls = []
+
+        iterations, timings = measure(lambda: calls.append(None), rounds=3, warmup_rounds=2, min_round_time=0.001)
+
+        self.assertGreater(iterations, 1)
+        self.assertEqual(len(timings), 3)
+        self.assertGreaterEqual(len(calls), 5 * iterations)
+
+    def test_regression_p_value(self):
+        """Feature: Benchmarks
+
+        Scenario: Testing timings for a regression
+            Given the timings of a baseline
+            Then clearly slower timings should have a significant p-value
+            And equal or faster timings should not
+        """
+        baseline = [1.0 + i / 100 for i in range(20)]
+
+        self.assertLess(regression_p_value(baseline, [2.0 + i / 100 for i in range(20)]), 0.001)
+        self.assertGreater(regression_p_value(baseline, baseline), 0.4)
+        self.assertGreater(regression_p_value(baseline, [0.5 + i / 100 for i in range(20)]), 0.99)
+
+    def test_evaluate(self):
+        """Feature: Benchmarks
+
+        Scenario: Evaluating a benchmark
+            Given the timings of a baseline
+            Then significantly slower timings should be a regression
+            And slower timings below the regression threshold should not be a regression
+            And widely varying timings should be noisy
+        """
+        baseline = [1.0 + i / 100 for i in range(20)]
+
+        result = BenchmarkResult.evaluate(1, [1.5 + i / 100 for i in range(20)], baseline, **self.evaluate_options)
+        self.assertTrue(result.regression)
+        self.assertFalse(result.noisy)
+        self.assertAlmostEqual(result.change, 0.5)
+
+        result = BenchmarkResult.evaluate(1, [1.05 + i / 100 for i in range(20)], baseline, **self.evaluate_options)
+        self.assertFalse(result.regression)
+
+        result = BenchmarkResult.evaluate(1, [1.0, 2.0, 1.0, 3.0], **self.evaluate_options)
+        self.assertTrue(result.noisy)
+        self.assertIsNone(result.p_value)
+
+    def test_baselines(self):
+        """Feature: Benchmarks
+
+        Scenario: Updating the baselines
+            Given a baseline file
+            When it is updated with the results of benchmarks
+            Then new benchmarks and reliable results should become the baselines
+            And regressions should keep their previous baselines
+        """
+        with TemporaryDirectory() as report_dir:
+            path = Path(report_dir, 'benchmark-baselines.json')
+            baseline = [1.0 + i / 100 for i in range(20)]
+            BenchmarkBaselines(path).update({'a': BenchmarkResult(1, tuple(baseline)), 'b': BenchmarkResult(1, (1.0,))})
+
+            baselines = BenchmarkBaselines(path)
+            baselines.update(
+                {
+                    'a': BenchmarkResult.evaluate(1, [2.0] * 20, baselines.get('a'), **self.evaluate_options),
+                    'b': BenchmarkResult.evaluate(1, [0.5] * 20, baselines.get('b'), **self.evaluate_options),
+                }
+            )
+
+            self.assertEqual(BenchmarkBaselines(path).get('a'), tuple(baseline))
+            self.assertEqual(BenchmarkBaselines(path).get('b'), (0.5,) * 20)
+            self.assertEqual(BenchmarkBaselines(path).get('c'), ())
+
+    def test_benchmark_decorator(self):
+        """Feature: Benchmarks
+
+        Scenario: Benchmarking a test method
+            Given a test method decorated with benchmark
+            When it is run without a baseline
+            Then the test should pass
+            And the benchmark result should be stored on the test
+            When it is run with a much faster baseline
+            Then the test should fail with a regression or a precondition failure for noisy timings
+        """
+        test = self.DummyTests('test_benchmark')
+        test.test_benchmark()
+        self.assertEqual(len(test.benchmark_result.timings), 5)
+
+        with TemporaryDirectory() as report_dir:
+            test.benchmark_baselines = BenchmarkBaselines(Path(report_dir, 'benchmark-baselines.json'))
+            test.benchmark_baselines.baselines[test.id()] = [1e-9] * 5
+            with self.assertRaisesRegex(AssertionError, 'Benchmark regression') as cm:
+                test.test_benchmark()
+
+        self.assertTrue(test.benchmark_result.regression)
+        self.assertEqual(isinstance(cm.exception, PreconditionError), test.benchmark_result.noisy)
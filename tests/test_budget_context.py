@@ -0,0 +1,115 @@
+import os
+from unittest import TestCase
+from unittest.mock import patch
+
+from django.core.management.base import OutputWrapper
+from django.db import connection
+
+from anfema_django_testutils.runner import HtmlTestResult
+from anfema_django_testutils.testcases import BudgetContext, BudgetExceededError, TestCaseMixin
+
+
+def execute_queries(num):
+    with connection.cursor() as cursor:
+        for pk in range(num):
+            cursor.execute('SELECT %s', [pk])
+
+
+class BudgetContextTestCase(TestCase):
+    databases = {'default'}
+
+    class DummyTests(TestCaseMixin, TestCase):
+        databases = {'default'}
+
+        def test_within_budget(self):
+            with self.assertMaxQueries(3):
+                execute_queries(3)
+
+        def test_budget_exceeded(self):
+            with self.assertMaxQueries(3):
+                execute_queries(4)
+
+        def test_budget_exceeded_subtest(self):
+            with self.subTest(), self.assertMaxDuration(0):
+                execute_queries(1)
+
+    def test_within_budget(self):
+        """Feature: Performance budgets
+
+        Scenario: Staying within the budget
+            Given a budget context with limits for queries, query duration, wall time and memory
+            When the code within the context stays below all limits
+            Then no exception should be raised
+            And the measured values should be available from the context
+        """
+        with BudgetContext(max_queries=3, max_query_duration=10, max_duration=10, max_memory=10**7) as budget:
+            execute_queries(2)
+
+        self.assertEqual(budget.query_counter.count, 2)
+        self.assertLess(budget.duration, 10)
+        self.assertIsNotNone(budget.memory)
+
+    def test_budget_exceeded(self):
+        """Feature: Performance budgets
+
+        Scenario: Exceeding the budget
+            Given a budget context with limits for queries and memory
+            When the code within the context exceeds both limits
+            Then a BudgetExceededError should be raised
+            And its message should describe each exceeded limit
+            And its message should list the repeated queries
+        """
+        with self.assertRaises(BudgetExceededError) as cm:
+            with BudgetContext(max_queries=2, max_memory=1000, msg='too expensive'):
+                execute_queries(3)
+                data = [object() for _ in range(100)]  # noqa: F841
+
+        message = str(cm.exception)
+        self.assertTrue(cm.exception.__budget_exceeded__)
+        self.assertIn('3 queries executed, 2 allowed', message)
+        self.assertIn('3x SELECT ?', message)
+        self.assertIn('bytes, 1000 bytes allowed', message)
+        self.assertTrue(message.endswith(' : too expensive'))
+
+    def test_exception_within_budget_context(self):
+        """Feature: Performance budgets
+
+        Scenario: Raising an exception within the budget context
+            Given a budget context with a query limit
+            When the code within the context exceeds the limit and raises an exception
+            Then the exception should be propagated rather than a BudgetExceededError
+        """
+        with self.assertRaises(ValueError):
+            with BudgetContext(max_queries=0):
+                execute_queries(1)
+                raise ValueError
+
+    def test_budget_exceeded_result(self):
+        """Feature: Performance budgets
+
+        Scenario: Reporting exceeded budgets
+            Given tests asserting query and duration budgets
+            When the tests are run
+            Then the tests exceeding their budgets should have the result 'budget_exceeded'
+            And the test run should not be successful
+        """
+        with patch.object(HtmlTestResult, 'options', {'no_color': True}, create=True), open(
+            os.devnull, 'w'
+        ) as null_stream:
+            result = HtmlTestResult()
+            result.stdout = OutputWrapper(null_stream)
+            for name in ('test_within_budget', 'test_budget_exceeded', 'test_budget_exceeded_subtest'):
+                self.DummyTests(name).run(result)
+            result_data = result.make_result_data()
+
+        tests = next(iter(result_data['testcases'].values()))['tests']
+        self.assertEqual(
+            {test.name: test.result for test in tests},
+            {
+                'test_within_budget': 'passed',
+                'test_budget_exceeded': 'budget_exceeded',
+                'test_budget_exceeded_subtest': 'budget_exceeded',
+            },
+        )
+        self.assertEqual(result_data['summary']['budget_exceeded'], 2)
+        self.assertFalse(result.wasSuccessful())
@@ -0,0 +1,120 @@
+import json
+import pathlib
+from tempfile import TemporaryDirectory
+
+from django.core.management import call_command
+from django.db import connection
+from django.db.models.signals import post_save
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from test_project.models import Item, SpecialItem, Tag
+
+from anfema_django_testutils.contrib.fixtures.cache import fixture_cache
+from anfema_django_testutils.contrib.fixtures.loader import BulkLoader
+
+
+ITEMS = [
+    {'model': 'test_project.item', 'pk': 2, 'fields': {'name': 'child', 'parent': 1, 'tags': [1, 2]}},
+    {'model': 'test_project.item', 'pk': 1, 'fields': {'name': 'parent', 'parent': None, 'tags': []}},
+    {'model': 'test_project.tag', 'pk': 1, 'fields': {'name': 'first'}},
+    {'model': 'test_project.tag', 'pk': 2, 'fields': {'name': 'second'}},
+    {'model': 'test_project.item', 'pk': 3, 'fields': {'name': 'special', 'parent': None, 'tags': [2]}},
+    {'model': 'test_project.specialitem', 'pk': 3, 'fields': {'special': True}},
+]
+
+
+class BulkLoaderTestCase(TestCase):
+    def setUp(self) -> None:
+        fixture_dir = TemporaryDirectory()
+        self.addCleanup(fixture_dir.cleanup)
+        self.fixture_dir = pathlib.Path(fixture_dir.name)
+        (self.fixture_dir / 'items.json').write_text(json.dumps(ITEMS))
+        fixture_dirs = override_settings(FIXTURE_DIRS=[fixture_dir.name])
+        fixture_dirs.enable()
+        self.addCleanup(fixture_dirs.disable)
+
+    def test_loaddata_bulk(self):
+        """Feature: Bulk loader
+
+        Scenario: Loading a fixture with the bulk loader
+            Given a fixture with forward references, many-to-many relations and multi-table inheritance
+            When the fixture is loaded by the loaddata command with the --bulk option
+            Then the objects should be inserted grouped by model
+            And the multi-table inherited objects should be saved on their own
+            And all objects and relations should be installed
+        """
+        with CaptureQueriesContext(connection) as queries:
+            call_command('loaddata', 'items', bulk=True, verbosity=0)
+
+        inserts = [query['sql'].split('(')[0] for query in queries if query['sql'].startswith('INSERT')]
+        self.assertEqual(
+            sorted(inserts),
+            [
+                'INSERT INTO "test_project_item" ',
+                'INSERT INTO "test_project_item_tags" ',
+                'INSERT INTO "test_project_specialitem" ',
+                'INSERT INTO "test_project_tag" ',
+            ],
+        )
+
+        self.assertEqual(Item.objects.get(pk=2).parent_id, 1)
+        self.assertEqual(list(Item.objects.get(pk=2).tags.values_list('name', flat=True)), ['first', 'second'])
+        self.assertEqual(list(SpecialItem.objects.get(pk=3).tags.values_list('name', flat=True)), ['second'])
+
+    def test_loaddata_bulk_existing_objects(self):
+        """Feature: Bulk loader
+
+        Scenario: Loading a fixture with the bulk loader into a database which already contains its objects
+            Given the FIXTURE_BULK_LOAD_ENABLED setting is set
+            And objects of the fixture which already exist in the database
+            When the fixture is loaded by the loaddata command
+            Then the existing objects should be updated
+        """
+        Tag.objects.create(pk=1, name='outdated')
+
+        with override_settings(FIXTURE_BULK_LOAD_ENABLED=True):
+            call_command('loaddata', 'items', verbosity=0)
+
+        self.assertEqual(Tag.objects.get(pk=1).name, 'first')
+        self.assertEqual(Tag.objects.count(), 2)
+
+    def test_loaddata_bulk_without_fixture_cache(self):
+        """Feature: Bulk loader
+
+        Scenario: Loading a fixture with the bulk loader while the fixture cache is disabled
+            Given the FIXTURE_BULK_LOAD_ENABLED setting is set
+            And the FIXTURE_CACHE_ENABLED setting is not set
+            When a fixture is loaded by the loaddata command
+            Then its objects should be installed
+            And its parsed content should neither be cached in-process nor in the FIXTURE_CACHE_DIR
+        """
+        cache_dir = self.fixture_dir / 'cache'
+        self.addCleanup(fixture_cache.clear)
+
+        with override_settings(
+            FIXTURE_BULK_LOAD_ENABLED=True, FIXTURE_CACHE_ENABLED=False, FIXTURE_CACHE_DIR=str(cache_dir)
+        ):
+            call_command('loaddata', 'items', verbosity=0)
+
+        self.assertEqual(Tag.objects.count(), 2)
+        self.assertNotIn(str(self.fixture_dir / 'items.json'), fixture_cache._cache)
+        self.assertFalse(cache_dir.exists())
+
+    def test_is_bulk_loadable(self):
+        """Feature: Bulk loader
+
+        Scenario: Falling back to saving the objects of models with signals or multi-table inheritance
+            Given models with and without post_save receivers, and with multi-table inheritance
+            Then only the objects of models without receivers and multi-table inheritance should be bulk loadable
+        """
+
+        def receiver(**kwargs):
+            pass
+
+        self.assertTrue(BulkLoader.is_bulk_loadable(Tag))
+        self.assertFalse(BulkLoader.is_bulk_loadable(SpecialItem))
+
+        post_save.connect(receiver, sender=Tag)
+        self.addCleanup(post_save.disconnect, receiver, sender=Tag)
+        self.assertFalse(BulkLoader.is_bulk_loadable(Tag))
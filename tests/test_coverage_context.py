@@ -1,9 +1,11 @@
 import os
+import sys
 from tempfile import TemporaryDirectory
 from unittest import TestCase
 from unittest.mock import patch
 
 from django.core.management.base import OutputWrapper
+from django.test import override_settings
 
 from anfema_django_testutils.runner import CoverageContext
 
@@ -69,3 +71,141 @@ class CoverageContextTestCase(TestCase):
         mock_coverage_context_stop.assert_called_once()
         mock_coverage_context_save.assert_called_once()
         mock_coverage_context_html_report.assert_called_once_with(directory=f"{self.report_dir}/coverage")
+
+
+@patch.object(CoverageContext, 'start')
+@patch.object(CoverageContext, 'stop')
+@patch.object(CoverageContext, 'save')
+@patch.object(CoverageContext, 'combine')
+@patch.object(CoverageContext, 'html_report')
+class ParallelCoverageContextTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.report_dir = TemporaryDirectory()
+        cls.null_stream = open(os.devnull, 'w')
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.report_dir.cleanup()
+        cls.null_stream.close()
+
+    def test_parallel_coverage_context_exit(
+        self,
+        mock_coverage_context_html_report,
+        mock_coverage_context_combine,
+        mock_coverage_context_save,
+        mock_coverage_context_stop,
+        mock_coverage_context_start,
+    ):
+        """Feature: Coverage Context
+
+        Scenario: Exiting a parallel Coverage Context
+            Given a parallel Coverage Context instance
+            When exiting the Coverage Context
+            Then the 'combine' method of Coverage Context should be called once
+            And the 'save' method of Coverage Context should be called before and after combining
+            And the 'html_report' method of Coverage Context should be called once
+        """
+        coverage_context = CoverageContext(self.report_dir.name, parallel=True)
+        coverage_context.stdout = OutputWrapper(self.null_stream)
+        coverage_context.__exit__(None, None, None)
+        mock_coverage_context_stop.assert_called_once()
+        mock_coverage_context_combine.assert_called_once()
+        self.assertEqual(mock_coverage_context_save.call_count, 2)
+        mock_coverage_context_html_report.assert_called_once_with(directory=f"{self.report_dir.name}/coverage")
+
+    def test_non_parallel_coverage_context_exit_does_not_combine(
+        self,
+        mock_coverage_context_html_report,
+        mock_coverage_context_combine,
+        mock_coverage_context_save,
+        mock_coverage_context_stop,
+        mock_coverage_context_start,
+    ):
+        """Feature: Coverage Context
+
+        Scenario: Exiting a non-parallel Coverage Context
+            Given a non-parallel Coverage Context instance
+            When exiting the Coverage Context
+            Then the 'combine' method of Coverage Context should not be called
+        """
+        coverage_context = CoverageContext(self.report_dir.name)
+        coverage_context.stdout = OutputWrapper(self.null_stream)
+        coverage_context.__exit__(None, None, None)
+        mock_coverage_context_combine.assert_not_called()
+        mock_coverage_context_save.assert_called_once()
+
+
+class CoverageContextOptionsTestCase(TestCase):
+    def setUp(self) -> None:
+        self.report_dir = TemporaryDirectory()
+        self.addCleanup(self.report_dir.cleanup)
+
+    def test_coverage_core(self):
+        """Feature: Coverage Context
+
+        Scenario: Choosing the coverage core
+            Given a Coverage Context instance with a coverage core
+            Then the core should be passed to coverage
+            And the sys.monitoring core should only be used if supported
+        """
+        self.assertEqual(CoverageContext(self.report_dir.name, core="pytrace").get_option("run:core"), "pytrace")
+        self.assertIsNone(CoverageContext(self.report_dir.name).get_option("run:core"))
+        self.assertIsNone(
+            CoverageContext(self.report_dir.name, core="sysmon", record_contexts=True).get_option("run:core")
+        )
+        self.assertEqual(
+            CoverageContext(self.report_dir.name, core="sysmon").get_option("run:core"),
+            "sysmon" if sys.version_info >= (3, 12) else None,
+        )
+
+    def test_coverage_options(self):
+        """Feature: Coverage Context
+
+        Scenario: Creating a Coverage Context from the test runner options
+            Given the test runner options and the COVERAGE_SOURCE setting
+            Then the branch and source options should be passed to coverage
+        """
+        with override_settings(COVERAGE_SOURCE=["anfema_django_testutils"]):
+            coverage_context = CoverageContext(
+                self.report_dir.name, **CoverageContext.get_coverage_options({"coverage_branch": True})
+            )
+
+        self.assertTrue(coverage_context.get_option("run:branch"))
+        self.assertEqual(coverage_context.get_option("run:source"), ["anfema_django_testutils"])
+
+
+@patch.object(CoverageContext, 'stop')
+@patch.object(CoverageContext, 'save')
+@patch.object(CoverageContext, 'html_report')
+@patch.object(CoverageContext, 'xml_report')
+@patch.object(CoverageContext, 'json_report')
+class CoverageContextReportFormatsTestCase(TestCase):
+    def setUp(self) -> None:
+        self.report_dir = TemporaryDirectory()
+        self.addCleanup(self.report_dir.cleanup)
+        self.null_stream = open(os.devnull, 'w')
+        self.addCleanup(self.null_stream.close)
+
+    def test_summary_reports_only(
+        self,
+        mock_coverage_context_json_report,
+        mock_coverage_context_xml_report,
+        mock_coverage_context_html_report,
+        mock_coverage_context_save,
+        mock_coverage_context_stop,
+    ):
+        """Feature: Coverage Context
+
+        Scenario: Exiting a Coverage Context which only generates the summary reports
+            Given a Coverage Context instance with the report formats 'xml' and 'json'
+            When exiting the Coverage Context
+            Then the 'html_report' method of Coverage Context should not be called
+            And the XML and JSON reports should be stored within the report directory
+        """
+        coverage_context = CoverageContext(self.report_dir.name, report_formats=("xml", "json"))
+        coverage_context.stdout = OutputWrapper(self.null_stream)
+        coverage_context.__exit__(None, None, None)
+        mock_coverage_context_html_report.assert_not_called()
+        mock_coverage_context_xml_report.assert_called_once_with(outfile=f"{self.report_dir.name}/coverage.xml")
+        mock_coverage_context_json_report.assert_called_once_with(outfile=f"{self.report_dir.name}/coverage.json")
@@ -0,0 +1,83 @@
+import pathlib
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from django.db.utils import ConnectionHandler
+from django.test import override_settings
+
+from anfema_django_testutils.databases import DatabaseTemplate, SQLiteDatabaseTemplate, get_database_fingerprint
+
+
+class DatabaseTemplateTestCase(TestCase):
+    def setUp(self) -> None:
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = pathlib.Path(temp_dir.name)
+
+    def get_connection(self, name):
+        connections = ConnectionHandler(
+            {
+                'default': {
+                    'ENGINE': 'django.db.backends.sqlite3',
+                    'NAME': str(self.temp_dir / name),
+                    'TEST': {'NAME': str(self.temp_dir / 'test.sqlite3')},
+                }
+            }
+        )
+        self.addCleanup(connections.close_all)
+        return connections['default']
+
+    def test_fingerprint(self):
+        """Feature: Database templates
+
+        Scenario: Fingerprinting the migrations, models and fixtures
+            Given the fingerprint of the test databases
+            When it is computed again
+            Then it should be the same
+            When fixture media files and other files are added to a fixture directory
+            Then it should stay the same
+            When a compressed fixture file is added
+            Then it should change
+        """
+        fingerprint = get_database_fingerprint()
+        self.assertEqual(get_database_fingerprint(), fingerprint)
+
+        (self.temp_dir / 'media').mkdir()
+        (self.temp_dir / 'media' / 'image.png').write_bytes(b'')
+        (self.temp_dir / 'readme.txt').write_text('')
+        with override_settings(FIXTURE_DIRS=[str(self.temp_dir)]):
+            self.assertEqual(get_database_fingerprint(), fingerprint)
+
+        (self.temp_dir / 'fixture.json.gz').write_bytes(b'')
+        with override_settings(FIXTURE_DIRS=[str(self.temp_dir)]):
+            self.assertNotEqual(get_database_fingerprint(), fingerprint)
+
+    def test_sqlite_template(self):
+        """Feature: Database templates
+
+        Scenario: Saving and restoring an SQLite template
+            Given a migrated SQLite database saved as template
+            When the test database is created from the template
+            Then it should contain the tables and data of the migrated database
+            When another template is saved for the same database
+            Then the outdated template should be deleted
+        """
+        connection = self.get_connection('migrated.sqlite3')
+        with connection.cursor() as cursor:
+            cursor.execute('CREATE TABLE item (name TEXT)')
+            cursor.execute("INSERT INTO item VALUES ('migrated')")
+        template = DatabaseTemplate.for_connection(connection, 'fingerprint', self.temp_dir / 'templates')
+        self.assertIsInstance(template, SQLiteDatabaseTemplate)
+        self.assertFalse(template.exists())
+        template.save()
+        self.assertTrue(template.exists())
+
+        test_connection = self.get_connection('test.sqlite3')
+        test_template = DatabaseTemplate.for_connection(test_connection, 'fingerprint', self.temp_dir / 'templates')
+        test_template.restore(verbosity=0, autoclobber=True)
+        with test_connection.cursor() as cursor:
+            cursor.execute('SELECT name FROM item')
+            self.assertEqual(cursor.fetchall(), [('migrated',)])
+
+        DatabaseTemplate.for_connection(connection, 'changed', self.temp_dir / 'templates').save()
+        self.assertFalse(template.exists())
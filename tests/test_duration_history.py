@@ -0,0 +1,68 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from django.utils import timezone
+
+from anfema_django_testutils.history import DurationHistory
+
+
+class DurationHistoryTestCase(TestCase):
+    def setUp(self) -> None:
+        self.report_dir = TemporaryDirectory()
+        self.path = Path(self.report_dir.name, 'test-durations.sqlite3')
+
+    def tearDown(self) -> None:
+        self.report_dir.cleanup()
+
+    def test_medians_of_latest_runs(self):
+        """Feature: Duration History
+
+        Scenario: Computing the rolling medians
+            Given a duration history with a window of 3 runs
+            When 4 test runs have been stored
+            Then the median of each test should only consider its latest 3 durations
+            And tests missing in some runs should only consider the runs they have been part of
+        """
+        with DurationHistory(self.path, window=3) as history:
+            for duration in (10.0, 1.0, 2.0, 3.0):
+                history.add_run(timezone.now(), [('tests.CustomTest.test_one', duration)])
+            history.add_run(timezone.now(), [('tests.CustomTest.test_two', 0.5)])
+
+            self.assertEqual(
+                history.get_medians(), {'tests.CustomTest.test_one': 2.0, 'tests.CustomTest.test_two': 0.5}
+            )
+
+    def test_history_is_persisted_and_pruned(self):
+        """Feature: Duration History
+
+        Scenario: Reopening the duration history
+            Given a duration history which keeps at most 2 runs
+            When 3 test runs have been stored and the history has been reopened
+            Then only the durations of the latest 2 runs should be taken into account
+        """
+        for duration in (10.0, 1.0, 2.0):
+            with DurationHistory(self.path, max_runs=2) as history:
+                history.add_run(timezone.now(), [('tests.CustomTest.test_one', duration)])
+
+        with DurationHistory(self.path) as history:
+            self.assertEqual(history.get_medians(), {'tests.CustomTest.test_one': 1.5})
+
+    def test_regressions(self):
+        """Feature: Duration History
+
+        Scenario: Detecting duration regressions
+            Given the median durations of previous test runs
+            When the durations of the current test run are compared to them
+            Then only tests which got significantly slower should be reported
+            And tests below the minimum regression duration or without history should be ignored
+            And the regressions should be ordered by their change
+        """
+        medians = {'slower': 1.0, 'much_slower': 1.0, 'stable': 1.0, 'fast': 0.01}
+        durations = [('slower', 2.0), ('much_slower', 4.0), ('stable', 1.2), ('fast', 0.05), ('new', 5.0)]
+
+        with DurationHistory(self.path) as history:
+            regressions = history.get_regressions(durations, medians)
+
+        self.assertEqual([trend.test_id for trend in regressions], ['much_slower', 'slower'])
+        self.assertEqual(regressions[0].change, 3.0)
@@ -0,0 +1,158 @@
+import pathlib
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from django.test import override_settings
+
+from anfema_django_testutils.contrib.fixtures.finders import base, media
+from anfema_django_testutils.contrib.fixtures.finders.base import FinderIndex
+
+
+class FinderIndexTestCase(TestCase):
+    def setUp(self) -> None:
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = pathlib.Path(temp_dir.name)
+        self.first_dir = self.temp_dir / 'first'
+        self.second_dir = self.temp_dir / 'second'
+        for location in (self.first_dir, self.second_dir):
+            (location / 'images').mkdir(parents=True)
+            (location / 'images' / 'image.png').write_bytes(b'')
+
+        class Finder(media.FileSystemFinder):
+            search_dirs = [str(self.first_dir), str(self.second_dir)]
+
+        finder = Finder()
+        patcher = patch.object(base, 'get_finder', lambda import_path: finder)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_find(self):
+        """Feature: Finder index
+
+        Scenario: Finding files using the finder index
+            Given a file within two locations of a finder
+            When the file is looked up in the index
+            Then the path of the first location should be returned
+            And the paths of both locations should be returned, if all matches are requested
+            When a directory is looked up in the index
+            Then the paths of the directory within both locations should be returned
+        """
+        index = FinderIndex(['Finder'])
+
+        self.assertEqual(index.find('images/image.png'), str(self.first_dir / 'images' / 'image.png'))
+        self.assertEqual(
+            index.find('images/image.png', all=True),
+            [str(self.first_dir / 'images' / 'image.png'), str(self.second_dir / 'images' / 'image.png')],
+        )
+        self.assertEqual(
+            index.find('images', all=True), [str(self.first_dir / 'images'), str(self.second_dir / 'images')]
+        )
+
+    def test_find_missing_file(self):
+        """Feature: Finder index
+
+        Scenario: Not finding a file using the finder index
+            Given a built finder index
+            When a file which isn't contained by any location is looked up
+            Then it should not be found
+            And neither the directories should be checked for changes nor the finders be asked
+            When a file is added to a location
+            Then it should be found once the index has been rebuilt
+        """
+        index = FinderIndex(['Finder'])
+        index.build()
+
+        with patch.object(index, 'is_valid') as is_valid, patch.object(base, '_find_file') as find_file:
+            self.assertIsNone(index.find('images/missing.png'))
+            self.assertEqual(index.find('images/missing.png', all=True), [])
+        is_valid.assert_not_called()
+        find_file.assert_not_called()
+
+        (self.second_dir / 'images' / 'added.png').write_bytes(b'')
+        self.assertIsNone(index.find('images/added.png'))
+        index.build()
+        self.assertEqual(index.find('images/added.png'), str(self.second_dir / 'images' / 'added.png'))
+
+    def test_find_removed_file(self):
+        """Feature: Finder index
+
+        Scenario: Finding a file which has been removed since the index has been built
+            Given a file within two locations of a finder, which has been found using the index
+            When the file is removed from the first location
+            Then the path of the second location should be returned
+            When the file is renamed within the second location
+            Then it should not be found anymore
+            And it should be found by its new name
+        """
+        index = FinderIndex(['Finder'])
+        self.assertEqual(index.find('images/image.png'), str(self.first_dir / 'images' / 'image.png'))
+
+        (self.first_dir / 'images' / 'image.png').unlink()
+        self.assertEqual(index.find('images/image.png'), str(self.second_dir / 'images' / 'image.png'))
+        self.assertEqual(index.find('images/image.png', all=True), [str(self.second_dir / 'images' / 'image.png')])
+
+        (self.second_dir / 'images' / 'image.png').rename(self.second_dir / 'images' / 'renamed.png')
+        self.assertIsNone(index.find('images/image.png'))
+        self.assertEqual(index.find('images/image.png', all=True), [])
+        self.assertEqual(index.find('images/renamed.png'), str(self.second_dir / 'images' / 'renamed.png'))
+
+    def test_cache_dir(self):
+        """Feature: Finder index
+
+        Scenario: Sharing the finder index between processes
+            Given the FIXTURE_CACHE_DIR setting is set
+            When the index has been built by one process
+            Then another process should load the index from the cache directory without walking the locations
+        """
+        with override_settings(FIXTURE_CACHE_DIR=str(self.temp_dir / 'cache')):
+            FinderIndex(['Finder']).build()
+
+            index = FinderIndex(['Finder'])
+            with patch.object(index, 'build') as build:
+                self.assertEqual(index.find('images/image.png'), str(self.first_dir / 'images' / 'image.png'))
+            build.assert_not_called()
+
+    def test_cache_dir_changed_locations(self):
+        """Feature: Finder index
+
+        Scenario: Changing the locations of the finders between processes
+            Given the FIXTURE_CACHE_DIR setting is set
+            And the index has been built by one process
+            When the locations of the finders have been changed, e.g. by changing the FIXTURE_DIRS setting
+            Then another process should rebuild the index rather than loading it from the cache directory
+        """
+        with override_settings(FIXTURE_CACHE_DIR=str(self.temp_dir / 'cache')):
+            FinderIndex(['Finder']).build()
+
+            third_dir = self.temp_dir / 'third'
+            (third_dir / 'images').mkdir(parents=True)
+            (third_dir / 'images' / 'image.png').write_bytes(b'')
+
+            class Finder(media.FileSystemFinder):
+                search_dirs = [str(third_dir), str(self.first_dir)]
+
+            with patch.object(base, 'get_finder', lambda import_path: Finder()):
+                index = FinderIndex(['Finder'])
+                self.assertEqual(
+                    index.find('images/image.png', all=True),
+                    [str(third_dir / 'images' / 'image.png'), str(self.first_dir / 'images' / 'image.png')],
+                )
+
+    def test_find_file(self):
+        """Feature: Finder index
+
+        Scenario: Finding fixture media files with the finder index enabled
+            Given the FIXTURE_FINDER_INDEX_ENABLED setting is set
+            When a file is looked up by the finders
+            Then it should be looked up in the finder index
+        """
+        with override_settings(FIXTURE_FINDER_INDEX_ENABLED=True):
+            self.assertEqual(
+                media.find('images/image.png', all=True),
+                [str(self.first_dir / 'images' / 'image.png'), str(self.second_dir / 'images' / 'image.png')],
+            )
+            self.assertIn(
+                ('anfema_django_testutils.contrib.fixtures.finders.media.AppDirectoriesFinder',), base._finder_indexes
+            )
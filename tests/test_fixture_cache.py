@@ -0,0 +1,100 @@
+import json
+import os
+import pathlib
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.test import TestCase as DjangoTestCase
+from django.test import override_settings
+
+from anfema_django_testutils.contrib.fixtures.cache import FixtureCache, fixture_cache
+
+
+CONTENT_TYPES = [{'model': 'contenttypes.contenttype', 'pk': 1000, 'fields': {'app_label': 'cached', 'model': 'item'}}]
+
+
+class FixtureCacheTestCase(TestCase):
+    def setUp(self) -> None:
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = pathlib.Path(temp_dir.name)
+        self.fixture_file = self.temp_dir / 'content_types.json'
+        self.fixture_file.write_text(json.dumps(CONTENT_TYPES))
+
+    def test_get(self):
+        """Feature: Fixture cache
+
+        Scenario: Caching the parsed content of a fixture file
+            Given a JSON fixture file
+            When its content is requested twice
+            Then the fixture file should only be parsed once
+            When the fixture file is changed
+            Then its content should be parsed again
+        """
+        cache = FixtureCache()
+
+        objects = cache.get(self.fixture_file, 'json', open, 'rb')
+        self.assertEqual(objects, CONTENT_TYPES)
+        self.assertIs(cache.get(self.fixture_file, 'json', open, 'rb'), objects)
+
+        self.fixture_file.write_text('[]')
+        os.utime(self.fixture_file, ns=(0, 0))
+        self.assertEqual(cache.get(self.fixture_file, 'json', open, 'rb'), [])
+
+    def test_yaml(self):
+        """Feature: Fixture cache
+
+        Scenario: Caching a YAML fixture file
+            Given a YAML fixture file
+            When its content is requested
+            Then it should be parsed like Django's YAML deserializer does
+        """
+        fixture_file = self.temp_dir / 'content_types.yaml'
+        fixture_file.write_text(
+            '- model: contenttypes.contenttype\n'
+            '  pk: 1000\n'
+            '  fields:\n'
+            '    app_label: cached\n'
+            '    model: item\n'
+        )
+
+        self.assertEqual(FixtureCache().get(fixture_file, 'yaml', open, 'rb'), CONTENT_TYPES)
+        self.assertFalse(FixtureCache().is_cacheable('xml'))
+
+    def test_cache_dir(self):
+        """Feature: Fixture cache
+
+        Scenario: Sharing the parsed fixtures between processes
+            Given the FIXTURE_CACHE_DIR setting is set
+            When the content of a fixture file has been requested by one process
+            Then another process should read the content from the cache directory without parsing the file
+        """
+        with override_settings(FIXTURE_CACHE_DIR=str(self.temp_dir / 'cache')):
+            FixtureCache().get(self.fixture_file, 'json', open, 'rb')
+            with patch.dict(FixtureCache.parsers, json=None):
+                self.assertEqual(FixtureCache().get(self.fixture_file, 'json', open, 'rb'), CONTENT_TYPES)
+
+
+class LoadDataTestCase(DjangoTestCase):
+    def test_loaddata_with_fixture_cache(self):
+        """Feature: Fixture cache
+
+        Scenario: Loading a fixture with the fixture cache
+            Given the FIXTURE_CACHE_ENABLED setting is set
+            When a fixture is loaded by the loaddata command
+            Then its objects should be installed
+            And its parsed content should be cached
+        """
+        with TemporaryDirectory() as fixture_dir:
+            fixture_file = pathlib.Path(fixture_dir, 'content_types.json')
+            fixture_file.write_text(json.dumps(CONTENT_TYPES))
+            self.addCleanup(fixture_cache.clear)
+
+            with override_settings(FIXTURE_DIRS=[fixture_dir], FIXTURE_CACHE_ENABLED=True):
+                call_command('loaddata', 'content_types', verbosity=0)
+
+            self.assertTrue(ContentType.objects.filter(app_label='cached', model='item').exists())
+            self.assertIn(str(fixture_file), fixture_cache._cache)
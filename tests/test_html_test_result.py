@@ -0,0 +1,151 @@
+import os
+import sys
+import weakref
+from unittest import TestCase
+from unittest.mock import patch
+from unittest.suite import _ErrorHolder
+from unittest.util import strclass
+
+from django.core.management.base import OutputWrapper
+
+from anfema_django_testutils.runner import HtmlTestResult
+
+
+class HtmlTestResultSummaryTestCase(TestCase):
+    class DummyTests(TestCase):
+        def test_one(self):
+            pass
+
+        def test_two(self):
+            pass
+
+        def test_three(self):
+            pass
+
+    class OtherDummyTests(TestCase):
+        def test_one(self):
+            pass
+
+    def setUp(self) -> None:
+        options_patcher = patch.object(HtmlTestResult, 'options', {'no_color': True}, create=True)
+        options_patcher.start()
+        self.addCleanup(options_patcher.stop)
+        self.null_stream = open(os.devnull, 'w')
+        self.result = HtmlTestResult()
+        self.result.stdout = OutputWrapper(self.null_stream)
+
+    def tearDown(self) -> None:
+        self.null_stream.close()
+
+    @property
+    def tests_by_testcase(self):
+        # The result only references the tests weakly, so keep them alive for the test.
+        self.tests = {
+            strclass(self.DummyTests): [self.DummyTests(name) for name in ('test_one', 'test_two', 'test_three')],
+            strclass(self.OtherDummyTests): [self.OtherDummyTests('test_one')],
+        }
+        return {testcase: [weakref.ref(test) for test in tests] for testcase, tests in self.tests.items()}
+
+    def add_failure(self, test):
+        try:
+            test.fail()
+        except AssertionError:
+            self.result.addFailure(test, sys.exc_info())
+
+    def add_error(self, test):
+        try:
+            raise ValueError()
+        except ValueError:
+            self.result.addError(test, sys.exc_info())
+
+    def test_summary_is_updated_incrementally(self):
+        """Feature: HTML Test Result
+
+        Scenario: Summarizing the test results
+            Given an HtmlTestResult instance
+            When tests of different testcases finished with different results
+            Then the number of run tests should match the number of finished tests
+            And the summary should count each result once
+            And each testcase summary should only count its own results
+        """
+        self.result.addSuccess(self.DummyTests('test_one'))
+        self.result.addSkip(self.DummyTests('test_two'), 'reason')
+        self.add_failure(self.DummyTests('test_three'))
+        self.result.addSuccess(self.OtherDummyTests('test_one'))
+
+        result_data = self.result.make_result_data()
+
+        self.assertEqual(self.result.testsRun, 4)
+        self.assertEqual(result_data['summary']['totals'], 4)
+        self.assertEqual(result_data['summary']['passed'], 2)
+        self.assertEqual(result_data['summary']['skipped'], 1)
+        self.assertEqual(result_data['summary']['failure'], 1)
+        self.assertEqual(result_data['summary']['error'], 0)
+
+        dummy_tests = result_data['testcases'][strclass(self.DummyTests)]
+        self.assertEqual(dummy_tests['summary']['totals'], 3)
+        self.assertEqual(dummy_tests['summary']['passed'], 1)
+        self.assertEqual([test.name for test in dummy_tests['tests']], ['test_one', 'test_two', 'test_three'])
+
+        other_dummy_tests = result_data['testcases'][strclass(self.OtherDummyTests)]
+        self.assertEqual(other_dummy_tests['summary']['totals'], 1)
+        self.assertEqual(other_dummy_tests['summary']['passed'], 1)
+        self.assertEqual(other_dummy_tests['summary']['failure'], 0)
+
+    def test_setup_class_failure_is_assigned_to_all_tests_of_the_testcase(self):
+        """Feature: HTML Test Result
+
+        Scenario: Setting up a testcase fails
+            Given an HtmlTestResult instance which knows the tests of each testcase
+            When setting up a testcase raises an error
+            Then each test of this testcase should be recorded as error
+            And the tests of other testcases should not be affected
+        """
+        self.result = HtmlTestResult(tests=self.tests_by_testcase)
+        self.result.stdout = OutputWrapper(self.null_stream)
+        self.add_error(_ErrorHolder(f'setUpClass ({strclass(self.DummyTests)})'))
+
+        result_data = self.result.make_result_data()
+
+        self.assertEqual(result_data['summary']['error'], 3)
+        self.assertEqual(
+            [test.name for test in result_data['testcases'][strclass(self.DummyTests)]['tests']],
+            ['test_one', 'test_two', 'test_three'],
+        )
+        self.assertNotIn(strclass(self.OtherDummyTests), result_data['testcases'])
+
+    def test_setup_module_failure_is_assigned_to_all_tests_of_the_module(self):
+        """Feature: HTML Test Result
+
+        Scenario: Setting up a module fails
+            Given an HtmlTestResult instance which knows the tests of each testcase
+            When setting up a module raises an error
+            Then each test of each testcase of this module should be recorded as error
+        """
+        self.result = HtmlTestResult(tests=self.tests_by_testcase)
+        self.result.stdout = OutputWrapper(self.null_stream)
+        self.add_error(_ErrorHolder(f'setUpModule ({__name__})'))
+
+        result_data = self.result.make_result_data()
+
+        self.assertEqual(result_data['summary']['error'], 4)
+        self.assertEqual(result_data['testcases'][strclass(self.OtherDummyTests)]['summary']['error'], 1)
+
+    def test_teardown_class_failure_is_added_as_separate_result(self):
+        """Feature: HTML Test Result
+
+        Scenario: Tearing down a testcase fails
+            Given an HtmlTestResult instance which knows the tests of each testcase
+            When tearing down a testcase raises an error
+            Then the fixture should be recorded as separate error of this testcase
+        """
+        self.result = HtmlTestResult(tests=self.tests_by_testcase)
+        self.result.stdout = OutputWrapper(self.null_stream)
+        self.add_error(_ErrorHolder(f'tearDownClass ({strclass(self.DummyTests)})'))
+
+        result_data = self.result.make_result_data()
+
+        self.assertEqual(result_data['summary']['totals'], 1)
+        self.assertEqual(
+            [test.name for test in result_data['testcases'][strclass(self.DummyTests)]['tests']], ['tearDownClass']
+        )
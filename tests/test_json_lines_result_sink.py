@@ -0,0 +1,45 @@
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from anfema_django_testutils.reports import JsonLinesResultSink
+
+
+class JsonLinesResultSinkTestCase(TestCase):
+    def setUp(self) -> None:
+        self.report_dir = TemporaryDirectory()
+        self.path = Path(self.report_dir.name, 'test-results.jsonl')
+
+    def tearDown(self) -> None:
+        self.report_dir.cleanup()
+
+    def test_records_are_written_in_batches(self):
+        """Feature: JSON Lines Result Sink
+
+        Scenario: Writing test results
+            Given a JSON Lines result sink with a batch size of 2
+            When a single record has been written
+            Then the file should still be empty
+            When the second record has been written
+            Then the file should contain both records as separate lines
+        """
+        with JsonLinesResultSink(self.path, batch_size=2) as sink:
+            sink.write({'name': 'test_one', 'result': 'passed'})
+            self.assertEqual(self.path.read_text(), '')
+            sink.write({'name': 'test_two', 'result': 'failure'})
+            self.assertEqual(
+                [json.loads(line)['name'] for line in self.path.read_text().splitlines()], ['test_one', 'test_two']
+            )
+
+    def test_buffered_records_are_written_on_close(self):
+        """Feature: JSON Lines Result Sink
+
+        Scenario: Closing the sink
+            Given a JSON Lines result sink with buffered records
+            When the sink is closed
+            Then all buffered records should be written to the file
+        """
+        with JsonLinesResultSink(self.path) as sink:
+            sink.write({'name': 'test_one', 'result': 'passed'})
+        self.assertEqual(len(self.path.read_text().splitlines()), 1)
@@ -0,0 +1,101 @@
+import datetime
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from xml.etree import ElementTree
+
+from anfema_django_testutils.reports import JUnitXmlReportWriter
+from anfema_django_testutils.runner import HtmlTestResult
+
+
+class JUnitXmlReportWriterTestCase(TestCase):
+    supported_results = HtmlTestResult.supported_results
+
+    def setUp(self) -> None:
+        self.report_dir = TemporaryDirectory()
+        self.path = Path(self.report_dir.name, 'test-results.xml')
+
+    def tearDown(self) -> None:
+        self.report_dir.cleanup()
+
+    def make_summary(self, **results):
+        return {
+            'duration': datetime.timedelta(seconds=len(results)),
+            'totals': sum(results.values()),
+            **dict.fromkeys(self.supported_results, 0),
+            **results,
+        }
+
+    def test_write_junit_xml_report(self):
+        """Feature: JUnit XML Report
+
+        Scenario: Writing a JUnit XML report
+            Given the result data of a test run with a passed test and a precondition failure
+            When the JUnit XML report is written
+            Then the report should contain a testsuite with both tests
+            And the precondition failure should be reported as failure of type 'precondition_failure'
+            And the precondition failure should keep its result as property
+        """
+        tests = [
+            HtmlTestResult.TestResultData('test_success', 'passed', datetime.timedelta(seconds=1), ''),
+            HtmlTestResult.TestResultData(
+                'test_precondition',
+                'precondition_failure',
+                datetime.timedelta(seconds=1),
+                'Traceback\nPreconditionError',
+            ),
+        ]
+        result_data = {
+            'summary': {**self.make_summary(passed=1, precondition_failure=1), 'timestamp': None},
+            'testcases': {
+                'app.tests.Tests': {'tests': tests, 'summary': self.make_summary(passed=1, precondition_failure=1)}
+            },
+        }
+
+        JUnitXmlReportWriter(self.path).write(result_data, title='Test Results')
+
+        testsuites = ElementTree.parse(self.path).getroot()
+        self.assertEqual(testsuites.tag, 'testsuites')
+        self.assertEqual(testsuites.get('name'), 'Test Results')
+        self.assertEqual(testsuites.get('tests'), '2')
+        self.assertEqual(testsuites.get('failures'), '1')
+
+        testsuite = testsuites.find('testsuite')
+        self.assertEqual(testsuite.get('name'), 'app.tests.Tests')
+        passed, precondition_failure = testsuite.findall('testcase')
+        self.assertEqual(passed.get('name'), 'test_success')
+        self.assertEqual(list(passed), [])
+
+        failure = precondition_failure.find('failure')
+        self.assertEqual(failure.get('type'), 'precondition_failure')
+        self.assertEqual(failure.get('message'), 'PreconditionError')
+        self.assertEqual(failure.text, 'Traceback\nPreconditionError')
+        self.assertEqual(precondition_failure.find('properties/property').get('value'), 'precondition_failure')
+
+    def test_write_invalid_xml_characters(self):
+        """Feature: JUnit XML Report
+
+        Scenario: Writing a failure whose traceback contains characters which XML doesn't allow
+            Given the result data of a test run with a failure whose traceback contains colored output and NUL bytes
+            When the JUnit XML report is written
+            Then the report should be parsable
+            And the escape sequences should be stripped and the NUL bytes be replaced
+        """
+        tests = [
+            HtmlTestResult.TestResultData(
+                'test_colored',
+                'failure',
+                datetime.timedelta(seconds=1),
+                'Traceback\n\x1b[31mred\x1b[0m output\x00\nAssertionError: \x1b[31mfailed\x1b[0m',
+            ),
+        ]
+        result_data = {
+            'summary': {**self.make_summary(failure=1), 'timestamp': None},
+            'testcases': {'app.tests.Tests': {'tests': tests, 'summary': self.make_summary(failure=1)}},
+        }
+
+        JUnitXmlReportWriter(self.path).write(result_data)
+
+        failure = ElementTree.parse(self.path).getroot().find('testsuite/testcase/failure')
+        self.assertEqual(failure.get('message'), 'AssertionError: failed')
+        self.assertEqual(failure.text, 'Traceback\nred output\ufffd\nAssertionError: failed')
@@ -0,0 +1,110 @@
+import os
+import unittest
+from unittest import TestCase
+from unittest.mock import patch
+from unittest.util import strclass
+
+from django.core.management.base import OutputWrapper
+
+from anfema_django_testutils.memory import MemoryStats, MemoryTracker, get_leaking_testcases
+from anfema_django_testutils.runner import HtmlTestResult
+from anfema_django_testutils.testcases import BudgetContext
+
+
+class MemoryTrackingTestCase(TestCase):
+    class DummyTests(TestCase):
+        retained = []
+
+        def test_temporary(self):
+            bytearray(2**20)
+
+        def test_retaining(self):
+            self.retained.append(bytearray(2**20))
+
+    def test_memory_tracker(self):
+        """Feature: Memory tracking
+
+        Scenario: Tracking the memory of a test
+            Given a test allocating temporary memory and a test retaining memory
+            When their memory is tracked
+            Then both tests should have a peak of at least the allocated memory
+            And only the retaining test should have retained it
+        """
+        memory_tracker = MemoryTracker()
+        self.addCleanup(memory_tracker.stop_tracing)
+        self.addCleanup(self.DummyTests.retained.clear)
+
+        memory_tracker.start()
+        self.DummyTests('test_temporary').test_temporary()
+        temporary_stats = memory_tracker.stop()
+        memory_tracker.start()
+        self.DummyTests('test_retaining').test_retaining()
+        retaining_stats = memory_tracker.stop()
+
+        self.assertGreaterEqual(temporary_stats.peak, 2**20)
+        self.assertLess(temporary_stats.retained, 2**20)
+        self.assertGreaterEqual(retaining_stats.peak, 2**20)
+        self.assertGreaterEqual(retaining_stats.retained, 2**20)
+
+    def test_memory_tracker_with_budget(self):
+        """Feature: Memory tracking
+
+        Scenario: Tracking the memory of a test asserting a memory budget
+            Given a test allocating temporary memory before a block with a memory budget
+            When its memory is tracked
+            Then the budget should only measure the memory allocated within the block
+            And the peak of the test should include the memory allocated before the block
+        """
+        memory_tracker = MemoryTracker()
+        self.addCleanup(memory_tracker.stop_tracing)
+
+        memory_tracker.start()
+        bytearray(2**22)
+        with BudgetContext(max_memory=2**21) as budget:
+            bytearray(2**20)
+        stats = memory_tracker.stop()
+
+        self.assertGreaterEqual(budget.memory, 2**20)
+        self.assertLess(budget.memory, 2**21)
+        self.assertGreaterEqual(stats.peak, 2**22)
+
+    def test_get_leaking_testcases(self):
+        """Feature: Memory tracking
+
+        Scenario: Detecting testcases with growing memory
+            Given the memory stats of the tests of several testcases
+            Then testcases whose tests after the first one all retained memory above the threshold in total
+              should be leaking
+            And testcases with a test releasing memory, too few tests or too little retained memory should not
+        """
+        memory_stats = [
+            *(('leaking', MemoryStats(0, retained)) for retained in (5000, 400, 400, 400)),
+            *(('stable', MemoryStats(0, retained)) for retained in (5000, 400, -400, 400)),
+            *(('short', MemoryStats(0, retained)) for retained in (5000, 5000)),
+            *(('small', MemoryStats(0, retained)) for retained in (5000, 1, 1, 1)),
+        ]
+
+        self.assertEqual(get_leaking_testcases(memory_stats, threshold=1000), [('leaking', 1200)])
+
+    def test_memory_growers(self):
+        """Feature: Memory tracking
+
+        Scenario: Reporting the tests retaining the most memory
+            Given the memory tracking is enabled
+            When tests are run
+            Then the test retaining the most memory should be listed first within the memory growers
+        """
+        options = {'no_color': True, 'memory_tracking_enabled': True, 'memory_leak_threshold': 2**20}
+        with patch.object(HtmlTestResult, 'options', options, create=True), open(os.devnull, 'w') as null_stream:
+            result = HtmlTestResult()
+            result.stdout = OutputWrapper(null_stream)
+            self.addCleanup(self.DummyTests.retained.clear)
+            result.startTestRun()
+            unittest.TestSuite([self.DummyTests('test_temporary'), self.DummyTests('test_retaining')])(result)
+            result.stopTestRun()
+
+        memory_growers = result.get_memory_growers()
+        self.assertEqual(
+            [(grower['testcase'], grower['name']) for grower in memory_growers],
+            [(strclass(self.DummyTests), 'test_retaining'), (strclass(self.DummyTests), 'test_temporary')],
+        )
@@ -0,0 +1,141 @@
+import contextlib
+import io
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+from xml.etree import ElementTree
+
+from django.core.management import CommandError, call_command
+
+from coverage import Coverage, CoverageData
+
+from anfema_django_testutils.runner import HtmlTestResult
+
+
+class MergeTestReportsCommandTestCase(TestCase):
+    def setUp(self) -> None:
+        options_patcher = patch.object(HtmlTestResult, 'options', {}, create=True)
+        options_patcher.start()
+        self.addCleanup(options_patcher.stop)
+        self.report_dir = TemporaryDirectory()
+        self.addCleanup(self.report_dir.cleanup)
+
+    def write_result_file(self, name, *records):
+        path = Path(self.report_dir.name, name)
+        path.write_text(''.join(json.dumps(record) + '\n' for record in records))
+        return path
+
+    def merge(self, *result_files, **options):
+        with contextlib.redirect_stdout(io.StringIO()) as stdout:
+            call_command(
+                'mergetestreports',
+                *result_files,
+                report_dir=str(Path(self.report_dir.name, 'merged')),
+                html_results_enabled=False,
+                no_color=True,
+                stdout=io.StringIO(),
+                **options,
+            )
+        return stdout.getvalue()
+
+    def test_merge_result_files(self):
+        """Feature: Merge test reports
+
+        Scenario: Merging the test results of multiple test runs
+            Given the test result files of two shards
+            When they are merged into a JUnit XML report
+            Then the report should contain the tests of both shards
+            And the testcases of both shards should be kept separate
+            And the summary should count the results of both shards
+        """
+        shard1 = self.write_result_file(
+            'shard1.jsonl',
+            {'testcase': 'app.tests.A', 'name': 'test_one', 'result': 'passed', 'duration': 0.5, 'outcome': ''},
+            {'testcase': 'app.tests.A', 'name': 'test_two', 'result': 'failure', 'duration': 0.25, 'outcome': 'tb'},
+        )
+        shard2 = self.write_result_file(
+            'shard2.jsonl',
+            {'testcase': 'app.tests.B', 'name': 'setUpClass', 'result': 'error', 'duration': 0.0, 'outcome': 'tb'},
+        )
+
+        stdout = self.merge(shard1, shard2, junit_xml_results_enabled=True)
+
+        testsuites = ElementTree.parse(Path(self.report_dir.name, 'merged', 'test-results.xml')).getroot()
+        self.assertEqual(testsuites.get('tests'), '3')
+        self.assertEqual(testsuites.get('time'), '0.750')
+        self.assertEqual([testsuite.get('name') for testsuite in testsuites], ['app.tests.A', 'app.tests.B'])
+        self.assertEqual(testsuites[1][0].get('name'), 'setUpClass')
+        self.assertIn('FAILED (skipped=0, passed=1,', stdout)
+        self.assertIn('failures=1, unexpected successes=0, errors=1)', stdout)
+
+    def test_merged_result_file_must_not_overwrite_input(self):
+        """Feature: Merge test reports
+
+        Scenario: Merging into one of the input files
+            Given a test result file within the report directory
+            When it shall be merged into a JSON Lines file of the same report directory
+            Then the merge should be refused
+        """
+        Path(self.report_dir.name, 'merged').mkdir()
+        result_file = self.write_result_file('merged/test-results.jsonl')
+
+        with self.assertRaises(CommandError):
+            self.merge(result_file, jsonl_results_enabled=True)
+
+    def test_merge_duplicate_result_files(self):
+        """Feature: Merge test reports
+
+        Scenario: Merging the same test result file twice
+            Given a test result file
+            When it shall be merged with itself
+            Then the merge should be refused
+        """
+        result_file = self.write_result_file('shard.jsonl')
+
+        with self.assertRaises(CommandError):
+            self.merge(result_file, Path(self.report_dir.name, '.', 'shard.jsonl'))
+
+    def test_merge_overlapping_result_files(self):
+        """Feature: Merge test reports
+
+        Scenario: Merging test result files containing the same tests
+            Given the test result files of two shards which both contain a test
+            When they are merged
+            Then the test should only be merged once
+        """
+        record = {'testcase': 'app.tests.A', 'name': 'test_one', 'result': 'passed', 'duration': 0.5, 'outcome': ''}
+        shard1 = self.write_result_file('shard1.jsonl', record)
+        shard2 = self.write_result_file(
+            'shard2.jsonl', record, {**record, 'name': 'test_two', 'result': 'failure', 'outcome': 'tb'}
+        )
+
+        stdout = self.merge(shard1, shard2, junit_xml_results_enabled=True)
+
+        testsuites = ElementTree.parse(Path(self.report_dir.name, 'merged', 'test-results.xml')).getroot()
+        self.assertEqual(testsuites.get('tests'), '2')
+        self.assertIn('passed=1,', stdout)
+        self.assertIn('failures=1,', stdout)
+
+    def test_merge_coverage_data(self):
+        """Feature: Merge test reports
+
+        Scenario: Merging the coverage data of multiple test runs
+            Given the coverage data files of two shards
+            When they are merged
+            Then the combined coverage data file should be written into the report directory
+        """
+        coverage_files = []
+        for shard in ('shard1', 'shard2'):
+            coverage_data = CoverageData(str(Path(self.report_dir.name, f'.coverage.{shard}')))
+            coverage_data.add_lines({__file__: [1, 2] if shard == 'shard1' else [3]})
+            coverage_data.write()
+            coverage_files.append(coverage_data.data_filename())
+
+        with patch.object(Coverage, 'html_report'):
+            self.merge(self.write_result_file('shard.jsonl'), coverage_data_files=coverage_files)
+
+        combined = CoverageData(str(Path(self.report_dir.name, 'merged', '.coverage')))
+        combined.read()
+        self.assertEqual(sorted(combined.lines(__file__)), [1, 2, 3])
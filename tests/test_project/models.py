@@ -0,0 +1,15 @@
+from django.db import models
+
+
+class Tag(models.Model):
+    name = models.CharField(max_length=50)
+
+
+class Item(models.Model):
+    name = models.CharField(max_length=50)
+    parent = models.ForeignKey('self', null=True, on_delete=models.CASCADE)
+    tags = models.ManyToManyField(Tag)
+
+
+class SpecialItem(Item):
+    special = models.BooleanField(default=True)
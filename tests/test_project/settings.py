@@ -8,7 +8,9 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 INSTALLED_APPS = [
     "test_project",
     'mathfilters',
+    'django.contrib.contenttypes',
     'anfema_django_testutils',
+    'anfema_django_testutils.contrib.fixtures',
 ]
 
 ROOT_URLCONF = 'test_project.urls'
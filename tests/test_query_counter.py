@@ -0,0 +1,100 @@
+import os
+from unittest import TestCase
+from unittest.mock import patch
+from unittest.util import strclass
+
+from django.core.management.base import OutputWrapper
+from django.db import connection
+
+from anfema_django_testutils.queries import QueryCounter, normalize_sql
+from anfema_django_testutils.runner import HtmlTestResult
+
+
+class QueryCounterTestCase(TestCase):
+    databases = {'default'}
+
+    class DummyTests(TestCase):
+        databases = {'default'}
+
+        def test_repeated_queries(self):
+            with connection.cursor() as cursor:
+                for pk in range(3):
+                    cursor.execute('SELECT %s', [pk])
+                cursor.execute('SELECT 1, 2')
+
+    def test_normalize_sql(self):
+        """Feature: Database query stats
+
+        Scenario: Normalizing queries
+            Given queries which only differ by their parameters and literals
+            Then their normalized queries should be equal
+        """
+        self.assertEqual(
+            normalize_sql('SELECT "a"."id" FROM "a" WHERE "a"."b_id" = 42 AND "a"."name" = \'it\'\'s\''),
+            'SELECT "a"."id" FROM "a" WHERE "a"."b_id" = ? AND "a"."name" = ?',
+        )
+        self.assertEqual(
+            normalize_sql('SELECT * FROM "a" WHERE "a"."id" IN (%s, %s,\n %s)'),
+            normalize_sql('SELECT * FROM "a" WHERE "a"."id" IN (1, 2)'),
+        )
+        self.assertEqual(normalize_sql('SELECT * FROM "table1"'), 'SELECT * FROM "table1"')
+
+    def test_count_queries(self):
+        """Feature: Database query stats
+
+        Scenario: Counting the queries of a test
+            Given a query counter installed for a test
+            When the test executes queries
+            Then the queries should be counted
+            And the queries repeated more often than the threshold should be reported
+            And no queries should be counted once the query counter has been uninstalled
+        """
+        query_counter = QueryCounter(self)
+        query_counter.install()
+        try:
+            with connection.cursor() as cursor:
+                for pk in range(4):
+                    cursor.execute('SELECT %s', [pk])
+                cursor.execute('SELECT 1, 2')
+        finally:
+            query_counter.uninstall()
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+
+        stats = query_counter.get_stats(repeat_threshold=3)
+        self.assertEqual(stats.count, 5)
+        self.assertEqual(stats.repeated, (('SELECT ?', 4),))
+        self.assertNotIn(query_counter, connection.execute_wrappers)
+
+    def test_test_result_query_stats(self):
+        """Feature: Database query stats
+
+        Scenario: Recording the query stats of a test result
+            Given the query stats are enabled
+            When a test executing queries is run
+            Then its test result should contain the number of queries and their duration
+            And its repeated queries should be reported
+        """
+        options = {'no_color': True, 'query_stats_enabled': True, 'query_repeat_threshold': 2}
+        with patch.object(HtmlTestResult, 'options', options, create=True), open(os.devnull, 'w') as null_stream:
+            result = HtmlTestResult()
+            result.stdout = OutputWrapper(null_stream)
+            self.DummyTests('test_repeated_queries').run(result)
+            result_data = result.make_result_data()
+
+        [test_result] = next(iter(result_data['testcases'].values()))['tests']
+        self.assertEqual(test_result.result, 'passed')
+        self.assertEqual(test_result.queries, 4)
+        self.assertGreater(test_result.query_duration.total_seconds(), 0)
+        self.assertEqual(test_result.repeated_queries, (('SELECT ?', 3),))
+        self.assertEqual(
+            result.get_repeated_queries(result_data),
+            [
+                {
+                    'testcase': strclass(self.DummyTests),
+                    'name': 'test_repeated_queries',
+                    'query': 'SELECT ?',
+                    'count': 3,
+                }
+            ],
+        )
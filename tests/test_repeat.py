@@ -0,0 +1,108 @@
+import os
+import threading
+from unittest import TestCase, TestResult
+
+from anfema_django_testutils.testcases import repeat
+
+
+class RepeatTestCase(TestCase):
+    class DummyTests(TestCase):
+        lock = threading.Lock()
+        calls = []
+
+        @repeat(repetitions=20)
+        def test_serial(self):
+            self.calls.append(threading.get_ident())
+
+        @repeat(repetitions=20, workers=4)
+        def test_threads(self):
+            with self.lock:
+                self.calls.append(threading.get_ident())
+                idx = len(self.calls)
+            self.assertNotIn(idx, (5, 10))
+
+        @repeat(repetitions=20, workers=2, fail_fast=True)
+        def test_threads_fail_fast(self):
+            with self.lock:
+                self.calls.append(threading.get_ident())
+            self.fail()
+
+        @repeat(repetitions=4, workers=2, mode='process')
+        def test_processes(self):
+            self.assertEqual(os.getpid(), self.parent_pid)
+
+    def setUp(self) -> None:
+        self.DummyTests.calls = []
+        self.DummyTests.parent_pid = os.getpid()
+        self.result = TestResult()
+
+    def run_dummy_test(self, name):
+        self.DummyTests(name).run(self.result)
+        return [str(subtest) for subtest, _ in self.result.failures]
+
+    def test_serial_repetitions(self):
+        """Feature: Repeat
+
+        Scenario: Repeating a test method serially
+            Given a test method decorated with repeat without workers
+            When the test is run
+            Then each repetition should be run within the test's thread
+        """
+        self.assertEqual(self.run_dummy_test('test_serial'), [])
+        self.assertEqual(self.DummyTests.calls, [threading.get_ident()] * 20)
+
+    def test_thread_repetitions(self):
+        """Feature: Repeat
+
+        Scenario: Repeating a test method within threads
+            Given a test method decorated with repeat with 4 thread workers
+            When the test is run
+            Then each repetition should be run
+            And the repetitions should be run within other threads
+            And the failed repetitions should be reported as subtests
+        """
+        failures = self.run_dummy_test('test_threads')
+
+        self.assertEqual(len(self.DummyTests.calls), 20)
+        self.assertNotIn(threading.get_ident(), self.DummyTests.calls)
+        self.assertEqual(len(failures), 2)
+        self.assertTrue(all('Repetition' in failure for failure in failures))
+
+    def test_thread_repetitions_fail_fast(self):
+        """Feature: Repeat
+
+        Scenario: Stopping concurrent repetitions after the first failure
+            Given a failing test method decorated with repeat with 2 thread workers and fail_fast
+            When the test is run
+            Then the pending repetitions should be cancelled
+            And only the first failure should be reported
+        """
+        failures = self.run_dummy_test('test_threads_fail_fast')
+
+        self.assertLess(len(self.DummyTests.calls), 20)
+        self.assertEqual(len(failures), 1)
+        self.assertIn('Repetition 1 of 20', failures[0])
+
+    def test_process_repetitions(self):
+        """Feature: Repeat
+
+        Scenario: Repeating a test method within processes
+            Given a test method decorated with repeat with 2 process workers
+            When the test is run
+            Then each repetition should be run within another process
+            And the failures of the repetitions should be reported as subtests
+        """
+        failures = self.run_dummy_test('test_processes')
+
+        self.assertEqual(len(failures), 4)
+
+    def test_invalid_arguments(self):
+        """Feature: Repeat
+
+        Scenario: Passing invalid arguments
+            Given invalid numbers of workers or an invalid mode
+            Then a ValueError should be raised
+        """
+        for kwargs in ({'workers': 0}, {'workers': 2, 'mode': 'fiber'}):
+            with self.subTest(**kwargs), self.assertRaises(ValueError):
+                repeat(10, **kwargs)
@@ -0,0 +1,184 @@
+import datetime
+import json
+import os
+import unittest
+import weakref
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+from unittest.util import strclass
+
+from django.core.management.base import OutputWrapper
+
+from anfema_django_testutils.flakiness import FlakinessHistory
+from anfema_django_testutils.reports import read_json_lines
+from anfema_django_testutils.runner import HtmlTestResult
+
+
+class RerunFailuresTestCase(TestCase):
+    class DummyTests(TestCase):
+        runs = {}
+        on_rerun = None
+
+        def run_count(self):
+            self.runs[self._testMethodName] = self.runs.get(self._testMethodName, 0) + 1
+            if self.runs[self._testMethodName] > 1 and self.on_rerun is not None:
+                type(self).on_rerun()
+            return self.runs[self._testMethodName]
+
+        def test_passed(self):
+            self.run_count()
+
+        def test_flaky(self):
+            self.assertGreater(self.run_count(), 2)
+
+        def test_failure(self):
+            self.run_count()
+            self.fail()
+
+    def setUp(self) -> None:
+        self.report_dir = TemporaryDirectory()
+        self.addCleanup(self.report_dir.cleanup)
+        options = {'no_color': True, 'rerun_failures': 2, 'report_dir': self.report_dir.name}
+        options_patcher = patch.object(HtmlTestResult, 'options', options, create=True)
+        options_patcher.start()
+        self.addCleanup(options_patcher.stop)
+        self.null_stream = open(os.devnull, 'w')
+        self.addCleanup(self.null_stream.close)
+        self.DummyTests.runs = {}
+
+    def run_tests(self):
+        tests = [self.DummyTests(name) for name in ('test_passed', 'test_flaky', 'test_failure')]
+        result = HtmlTestResult(tests={strclass(self.DummyTests): [weakref.ref(test) for test in tests]})
+        result.stdout = OutputWrapper(self.null_stream)
+        result.startTestRun()
+        unittest.TestSuite(tests)(result)
+        result.rerun_failures()
+        result.stopTestRun()
+        return result
+
+    def test_rerun_failures(self):
+        """Feature: Rerun failures
+
+        Scenario: Rerunning failed tests
+            Given a passing, a flaky and a failing test
+            When the tests are run with up to 2 reruns of failed tests
+            Then only the failed tests should be rerun
+            And the test passing on its second rerun should be flaky
+            And the test failing on all reruns should keep its failure
+            And the flaky test should not fail the test run
+        """
+        result = self.run_tests()
+
+        self.assertEqual(self.DummyTests.runs, {'test_passed': 1, 'test_flaky': 3, 'test_failure': 3})
+        tests = result.make_result_data()['testcases'][strclass(self.DummyTests)]['tests']
+        self.assertEqual(
+            {test.name: test.result for test in tests},
+            {'test_passed': 'passed', 'test_flaky': 'flaky', 'test_failure': 'failure'},
+        )
+        self.assertIn('AssertionError', tests[1].outcome)
+        self.assertEqual(result._test_result_summary['flaky'], 1)
+        self.assertEqual(result._test_result_summary['failure'], 1)
+        self.assertEqual([test._testMethodName for test, _ in result.failures], ['test_failure'])
+
+    def test_flaky_tests_history(self):
+        """Feature: Rerun failures
+
+        Scenario: Counting flaky tests across test runs
+            Given a flaky test
+            When the tests are run twice with reruns of failed tests
+            Then the flaky test should be counted twice within the flaky tests history
+        """
+        self.run_tests()
+        self.DummyTests.runs = {}
+        self.run_tests()
+
+        history = FlakinessHistory(Path(self.report_dir.name, 'flaky-tests.json'))
+        self.assertEqual(history.get_count(f'{strclass(self.DummyTests)}.test_flaky'), 2)
+        self.assertEqual(history.get_count(f'{strclass(self.DummyTests)}.test_failure'), 0)
+
+    def test_failed_result_records_are_written_before_reruns(self):
+        """Feature: Rerun failures
+
+        Scenario: Streaming the results of rerun tests
+            Given the JSON Lines results are enabled
+            When the tests are run with reruns of failed tests
+            Then each test should be written with its original result before the reruns
+            And the flaky test should additionally be written with the result flaky once it passed on a rerun
+        """
+        HtmlTestResult.options['jsonl_results_enabled'] = True
+        result_file = Path(self.report_dir.name, 'test-results.jsonl')
+        records_before_reruns = []
+
+        def on_rerun():
+            if not records_before_reruns:
+                records_before_reruns.extend(json.loads(line) for line in result_file.read_text().splitlines())
+
+        with patch.object(self.DummyTests, 'on_rerun', on_rerun):
+            self.run_tests()
+
+        records = [json.loads(line) for line in result_file.read_text().splitlines()]
+        self.assertEqual(
+            [(record['name'], record['result']) for record in records_before_reruns],
+            [('test_passed', 'passed'), ('test_flaky', 'failure'), ('test_failure', 'failure')],
+        )
+        self.assertEqual(records[:3], records_before_reruns)
+        self.assertEqual(
+            records[3:],
+            [
+                {
+                    'testcase': strclass(self.DummyTests),
+                    'name': 'test_flaky',
+                    'result': 'flaky',
+                    'rerun_attempt': 2,
+                }
+            ],
+        )
+
+    def test_merge_rerun_records(self):
+        """Feature: Rerun failures
+
+        Scenario: Merging the streamed results of rerun tests
+            Given the streamed results of a test run with a flaky test
+            When they are added to another test result
+            Then the flaky test should get the result flaky
+            And it should not be listed as failure
+        """
+        HtmlTestResult.options['jsonl_results_enabled'] = True
+        self.run_tests()
+        records = list(read_json_lines(Path(self.report_dir.name, 'test-results.jsonl')))
+
+        HtmlTestResult.options['jsonl_results_enabled'] = False
+        result = HtmlTestResult()
+        result.stdout = OutputWrapper(self.null_stream)
+        for record in records:
+            result.add_result_record(record)
+
+        tests = result.make_result_data()['testcases'][strclass(self.DummyTests)]['tests']
+        self.assertEqual(
+            {test.name: test.result for test in tests},
+            {'test_passed': 'passed', 'test_flaky': 'flaky', 'test_failure': 'failure'},
+        )
+        self.assertEqual(result._test_result_summary['flaky'], 1)
+        self.assertEqual(result._test_result_summary['failure'], 1)
+        self.assertEqual(len(result.failures), 1)
+
+
+class FlakinessHistoryTestCase(TestCase):
+    def test_add_run(self):
+        """Feature: Rerun failures
+
+        Scenario: Storing the flaky tests of a test run
+            Given an empty flakiness history
+            When the flaky tests of a test run are added
+            Then their counts should be incremented and stored
+        """
+        with TemporaryDirectory() as report_dir:
+            path = Path(report_dir, 'flaky-tests.json')
+            timestamp = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+            FlakinessHistory(path).add_run(timestamp, ['a', 'b'])
+            FlakinessHistory(path).add_run(timestamp, ['a'])
+
+            self.assertEqual(json.loads(path.read_text())['a'], {'count': 2, 'last_flaky': timestamp.isoformat()})
+            self.assertEqual(FlakinessHistory(path).get_count('b'), 1)
@@ -0,0 +1,82 @@
+import datetime
+import gc
+import os
+import unittest
+import weakref
+from unittest import TestCase
+from unittest.mock import patch
+from unittest.util import strclass
+
+from django.core.management.base import OutputWrapper
+
+from anfema_django_testutils.results import TestResultData
+from anfema_django_testutils.runner import HtmlTestResult
+
+
+class TestResultDataTestCase(TestCase):
+    def test_outcome_compression(self):
+        """Feature: Test result data
+
+        Scenario: Compressing the outcome of a test result
+            Given a long traceback and a short skip reason
+            When test results are created with compression
+            Then the long traceback should be stored compressed
+            And the short skip reason should be stored uncompressed
+            And both outcomes should be returned unchanged
+        """
+        traceback = 'Traceback (most recent call last):\n' + '  File "test.py", line 1, in test\n' * 100
+        duration = datetime.timedelta(seconds=1)
+
+        failure = TestResultData('test_failure', 'failure', duration, traceback, compress=True)
+        skipped = TestResultData('test_skipped', 'skipped', duration, 'Not supported', compress=True)
+
+        self.assertLess(len(failure._outcome), len(traceback))
+        self.assertEqual(failure.outcome, traceback)
+        self.assertEqual(skipped._outcome, 'Not supported')
+        self.assertEqual(skipped.outcome, 'Not supported')
+        self.assertEqual(failure.as_dict()['outcome'], traceback)
+
+    def test_slots(self):
+        """Feature: Test result data
+
+        Scenario: Keeping test results compact
+            Given a test result
+            Then it should have no instance dictionary
+        """
+        test_result_data = TestResultData('test', 'passed', datetime.timedelta(seconds=1))
+
+        self.assertFalse(hasattr(test_result_data, '__dict__'))
+
+
+class TestReleaseTestCase(TestCase):
+    class DummyTests(TestCase):
+        def test_passed(self):
+            pass
+
+        def test_failure(self):
+            self.fail()
+
+    def test_passed_tests_are_released(self):
+        """Feature: Test result data
+
+        Scenario: Releasing the tests once they have been run
+            Given a passing and a failing test
+            When the tests are run
+            Then the passed test should be released
+            And the failed test should be kept for the list of failures
+        """
+        tests = [self.DummyTests('test_passed'), self.DummyTests('test_failure')]
+        test_refs = [weakref.ref(test) for test in tests]
+        null_stream = open(os.devnull, 'w')
+        self.addCleanup(null_stream.close)
+        with patch.object(HtmlTestResult, 'options', {'no_color': True}, create=True):
+            result = HtmlTestResult(tests={strclass(self.DummyTests): test_refs})
+            result.stdout = OutputWrapper(null_stream)
+            suite = unittest.TestSuite(tests)
+            del tests
+            suite(result)
+        gc.collect()
+
+        self.assertIsNone(test_refs[0]())
+        self.assertIs(test_refs[1](), result.failures[0][0])
+        self.assertEqual(result._test_result_summary['passed'], 1)
@@ -0,0 +1,49 @@
+import argparse
+from unittest import TestCase
+
+from anfema_django_testutils.sharding import get_testcase_weights, parse_shard, partition_testcases
+
+
+class ShardingTestCase(TestCase):
+    def test_parse_shard(self):
+        """Feature: Sharding
+
+        Scenario: Parsing the shard argument
+            Given a shard argument in the format K/N
+            Then the shard number and the number of shards should be returned
+            And invalid shard arguments should be rejected
+        """
+        self.assertEqual(parse_shard('2/4'), (2, 4))
+        for value in ('0/4', '5/4', '2', 'a/b'):
+            with self.subTest(value=value), self.assertRaises(argparse.ArgumentTypeError):
+                parse_shard(value)
+
+    def test_testcase_weights(self):
+        """Feature: Sharding
+
+        Scenario: Weighting testcases by their durations
+            Given the tests of multiple testcases and the known durations of some of them
+            Then each testcase should be weighted by the sum of its test durations
+            And tests with unknown durations should be weighted by the average known duration
+            And without any known durations the testcases should be weighted by their number of tests
+        """
+        testcases = {'A': ['A.test_one', 'A.test_two'], 'B': ['B.test_one']}
+
+        self.assertEqual(get_testcase_weights(testcases, {'A.test_one': 3.0, 'B.test_one': 1.0}), {'A': 5.0, 'B': 1.0})
+        self.assertEqual(get_testcase_weights(testcases, {}), {'A': 2.0, 'B': 1.0})
+
+    def test_partition_testcases(self):
+        """Feature: Sharding
+
+        Scenario: Partitioning testcases into shards
+            Given weighted testcases
+            When they are partitioned into 2 shards
+            Then each testcase should be assigned to exactly one shard
+            And the shards should be balanced by their weights
+        """
+        weights = {'A': 5.0, 'B': 4.0, 'C': 3.0, 'D': 2.0, 'E': 2.0}
+
+        shards = partition_testcases(weights, 2)
+
+        self.assertEqual(shards, [{'A', 'D', 'E'}, {'B', 'C'}])
+        self.assertEqual(sorted(sum(weights[testcase] for testcase in shard) for shard in shards), [7.0, 9.0])
@@ -0,0 +1,62 @@
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from coverage import CoverageData
+
+from anfema_django_testutils.impact import TestImpactMap
+
+
+class TestImpactMapTestCase(TestCase):
+    def setUp(self) -> None:
+        self.report_dir = TemporaryDirectory()
+        self.addCleanup(self.report_dir.cleanup)
+        self.path = Path(self.report_dir.name, 'test-impact-map.json')
+
+    def create_coverage_data(self, lines_by_context):
+        coverage_data = CoverageData(basename=os.path.join(self.report_dir.name, '.coverage'), no_disk=True)
+        for context, files in lines_by_context.items():
+            coverage_data.set_context(context)
+            coverage_data.add_lines({os.path.abspath(file_name): [1] for file_name in files})
+        return coverage_data
+
+    def test_update_and_select_tests(self):
+        """Feature: Test Impact Map
+
+        Scenario: Selecting the tests affected by changed files
+            Given a test impact map created from per-test coverage contexts
+            When only a subset of the tests has been measured again
+            Then the entries of the measured tests should be replaced
+            And the entries of the other tests should be kept
+            And the tests covering the changed files should be selected
+        """
+        TestImpactMap(self.path).update(
+            self.create_coverage_data(
+                {'app.tests.A.test_one': ['app/models.py', 'app/views.py'], 'app.tests.B.test_one': ['app/views.py']}
+            )
+        )
+        TestImpactMap(self.path).update(self.create_coverage_data({'app.tests.A.test_one': ['app/forms.py']}))
+
+        impact_map = TestImpactMap(self.path)
+
+        self.assertEqual(
+            impact_map.tests_by_file,
+            {'app/forms.py': ['app.tests.A.test_one'], 'app/views.py': ['app.tests.B.test_one']},
+        )
+        self.assertEqual(impact_map.known_tests, {'app.tests.A.test_one', 'app.tests.B.test_one'})
+        self.assertEqual(impact_map.get_impacted_tests(['app/views.py', 'README.md']), {'app.tests.B.test_one'})
+
+    def test_files_outside_of_working_directory_are_ignored(self):
+        """Feature: Test Impact Map
+
+        Scenario: Measuring files outside of the project
+            Given per-test coverage contexts of a file outside of the current working directory
+            When the test impact map gets updated
+            Then the file should not be part of the map
+        """
+        outside_file = os.path.join(os.path.dirname(os.getcwd()), 'outside.py')
+
+        TestImpactMap(self.path).update(self.create_coverage_data({'app.tests.A.test_one': [outside_file]}))
+
+        self.assertEqual(TestImpactMap(self.path).tests_by_file, {})
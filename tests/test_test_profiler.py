@@ -0,0 +1,72 @@
+import pstats
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from anfema_django_testutils.profiling import TestProfiler
+
+
+def fibonacci(n):
+    return n if n < 2 else fibonacci(n - 1) + fibonacci(n - 2)
+
+
+class TestProfilerTestCase(TestCase):
+    def setUp(self) -> None:
+        self.report_dir = TemporaryDirectory()
+        self.addCleanup(self.report_dir.cleanup)
+        self.profile_dir = Path(self.report_dir.name, 'profile')
+
+    def profile(self, profiler, testcase):
+        profiler.start()
+        fibonacci(15)
+        return profiler.stop(testcase)
+
+    def test_profiles_are_aggregated(self):
+        """Feature: Test Profiler
+
+        Scenario: Profiling tests of multiple testcases
+            Given a test profiler
+            When tests of two testcases have been profiled
+            Then the hot functions of each test should be returned
+            And a profile should be stored for each testcase
+            And the total profile should combine the profiles of all tests
+            And the collapsed stacks should contain the profiled functions
+        """
+        profiler = TestProfiler(self.profile_dir)
+        hotspots = self.profile(profiler, 'app.tests.A')
+        self.profile(profiler, 'app.tests.A')
+        self.profile(profiler, 'app.tests.B')
+
+        profile_file = profiler.save()
+
+        self.assertLessEqual(len(hotspots), TestProfiler.hotspot_count)
+        self.assertTrue(hotspots[0][0].startswith('fibonacci ('))
+        self.assertEqual(
+            sorted(path.name for path in self.profile_dir.iterdir()),
+            ['app.tests.A.pstats', 'app.tests.B.pstats', 'profile.collapsed', 'profile.pstats'],
+        )
+        fibonacci_calls = [
+            call_count
+            for (_, _, function_name), (_, call_count, *_) in pstats.Stats(str(profile_file)).stats.items()
+            if function_name == 'fibonacci'
+        ]
+        self.assertEqual(fibonacci_calls, [3 * 1973])
+        collapsed_stacks = profile_file.with_suffix('.collapsed').read_text().splitlines()
+        self.assertTrue(any('fibonacci (' in stack for stack in collapsed_stacks))
+        self.assertTrue(all(stack.rsplit(' ', 1)[1].isdigit() for stack in collapsed_stacks))
+
+    def test_clear(self):
+        """Feature: Test Profiler
+
+        Scenario: Starting a new test run
+            Given the profiles of a previous test run
+            When the test profiler gets cleared
+            Then the profiles should be removed
+        """
+        profiler = TestProfiler(self.profile_dir)
+        self.profile(profiler, 'app.tests.A')
+        profiler.save()
+
+        profiler.clear()
+
+        self.assertEqual(list(self.profile_dir.iterdir()), [])